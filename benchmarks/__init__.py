@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+"""
+Throughput benchmarks for parsedatetime.
+
+Run the whole suite from the source directory with::
+
+    python -m benchmarks
+
+and see C{python -m benchmarks --help} for saving the results as JSON and
+comparing them with the results of another commit.  The C{bench_*.py}
+scripts are standalone comparisons of the alternatives behind a single
+change.
+"""
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+Run the benchmark suite::
+
+    python -m benchmarks --json before.json
+    (switch to another commit)
+    python -m benchmarks --compare before.json
+
+The exit status is 1 when C{--compare} finds a benchmark whose median
+time per call got slower by more than C{--threshold}.
+"""
+from __future__ import print_function, unicode_literals
+
+import sys
+import argparse
+import warnings
+
+from . import harness
+from .suite import suite
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks',
+                                     description='parsedatetime benchmarks')
+    parser.add_argument('-k', '--filter', action='append', default=[],
+                        help='only run benchmarks whose name contains '
+                             'this text, can be repeated')
+    parser.add_argument('-r', '--rounds', type=int, default=5,
+                        help='timed passes over each corpus (default 5)')
+    parser.add_argument('--json', metavar='PATH',
+                        help='write the results to PATH')
+    parser.add_argument('--label',
+                        help='name stored with the results, e.g. a commit')
+    parser.add_argument('--compare', metavar='PATH',
+                        help='compare with the results saved in PATH')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='relative slow down of the median reported '
+                             'as a regression (default 0.1)')
+    args = parser.parse_args(argv)
+
+    # the flag style deprecation warning is not what is being measured
+    warnings.simplefilter('ignore')
+
+    results = {}
+    for benchmark in suite():
+        if args.filter and not any(f in benchmark.name for f in args.filter):
+            continue
+        results[benchmark.name] = harness.run(benchmark, rounds=args.rounds)
+        harness.report(benchmark.name, results[benchmark.name])
+
+    if args.json:
+        harness.save(args.json, harness.metadata(args.label), results)
+
+    if args.compare:
+        regressed = harness.compare(harness.load(args.compare), results,
+                                    args.threshold)
+        if regressed:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+Time reading locale backed attributes of Constants, as done throughout
+Calendar.parse(), and building Constants instances.
+
+The __getattr__ column calls Constants.__getattr__ directly, which is
+what every one of these reads went through before the locale data was
+copied onto the instance.
+
+Run from the source directory::
+
+    python benchmarks/bench_constants.py
+"""
+from __future__ import print_function, unicode_literals
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import parsedatetime as pdt  # noqa
+
+
+NAMES = ('units', 'Modifiers', 'numbers', 'dayOffsets', 're_sources',
+         'uses24', 'dp_order')
+NUMBER = 200000
+
+
+def main():
+    ptc = pdt.Constants(usePyICU=False)
+    getattrHook = pdt.Constants.__getattr__
+
+    print('%-12s %12s %12s' % ('attribute', 'attribute', '__getattr__'))
+    for name in NAMES:
+        plain = timeit.timeit(lambda: getattr(ptc, name), number=NUMBER)
+        hooked = timeit.timeit(lambda: getattrHook(ptc, name), number=NUMBER)
+        print('%-12s %9.1f ns %9.1f ns' % (name, plain / NUMBER * 1e9,
+                                           hooked / NUMBER * 1e9))
+
+    print()
+    for label, func in (
+            ('Constants()',
+             lambda: pdt.Constants(usePyICU=False)),
+            ('Constants(precompile=True)',
+             lambda: pdt.Constants(usePyICU=False, precompile=True)),
+            ('Constants.shared()',
+             lambda: pdt.Constants.shared(usePyICU=False))):
+        best = min(timeit.repeat(func, number=20, repeat=5)) / 20
+        print('%-28s %10.1f us' % (label, best * 1e6))
+
+
+if __name__ == '__main__':
+    main()
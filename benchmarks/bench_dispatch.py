@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+Compare the DISPATCH_SEQUENTIAL and DISPATCH_COMBINED ways for
+Calendar.parse() to find the next chunk of text to evaluate.
+
+Run from the source directory::
+
+    python benchmarks/bench_dispatch.py
+"""
+from __future__ import print_function, unicode_literals
+
+import os
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import parsedatetime as pdt  # noqa
+
+
+PHRASES = ['tomorrow', 'next week', '5pm', 'today', 'in 3 days',
+           'next friday at 5pm', '2 hours ago', 'August 25th, 2016',
+           '08/25/2016', 'noon', 'eod', 'last month', 'this is not a date',
+           'meet me at the cafe around 5pm on the 3rd of august']
+REPEAT = 5
+NUMBER = 200
+
+
+def main():
+    sourceTime = time.localtime()
+
+    for name, dispatch in (('sequential', pdt.DISPATCH_SEQUENTIAL),
+                           ('combined', pdt.DISPATCH_COMBINED)):
+        cal = pdt.Calendar(version=pdt.VERSION_CONTEXT_STYLE,
+                           dispatch=dispatch)
+        print(name)
+        for phrase in PHRASES:
+            best = min(timeit.repeat(lambda: cal.parse(phrase, sourceTime),
+                                     number=NUMBER, repeat=REPEAT))
+            print('  %-55s %8.2f us' % (phrase, best / NUMBER * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""
+Time Calendar.nlp() on long documents with a few dates spread through
+mostly plain text, the way an email body or a log excerpt looks.
+
+Run from the source directory::
+
+    python benchmarks/bench_nlp.py
+"""
+from __future__ import print_function, unicode_literals
+
+import os
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import parsedatetime as pdt  # noqa
+
+
+FILLER = ('Thanks for the update, I went through the notes and left a few '
+          'comments on the open items. Let me know what you think. ')
+DATES = ['Can we meet next friday at 5pm?',
+         'The report is due on August 25th, 2016.',
+         'I will be out of the office from 08/25/2016 for 3 days.',
+         'Please send it by tomorrow noon.']
+SIZES = (1000, 10000, 50000)
+REPEAT = 3
+
+
+def document(size):
+    parts = []
+    length = 0
+    i = 0
+    while length < size:
+        part = FILLER * 4 + DATES[i % len(DATES)] + ' '
+        parts.append(part)
+        length += len(part)
+        i += 1
+    return ''.join(parts)[:size]
+
+
+def main():
+    cal = pdt.Calendar()
+    sourceTime = time.localtime()
+
+    for size in SIZES:
+        text = document(size)
+        found = len(cal.nlp(text, sourceTime) or ())
+        best = min(timeit.repeat(lambda: cal.nlp(text, sourceTime),
+                                 number=1, repeat=REPEAT))
+        print('%6d chars %4d matches %10.2f ms' % (size, found, best * 1e3))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+Compare calling Calendar.parse() once per string with Calendar.parseMany()
+over the same batch.
+
+Run from the source directory::
+
+    python benchmarks/bench_parsemany.py
+"""
+from __future__ import print_function, unicode_literals
+
+import os
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import parsedatetime as pdt  # noqa
+
+
+PHRASES = ['tomorrow', 'next week', '5pm', 'today', 'in 3 days',
+           'next friday at 5pm', '2 hours ago', 'August 25th, 2016',
+           '08/25/2016', 'noon', 'eod', 'last month', 'this is not a date']
+BATCH = PHRASES * 500
+REPEAT = 5
+
+
+def main():
+    cal = pdt.Calendar(version=pdt.VERSION_CONTEXT_STYLE)
+    sourceTime = time.localtime()
+
+    def one_by_one():
+        for s in BATCH:
+            cal.parse(s, sourceTime)
+
+    def batched():
+        for _ in cal.parseMany(BATCH, sourceTime):
+            pass
+
+    def batched_now():
+        for _ in cal.parseMany(BATCH):
+            pass
+
+    def one_by_one_now():
+        for s in BATCH:
+            cal.parse(s)
+
+    for name, func in (('parse(s, sourceTime)', one_by_one),
+                       ('parseMany(batch, sourceTime)', batched),
+                       ('parse(s)', one_by_one_now),
+                       ('parseMany(batch)', batched_now)):
+        best = min(timeit.repeat(func, number=1, repeat=REPEAT))
+        print('%-30s %8.2f us/item' % (name, best / len(BATCH) * 1e6))
+
+
+if __name__ == '__main__':
+    main()
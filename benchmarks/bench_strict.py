@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+Compare Calendar.parse() on machine formatted dates with and without the
+ISO 8601 / RFC 822 fast path in front of the natural language patterns.
+
+Run from the source directory::
+
+    python benchmarks/bench_strict.py
+"""
+from __future__ import print_function, unicode_literals
+
+import os
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import parsedatetime as pdt  # noqa
+
+
+PHRASES = ['2024-05-01', '2024-05-01 13:45', '2024-05-01 13:45:00',
+           '2024-05-01T13:45:00Z', '2024-05-01T13:45:00.123+02:00',
+           '20240501T134500Z', 'Wed, 01 May 2024 13:45:00 GMT',
+           '01 May 2024 13:45', 'tomorrow', 'next friday at 5pm']
+REPEAT = 5
+NUMBER = 500
+
+
+class CascadeCalendar(pdt.Calendar):
+
+    """
+    Calendar that always goes through the C{_partialParse*} methods.
+    """
+
+    def _evalStrict(self, datetimeString, sourceTime):
+        return None
+
+
+def main():
+    sourceTime = time.localtime()
+
+    for name, factory in (('cascade', CascadeCalendar),
+                          ('fast path', pdt.Calendar)):
+        cal = factory(version=pdt.VERSION_CONTEXT_STYLE)
+        print(name)
+        for phrase in PHRASES:
+            best = min(timeit.repeat(lambda: cal.parse(phrase, sourceTime),
+                                     number=NUMBER, repeat=REPEAT))
+            print('  %-35s %8.2f us' % (phrase, best / NUMBER * 1e6))
+
+
+if __name__ == '__main__':
+    main()
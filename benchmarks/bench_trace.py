@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+Show what Calendar(trace=...) costs.
+
+A Calendar without tracing should not touch the logging module at all
+while parsing, the first table counts the calls made into it.  The
+timings compare no tracing with tracing switched on but filtered out by
+the logger level, and with the trace actually being written.
+
+Run from the source directory::
+
+    python benchmarks/bench_trace.py
+"""
+from __future__ import print_function, unicode_literals
+
+import os
+import sys
+import time
+import timeit
+import logging
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import parsedatetime as pdt  # noqa
+
+
+PHRASES = ['tomorrow', 'next friday at 5pm', '3 days after next friday',
+           'August 25th, 2016', 'this is not a date']
+REPEAT = 5
+NUMBER = 200
+
+
+def loggingCalls(cal, phrase, sourceTime):
+    """
+    Count the calls into the logging module made by one parse().
+    """
+    calls = [0]
+
+    def profile(frame, event, arg):
+        if event == 'call' and \
+                frame.f_code.co_filename == logging.__file__:
+            calls[0] += 1
+
+    sys.setprofile(profile)
+    try:
+        cal.parse(phrase, sourceTime)
+    finally:
+        sys.setprofile(None)
+    return calls[0]
+
+
+def main():
+    sourceTime = time.localtime()
+    log = pdt.log
+    plain = pdt.Calendar(version=pdt.VERSION_CONTEXT_STYLE)
+    traced = pdt.Calendar(version=pdt.VERSION_CONTEXT_STYLE, trace=True)
+
+    print('calls into logging per parse()')
+    print('  %-30s %10s %10s' % ('', 'no trace', 'trace'))
+    for phrase in PHRASES:
+        print('  %-30s %10d %10d' % (phrase,
+                                     loggingCalls(plain, phrase, sourceTime),
+                                     loggingCalls(traced, phrase,
+                                                  sourceTime)))
+
+    handler = logging.StreamHandler(open(os.devnull, 'w'))
+    log.addHandler(handler)
+    try:
+        for name, cal, level in (('no trace', plain, logging.WARNING),
+                                 ('trace, filtered', traced,
+                                  logging.WARNING),
+                                 ('trace, written', traced, logging.DEBUG)):
+            log.setLevel(level)
+            print(name)
+            for phrase in PHRASES:
+                best = min(timeit.repeat(
+                    lambda: cal.parse(phrase, sourceTime),
+                    number=NUMBER, repeat=REPEAT))
+                print('  %-30s %8.2f us' % (phrase, best / NUMBER * 1e6))
+    finally:
+        log.removeHandler(handler)
+        log.setLevel(logging.NOTSET)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+Fixed inputs for the benchmark suite.
+
+Everything here is deterministic so that two runs, on two commits, time
+exactly the same work.
+"""
+from __future__ import unicode_literals
+
+import datetime
+
+
+# the source times every benchmark is evaluated against: a weekday
+# morning in the middle of a month, the last evening of a year and a
+# leap day
+SOURCE_TIMES = (datetime.datetime(2016, 8, 10, 9, 30, 0).timetuple(),
+                datetime.datetime(2015, 12, 31, 23, 15, 0).timetuple(),
+                datetime.datetime(2016, 2, 29, 12, 0, 0).timetuple())
+
+RELATIVE = ['tomorrow', 'today', 'yesterday', 'in 3 days', '2 hours ago',
+            '5 minutes from now', 'next week', 'last month', 'next year',
+            '3 days before 12/25/2016', '1 week after tomorrow', 'eod',
+            'eom', 'tonight', 'this afternoon', 'in 90 seconds',
+            '10 minutes after noon', 'a week from today']
+
+ABSOLUTE = ['August 25th, 2016', '08/25/2016', '25 Aug 2016', 'Dec 31st',
+            '2016-08-25', '2016-08-25 13:45', '2016-08-25T13:45:00Z',
+            'Thu, 25 Aug 2016 13:45:00 GMT', '5pm', '10:30', '10:30:15',
+            '17:00', 'noon', 'midnight', 'dec 31st 10:30', '1/1/2017 9am',
+            '12/25 5:30pm', 'march 3rd 2017 at 4pm']
+
+WEEKDAY = ['monday', 'next friday', 'last tuesday', 'this thursday',
+           'fri', 'next friday at 5pm', 'wednesday morning',
+           'one day before thursday', 'sunday noon', 'sat 10am',
+           'the monday after next', 'tuesday 3pm']
+
+RANGES = ['August 25th - 28th', 'march 31 - june 1st, 2006',
+          '06/07/06 - 08/09/06', '4:00:55 pm - 5:50:44 pm', '4p-5p',
+          '4-5pm', '4:30-5pm', 'march 1rd -13th', '10am - 4pm',
+          '9:00 - 17:30']
+
+MISSES = ['this is not a date', 'the quick brown fox', '', 'hello world',
+          'a b c d e f g']
+
+# phrases in the language of each shipped locale, ko_KR and ja_JP go
+# through their parseRegex() first
+LOCALES = {
+    'en_US': ['tomorrow', 'next friday', 'in 3 days', '2 hours ago',
+              'August 25, 2016', '08/25/2016', 'monday', '5pm'],
+    'en_AU': ['tomorrow', 'next friday', 'in 3 days', '2 hours ago',
+              '25 August 2016', '25/08/2016', 'monday', '5pm'],
+    'de_DE': ['morgen', 'übermorgen', 'nächsten Freitag', 'vor 2 Stunden',
+              '25. August 2016', '25.08.2016', 'Montag', '17:00'],
+    'fr_FR': ['demain', 'après-demain', 'vendredi prochain',
+              'dans 3 jours', '25 août 2016', '25/08/2016', 'lundi',
+              '17:00'],
+    'ru_RU': ['завтра', 'послезавтра', '2 часа назад', 'сегодня',
+              '25 августа 2016', '25.08.2016', 'понедельник', '17:00'],
+    'es': ['viernes', 'lunes', '25 agosto 2016', '25/08/2016', '17:00',
+           'jueves 17:00', 'sáb', 'diciembre 31'],
+    'nl_NL': ['morgen', 'overmorgen', 'volgende vrijdag', 'over 3 dagen',
+              '25 augustus 2016', '25-08-2016', 'maandag', '17:00'],
+    'pt_BR': ['sexta-feira', '25 de agosto de 2016', '25/08/2016',
+              '17:00', '3 dias', 'dezembro 31', 'segunda-feira',
+              'em 2 meses'],
+    'ko_KR': ['3일 후', '10일 전', '2019-01-04', '12/8', '2019년 1월 4일',
+              '4월 5일', '월요일', '23:00'],
+    'ja_JP': ['3日後', '十日前', '来週の金曜日', '先週の月曜日',
+              '2019-01-04', '12/8', '2019年1月4日', '23:00'],
+}
+
+_FILLER = ('Thanks for the update, I went through the notes and left a '
+           'few comments on the open items. Let me know what you think. ')
+_DATES = ['Can we meet next friday at 5pm?',
+          'The report is due on August 25th, 2016.',
+          'I will be out of the office from 08/25/2016 for 3 days.',
+          'Please send it by tomorrow noon.',
+          'The 10:30 call moved to 3 days from now.']
+
+
+def document(size):
+    """
+    Build a C{size} characters long text with a date phrase every few
+    hundred characters, the way an email body or a log excerpt looks.
+    """
+    parts = []
+    length = 0
+    i = 0
+    while length < size:
+        part = _FILLER * 3 + _DATES[i % len(_DATES)] + ' '
+        parts.append(part)
+        length += len(part)
+        i += 1
+    return ''.join(parts)[:size]
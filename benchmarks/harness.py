@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+Timing, reporting and comparison of benchmark results.
+"""
+from __future__ import division, print_function, unicode_literals
+
+import gc
+import sys
+import json
+import time
+import timeit
+import platform
+
+import parsedatetime as pdt
+
+timer = timeit.default_timer
+
+
+class Benchmark(object):
+
+    """
+    An operation timed once for each of a fixed list of inputs.
+    """
+
+    def __init__(self, name, func, items):
+        """
+        @type  name:  string
+        @param name:  dotted name, e.g. C{parse.relative}
+        @type  func:  callable
+        @param func:  operation to time, called with one item at a time
+        @type  items: iterable
+        @param items: inputs for C{func}
+        """
+        self.name = name
+        self.func = func
+        self.items = list(items)
+
+
+def percentile(samples, fraction):
+    """
+    Nearest rank percentile of the sorted C{samples}.
+    """
+    return samples[int(round(fraction * (len(samples) - 1)))]
+
+
+def run(benchmark, rounds=5, warmup=1):
+    """
+    Time every call of C{benchmark.func} over C{rounds} passes through its
+    items, after C{warmup} untimed passes.
+
+    Garbage collection is turned off while timing, the same as
+    C{timeit} does.
+
+    @rtype:  dictionary
+    @return: number of calls, operations per second and per call times
+             in microseconds
+    """
+    func = benchmark.func
+    items = benchmark.items
+
+    for _ in range(warmup):
+        for item in items:
+            func(item)
+
+    samples = []
+    gcEnabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            for item in items:
+                start = timer()
+                func(item)
+                samples.append(timer() - start)
+    finally:
+        if gcEnabled:
+            gc.enable()
+
+    samples.sort()
+    total = sum(samples)
+    return {'calls': len(samples),
+            'opsPerSec': len(samples) / total if total else 0.0,
+            'mean': total / len(samples) * 1e6,
+            'min': samples[0] * 1e6,
+            'p50': percentile(samples, 0.50) * 1e6,
+            'p90': percentile(samples, 0.90) * 1e6,
+            'p99': percentile(samples, 0.99) * 1e6,
+            'max': samples[-1] * 1e6}
+
+
+def metadata(label=None):
+    """
+    Describe the interpreter and machine the results were taken on.
+    """
+    return {'label': label,
+            'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'parsedatetime': pdt.__version__,
+            'python': sys.version.split()[0],
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'unit': 'us'}
+
+
+def report(name, result, out=sys.stdout):
+    print('%-32s %10.0f ops/s  p50 %9.2f  p90 %9.2f  p99 %9.2f us' %
+          (name, result['opsPerSec'], result['p50'], result['p90'],
+           result['p99']), file=out)
+
+
+def save(path, meta, results):
+    with open(path, 'w') as h:
+        json.dump({'meta': meta, 'results': results}, h, indent=2,
+                  sort_keys=True)
+
+
+def load(path):
+    with open(path) as h:
+        return json.load(h)
+
+
+def compare(baseline, results, threshold=0.1, out=sys.stdout):
+    """
+    Print the change of the median time per call of every benchmark found
+    in both C{baseline} and C{results}.
+
+    @type  baseline:  dictionary
+    @param baseline:  results as written by L{save()}
+    @type  results:   dictionary
+    @param results:   results of the current run, by benchmark name
+    @type  threshold: float
+    @param threshold: relative slow down counted as a regression
+
+    @rtype:  list
+    @return: names of the benchmarks that regressed
+    """
+    regressed = []
+    old = baseline['results']
+    label = baseline['meta'].get('label') or 'baseline'
+    print('\ncompared with %s:' % label, file=out)
+    for name in sorted(results):
+        if name not in old:
+            continue
+        ratio = results[name]['p50'] / old[name]['p50']
+        flag = ''
+        if ratio > 1 + threshold:
+            flag = '  REGRESSION'
+            regressed.append(name)
+        print('%-32s %9.2f -> %9.2f us  %+6.1f%%%s' %
+              (name, old[name]['p50'], results[name]['p50'],
+               (ratio - 1) * 100, flag), file=out)
+    return regressed
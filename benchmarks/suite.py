@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+The benchmarks run by C{python -m benchmarks}.
+"""
+from __future__ import unicode_literals
+
+import array
+import itertools
+
+import parsedatetime as pdt
+from parsedatetime import bulk
+
+from . import corpora
+from .harness import Benchmark
+
+
+def _phrases(phrases):
+    # every phrase against every source time
+    return list(itertools.product(phrases, corpora.SOURCE_TIMES))
+
+
+def suite():
+    """
+    Build the list of L{Benchmark}s.
+
+    Every L{Calendar<parsedatetime.Calendar>} is created without a result
+    cache so that repeated inputs go through the whole regex cascade.
+    """
+    cal = pdt.Calendar(version=pdt.VERSION_CONTEXT_STYLE)
+
+    def parse(item):
+        return cal.parse(*item)
+
+    def parseDT(item):
+        return cal.parseDT(*item)
+
+    def parseTimestamp(item):
+        return cal.parseTimestamp(*item)
+
+    def evalRanges(item):
+        return cal.evalRanges(*item)
+
+    def nlp(text):
+        return cal.nlp(text, corpora.SOURCE_TIMES[0])
+
+    plans = dict((phrase, cal.compile(phrase))
+                 for phrase in corpora.RELATIVE + corpora.WEEKDAY)
+
+    def evaluate(item):
+        phrase, sourceTime = item
+        return plans[phrase].evaluate(sourceTime)
+
+    column = (corpora.ABSOLUTE + corpora.RELATIVE + corpora.MISSES) * 10
+    out = (array.array('q', [0] * len(column)),
+           array.array('h', [0] * len(column)),
+           array.array('b', [0] * len(column)))
+
+    def columns(texts):
+        return bulk.parseColumns(cal, texts, corpora.SOURCE_TIMES[0], out)
+
+    anchors = list(corpora.SOURCE_TIMES) * 100
+
+    def anchored(text):
+        return bulk.parseAnchored(cal, text, anchors)
+
+    benchmarks = [
+        Benchmark('parse.relative', parse, _phrases(corpora.RELATIVE)),
+        Benchmark('parse.absolute', parse, _phrases(corpora.ABSOLUTE)),
+        Benchmark('parse.weekday', parse, _phrases(corpora.WEEKDAY)),
+        Benchmark('parse.misses', parse, _phrases(corpora.MISSES)),
+        Benchmark('plan.relative', evaluate, _phrases(corpora.RELATIVE)),
+        Benchmark('plan.weekday', evaluate, _phrases(corpora.WEEKDAY)),
+        Benchmark('parseDT.absolute', parseDT, _phrases(corpora.ABSOLUTE)),
+        Benchmark('parseTimestamp.relative', parseTimestamp,
+                  _phrases(corpora.RELATIVE)),
+        Benchmark('evalRanges.ranges', evalRanges,
+                  _phrases(corpora.RANGES)),
+        Benchmark('nlp.document.1k', nlp, [corpora.document(1000)] * 3),
+        Benchmark('nlp.document.10k', nlp, [corpora.document(10000)]),
+        Benchmark('bulk.columns', columns, [column]),
+        Benchmark('bulk.anchored', anchored, corpora.RELATIVE),
+    ]
+
+    for localeID in sorted(corpora.LOCALES):
+        localeCal = pdt.Calendar(pdt.Constants(localeID, usePyICU=False),
+                                 version=pdt.VERSION_CONTEXT_STYLE)
+        benchmarks.append(Benchmark(
+            'parse.locale.%s' % localeID,
+            lambda item, localeCal=localeCal: localeCal.parse(*item),
+            _phrases(corpora.LOCALES[localeID])))
+
+    for localeID in sorted(corpora.LOCALES):
+        benchmarks.append(Benchmark(
+            'constants.%s' % localeID,
+            lambda _, localeID=localeID: pdt.Constants(localeID,
+                                                       usePyICU=False),
+            range(3)))
+    benchmarks.append(Benchmark(
+        'constants.en_US.precompile',
+        lambda _: pdt.Constants('en_US', usePyICU=False, precompile=True),
+        range(3)))
+
+    return benchmarks
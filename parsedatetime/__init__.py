@@ -31,12 +31,22 @@ import logging
 import warnings
 import datetime
 import calendar
-import contextlib
+import threading
 import email.utils
 
 from .pdt_locales import (locales as _locales,
-                          get_icu, load_locale)
-from .context import pdtContext, pdtContextStack
+                          get_icu, pdtLazyLocales)
+# re-exported, parsedatetime.load_locale was public before the locales
+# were loaded lazily
+from .pdt_locales import load_locale  # noqa: F401
+from .context import (pdtContext, pdtContextStack, pdtContextScope,
+                      pdtClockScope)
+from .cache import pdtResultCache
+from .plan import pdtPlan, record as _recordPlan
+from .scanner import pdtScanCursor, SCAN_FREE, SCAN_START
+from .profiling import pdtTracer
+# re-exported, Calendar(profiler=parsedatetime.pdtProfiler())
+from .profiling import pdtProfiler  # noqa: F401
 from .warns import pdt20DeprecationWarning
 
 
@@ -66,7 +76,7 @@ log.addHandler(NullHandler())
 
 debug = False
 
-pdtLocales = dict([(x, load_locale(x)) for x in _locales])
+pdtLocales = pdtLazyLocales(_locales)
 
 
 # Copied from feedparser.py
@@ -234,6 +244,35 @@ def _parse_date_rfc822(dateString):
     return email.utils.parsedate_tz(dateString)
 
 
+# machine formatted dates that Calendar.parse() evaluates before trying
+# the natural language patterns, see Calendar._evalStrict()
+_CRE_ISO8601 = re.compile(r'''
+    (?P<year>\d\d\d\d)-(?P<month>\d\d)-(?P<day>\d\d)
+    (?:
+        (?:t|\s+)
+        (?P<hours>\d\d)(?P<tsep>:?)(?P<minutes>\d\d)
+        (?:(?P=tsep)(?P<seconds>\d\d)(?:[.,]\d+)?)?
+        (?:\s*(?:z|utc|gmt|[-+]\d\d(?::?\d\d)?))?
+    )?$''', re.VERBOSE)
+
+_CRE_ISO8601_BASIC = re.compile(r'''
+    (?P<year>\d\d\d\d)(?P<month>\d\d)(?P<day>\d\d)
+    t(?P<hours>\d\d)(?P<minutes>\d\d)
+    (?:(?P<seconds>\d\d)(?:[.,]\d+)?)?
+    (?:z|[-+]\d\d(?:\d\d)?)?$''', re.VERBOSE)
+
+_RFC822_MONTHS = ('jan', 'feb', 'mar', 'apr', 'may', 'jun',
+                  'jul', 'aug', 'sep', 'oct', 'nov', 'dec')
+
+_CRE_RFC822 = re.compile(r'''
+    (?:(?:mon|tue|wed|thu|fri|sat|sun)(?:,\s*|\s+))?
+    (?P<day>\d\d?)\s+(?P<mthname>{0})\s+(?P<year>\d\d\d\d)
+    (?:
+        \s+(?P<hours>\d\d?):(?P<minutes>\d\d)(?::(?P<seconds>\d\d))?
+        (?:\s*(?:ut|utc|gmt|z|[ecmp][sd]t|[-+]\d\d\d\d))?
+    )?$'''.format('|'.join(_RFC822_MONTHS)), re.VERBOSE)
+
+
 # rfc822.py defines several time zones, but we define some extra ones.
 # 'ET' is equivalent to 'EST', etc.
 # _additional_timezones = {'AT': -400, 'ET': -500,
@@ -244,6 +283,41 @@ def _parse_date_rfc822(dateString):
 VERSION_FLAG_STYLE = 1
 VERSION_CONTEXT_STYLE = 2
 
+# how the parse() loop finds the next chunk of text to evaluate
+DISPATCH_SEQUENTIAL = 1
+DISPATCH_COMBINED = 2
+
+# pre-compiled patterns used by parse() to clean up the incoming text:
+# drop periods ending a word and quotes wrapping a word
+_CRE_WORD_PERIOD = re.compile(r'(\w)\.(\s)')
+_CRE_QUOTE_AFTER = re.compile(r'(\w)[\'"](\s|$)')
+_CRE_QUOTE_BEFORE = re.compile(r'(\s|^)[\'"](\w)')
+
+# names of the patterns behind Calendar._partialParseMethods(), in order
+_DISPATCH_KEYS = ('CRE_MODIFIER', 'CRE_UNITS', 'CRE_QUNITS', 'CRE_DATE3',
+                  'CRE_DATE', 'CRE_DAY', 'CRE_WEEKDAY', 'CRE_TIME',
+                  'CRE_TIMEHMS2', 'CRE_TIMEHMS')
+_DISPATCH_NOW = _DISPATCH_KEYS.index('CRE_TIME')
+
+# group names, backreferences and conditionals in a pattern source
+_CRE_GROUP_NAME = re.compile(r'\(\?(P<|P=|\()(\w+)')
+
+# every text matched by one of the patterns behind parse() and nlp() has a
+# digit or one of the words of their sources in it, nlp() only looks for
+# CRE_UNITS_ONLY after a modifier and CRE_DAY2 next to a unit
+_PREFILTER_KEYS = _DISPATCH_KEYS
+
+# escapes, group names, backreferences and conditionals left out when
+# collecting the words of a pattern source
+_CRE_SOURCE_SYNTAX = re.compile(r'\\.|\(\?(?:P<\w+>|P=\w+\)|\(\w+\))')
+_CRE_LETTERS = re.compile(r'[^\W\d_]+', re.UNICODE)
+_CRE_DIGIT = re.compile(r'\d', re.UNICODE)
+
+# (pattern, translate table) for the letters that case insensitive
+# patterns take for a letter of a word but lower() does not turn into it,
+# such as the long s, keyed on the letters of the words and the re options
+_prefilterFolds = {}
+
 
 class Calendar(object):
 
@@ -252,7 +326,9 @@ class Calendar(object):
     The text can either be 'normal' date values or it can be human readable.
     """
 
-    def __init__(self, constants=None, version=VERSION_FLAG_STYLE):
+    def __init__(self, constants=None, version=VERSION_FLAG_STYLE,
+                 cacheSize=None, dispatch=DISPATCH_SEQUENTIAL, profiler=None,
+                 trace=False, prefilter=True, clock=None):
         """
         Default constructor for the L{Calendar} class.
 
@@ -262,6 +338,42 @@ class Calendar(object):
         @param version:   Default style version of current Calendar instance.
                           Valid value can be 1 (L{VERSION_FLAG_STYLE}) or
                           2 (L{VERSION_CONTEXT_STYLE}). See L{parse()}.
+        @type  cacheSize: integer
+        @param cacheSize: If set, keep the results of up to this many
+                          L{parse()} calls in a L{pdtResultCache}, available
+                          as C{self.cache}.  Results are keyed on the
+                          normalized text, the source time and the
+                          L{Constants} settings that change the outcome.
+                          Calls without a source time are keyed on the
+                          C{clock} reading, which for the default clock
+                          changes every second, so repeated calls only hit
+                          the cache if they pass a source time or the
+                          Calendar has a C{clock} that stays put.
+        @type  dispatch:  integer
+        @param dispatch:  How L{parse()} looks for the next date/time text.
+                          L{DISPATCH_SEQUENTIAL} tries the patterns one after
+                          the other, L{DISPATCH_COMBINED} searches for all of
+                          them at once.  Both give the same results.
+        @type  profiler:  object
+        @param profiler:  If set, a L{pdtProfiler} that records the calls
+                          and timings of each stage of L{parse()} and
+                          L{nlp()} on this instance.
+        @type  trace:     boolean
+        @param trace:     If True, log every stage of L{parse()} and
+                          L{nlp()} on this instance with its arguments and
+                          result, see L{pdtTracer}.  Calendars without
+                          tracing run exactly the same code as before.
+        @type  prefilter: boolean
+        @param prefilter: If True, L{parse()} and L{nlp()} skip their
+                          patterns for texts that L{Constants.couldMatch()}
+                          rules out.  Both give the same results.
+        @type  clock:     callable
+        @param clock:     If set, called instead of C{time.localtime()}
+                          for the current local time, as a C{struct_time},
+                          when no source time is given.  It is read at most
+                          once for each call to L{parse()}, L{nlp()} and
+                          the other parse methods, nested evaluations all
+                          see the same reading.
 
         @rtype:  object
         @return: L{Calendar} instance
@@ -280,19 +392,66 @@ class Calendar(object):
                 'with argument `version=parsedatetime.VERSION_CONTEXT_STYLE`.',
                 pdt20DeprecationWarning)
         self._ctxStack = pdtContextStack()
+        self.clock = time.localtime if clock is None else clock
+        self.dispatch = dispatch
+        self.prefilter = prefilter
+
+        if cacheSize:
+            self.cache = pdtResultCache(cacheSize)
+        else:
+            self.cache = None
+
+        self.profiler = profiler
+        if profiler is not None:
+            profiler.attach(self)
+
+        self._trace = trace
+        if trace:
+            pdtTracer(log).attach(self)
 
-    @contextlib.contextmanager
     def context(self):
-        ctx = pdtContext(0, self.ptc.locale.useAccuracy)
-        self._ctxStack.push(ctx)
-        yield ctx
-        ctx = self._ctxStack.pop()
-        if not self._ctxStack.isEmpty():
-            self.currentContext.update(ctx)
+        """
+        Return a context manager that makes a new L{pdtContext} the
+        L{currentContext} while it is active and then merges it into the
+        previous one.
+        """
+        return pdtContextScope(self._ctxStack.stack,
+                               pdtContext(0, self.ptc.locale.useAccuracy))
+
+    def _clockScope(self):
+        """
+        Return a context manager that makes L{_now()} read L{clock} only
+        once while it is active, see L{pdtClockScope}.
+        """
+        return pdtClockScope(self._ctxStack)
+
+    def _now(self):
+        """
+        Return the current local time as given by L{clock}, the same value
+        for the whole of the outermost L{_clockScope()}.
+        """
+        ctxStack = self._ctxStack
+        if not ctxStack.clocked:
+            return self.clock()
+        now = ctxStack.now
+        if now is None:
+            now = ctxStack.now = self.clock()
+        return now
+
+    @property
+    def trace(self):
+        """
+        True if this instance was created with C{trace=True}, tracing
+        cannot be turned on or off afterwards.
+        """
+        return self._trace
 
     @property
     def currentContext(self):
-        return self._ctxStack.last()
+        try:
+            return self._ctxStack.stack[-1]
+        except IndexError:
+            raise RuntimeError('context stack is empty')
 
     def _convertUnitAsWords(self, unitText):
         """
@@ -345,7 +504,7 @@ class Calendar(object):
                             quantity, modifier, units)
 
         if source is None:
-            source = time.localtime()
+            source = self._now()
 
         if quantity is None:
             quantity = ''
@@ -366,13 +525,7 @@ class Calendar(object):
 
         start = datetime.datetime(yr, mth, dy, hr, mn, sec)
         target = start
-        # realunit = next((key for key, values in self.ptc.units.items()
-        #                  if any(imap(units.__contains__, values))), None)
-        realunit = units
-        for key, values in self.ptc.units.items():
-            if units in values:
-                realunit = key
-                break
+        realunit = self.ptc.unitAliases.get(units, units)
 
         debug and log.debug('units %s --> realunit %s (qty=%s)',
                             units, realunit, qty)
@@ -387,7 +540,7 @@ class Calendar(object):
             # OverflowError is raise when target.year larger than 9999
             pass
         else:
-            ctx.updateAccuracy(realunit)
+            ctx.updateAccuracy(self.ptc.unitAccuracy.get(units, realunit))
 
         return target.timetuple()
 
@@ -406,7 +559,7 @@ class Calendar(object):
         @return: calculated C{struct_time} value of dateString
         """
         if sourceTime is None:
-            yr, mth, dy, hr, mn, sec, wd, yd, isdst = time.localtime()
+            yr, mth, dy, hr, mn, sec, wd, yd, isdst = self._now()
         else:
             yr, mth, dy, hr, mn, sec, wd, yd, isdst = sourceTime
 
@@ -476,7 +629,7 @@ class Calendar(object):
                 ctx.updateAccuracy(*accuracy)
             else:
                 # return current time if date string is invalid
-                sourceTime = time.localtime()
+                sourceTime = self._now()
 
         return sourceTime
 
@@ -497,7 +650,7 @@ class Calendar(object):
         @return: calculated C{struct_time} value of dateString
         """
         if sourceTime is None:
-            yr, mth, dy, hr, mn, sec, wd, yd, isdst = time.localtime()
+            yr, mth, dy, hr, mn, sec, wd, yd, isdst = self._now()
         else:
             yr, mth, dy, hr, mn, sec, wd, yd, isdst = sourceTime
 
@@ -541,7 +694,7 @@ class Calendar(object):
                 ctx.updateAccuracy(*accuracy)
             else:
                 # Return current time if date string is invalid
-                sourceTime = time.localtime()
+                sourceTime = self._now()
 
         debug and log.debug('parseDateText returned '
                             'mth %d dy %d yr %d sourceTime %s',
@@ -562,6 +715,13 @@ class Calendar(object):
         @rtype:  tuple
         @return: tuple of: start datetime, end datetime and the invalid flag
         """
+        with self._clockScope():
+            return self._evalRanges(datetimeString, sourceTime)
+
+    def _evalRanges(self, datetimeString, sourceTime):
+        """
+        Body of L{evalRanges()}.
+        """
         rangeFlag = retFlag = 0
         startStr = endStr = ''
 
@@ -669,7 +829,7 @@ class Calendar(object):
 
         else:
             # if range is not found
-            startDT = endDT = time.localtime()
+            startDT = endDT = self._now()
 
         if retFlag:
             startDT, sctx = self.parse(startStr, sourceTime,
@@ -780,10 +940,9 @@ class Calendar(object):
         ctx = self.currentContext
         offset = self.ptc.Modifiers[modifier]
 
-        if sourceTime is not None:
-            (yr, mth, dy, hr, mn, sec, wd, yd, isdst) = sourceTime
-        else:
-            (yr, mth, dy, hr, mn, sec, wd, yd, isdst) = time.localtime()
+        if sourceTime is None:
+            sourceTime = self._now()
+        (yr, mth, dy, hr, mn, sec, wd, yd, isdst) = sourceTime
 
         if self.ptc.StartTimeFromSourceTime:
             startHour = hr
@@ -809,7 +968,9 @@ class Calendar(object):
                             "chunk2 [%s] unit [%s]",
                             modifier, chunk1, chunk2, unit)
 
-        if unit in self.ptc.units['months']:
+        realunit = self.ptc.unitAliases.get(unit)
+
+        if realunit == 'months':
             currentDaysInMonth = self.ptc.daysInMonth(mth, yr)
             if offset == 0:
                 dy = currentDaysInMonth
@@ -832,7 +993,7 @@ class Calendar(object):
                 sourceTime = target.timetuple()
             ctx.updateAccuracy(ctx.ACU_MONTH)
 
-        elif unit in self.ptc.units['weeks']:
+        elif realunit == 'weeks':
             if offset == 0:
                 start = datetime.datetime(yr, mth, dy, 17, 0, 0)
                 target = start + datetime.timedelta(days=(4 - wd))
@@ -849,7 +1010,7 @@ class Calendar(object):
                 sourceTime = target.timetuple()
             ctx.updateAccuracy(ctx.ACU_WEEK)
 
-        elif unit in self.ptc.units['days']:
+        elif realunit == 'days':
             if offset == 0:
                 sourceTime = (yr, mth, dy, 17, 0, 0, wd, yd, isdst)
                 ctx.updateAccuracy(ctx.ACU_HALFDAY)
@@ -864,7 +1025,7 @@ class Calendar(object):
                 sourceTime = target.timetuple()
             ctx.updateAccuracy(ctx.ACU_DAY)
 
-        elif unit in self.ptc.units['hours']:
+        elif realunit == 'hours':
             if offset == 0:
                 sourceTime = (yr, mth, dy, hr, 0, 0, wd, yd, isdst)
             else:
@@ -873,7 +1034,7 @@ class Calendar(object):
                 sourceTime = target.timetuple()
             ctx.updateAccuracy(ctx.ACU_HOUR)
 
-        elif unit in self.ptc.units['years']:
+        elif realunit == 'years':
             if offset == 0:
                 sourceTime = (yr, 12, 31, hr, mn, sec, wd, yd, isdst)
             elif offset == 2:
@@ -904,8 +1065,7 @@ class Calendar(object):
             if modifier == 'eod':
                 ctx.updateAccuracy(ctx.ACU_HOUR)
                 # Calculate the upcoming weekday
-                sourceTime, subctx = self.parse(wkdy, sourceTime,
-                                                VERSION_CONTEXT_STYLE)
+                sourceTime, subctx = self._parseRaw(wkdy, sourceTime)
                 sTime = self.ptc.getSource(modifier, sourceTime)
                 if sTime is not None:
                     sourceTime = sTime
@@ -931,7 +1091,7 @@ class Calendar(object):
                     # consider "one day before thursday": we need to parse chunk1 ("one day")
                     # and apply according to the offset ("before"), rather than allowing the
                     # remaining parse step to apply "one day" without the offset direction.
-                    t, subctx = self.parse(chunk1, sourceTime, VERSION_CONTEXT_STYLE)
+                    t, subctx = self._parseRaw(chunk1, sourceTime)
                     if subctx.hasDateOrTime:
                         delta = time.mktime(t) - time.mktime(sourceTime)
                         target = start + datetime.timedelta(days=diff) + datetime.timedelta(seconds=delta * offset)
@@ -944,7 +1104,7 @@ class Calendar(object):
             m = self.ptc.CRE_TIME.match(unit)
             debug and log.debug('CRE_TIME matched')
             (yr, mth, dy, hr, mn, sec, wd, yd, isdst), subctx = \
-                self.parse(unit, None, VERSION_CONTEXT_STYLE)
+                self._parseRaw(unit, None)
 
             start = datetime.datetime(yr, mth, dy, hr, mn, sec)
             target = start + datetime.timedelta(days=offset)
@@ -961,7 +1121,7 @@ class Calendar(object):
             unit = unit.strip()
             if unit:
                 s = '%s %s' % (unit, chunk2)
-                t, subctx = self.parse(s, sourceTime, VERSION_CONTEXT_STYLE)
+                t, subctx = self._parseRaw(s, sourceTime)
 
                 if subctx.hasDate:  # working with dates
                     u = unit.lower()
@@ -994,8 +1154,7 @@ class Calendar(object):
                     qty = self._quantityToReal(m.group()) * offset
                     chunk1 = '%s%s%s' % (chunk1[:m.start()],
                                          qty, chunk1[m.end():])
-                t, subctx = self.parse(chunk1, sourceTime,
-                                       VERSION_CONTEXT_STYLE)
+                t, subctx = self._parseRaw(chunk1, sourceTime)
 
                 chunk1 = ''
 
@@ -1061,10 +1220,68 @@ class Calendar(object):
                                    ctx.ACU_HOUR, ctx.ACU_MIN, ctx.ACU_SEC)
 
         if sourceTime is None:
-            sourceTime = time.localtime()
+            sourceTime = self._now()
 
         return sourceTime
 
+    def _evalStrict(self, datetimeString, sourceTime):
+        """
+        Calculate the datetime of text that is entirely an ISO 8601 /
+        RFC 3339 or an RFC 822 date, without going through the
+        C{_partialParse*} methods.
+
+        Examples handled::
+            2024-05-01, 2024-05-01T13:45:00Z, 2024-05-01 13:45+02:00
+            20240501T134500Z
+            Wed, 01 May 2024 13:45:00 GMT
+
+        Time zone designators are accepted but not applied, the same as
+        for every other format L{parse()} understands.  RFC 822 dates are
+        only recognized for locales that use the English month names.
+
+        @type  datetimeString: string
+        @param datetimeString: lowercased and stripped date/time text
+        @type  sourceTime:     struct_time
+        @param sourceTime:     C{struct_time} value to use as the base
+
+        @rtype:  struct_time
+        @return: calculated C{struct_time} value or None if
+                 C{datetimeString} is not a valid date in one of these
+                 formats
+        """
+        m = _CRE_ISO8601.match(datetimeString) or \
+            _CRE_ISO8601_BASIC.match(datetimeString)
+        if m is None and self.ptc.englishMonths:
+            m = _CRE_RFC822.match(datetimeString)
+        if m is None:
+            return None
+
+        yr, mth, dy, hr, mn, sec, wd, yd, isdst = sourceTime
+
+        groups = m.groupdict()
+        if groups.get('mthname'):
+            month = _RFC822_MONTHS.index(groups['mthname']) + 1
+        else:
+            month = int(groups['month'])
+        year = int(groups['year'])
+        day = int(groups['day'])
+        if not 1 <= month <= 12 or \
+                not 1 <= day <= self.ptc.daysInMonth(month, year):
+            return None
+
+        if groups['hours'] is not None:
+            hr = int(groups['hours'])
+            mn = int(groups['minutes'])
+            sec = int(groups['seconds'] or 0)
+            if hr > 23 or mn > 59 or sec > 59:
+                return None
+
+        ctx = self.currentContext
+        ctx.updateAccuracy(ctx.ACU_YEAR, ctx.ACU_MONTH, ctx.ACU_DAY)
+        _pop_time_accuracy(m, ctx)
+
+        return (year, month, day, hr, mn, sec, wd, yd, isdst)
+
     def _evalUnits(self, datetimeString, sourceTime):
         """
         Evaluate text passed by L{_partialParseUnits()}
@@ -1269,11 +1486,15 @@ class Calendar(object):
         #     |     and also m2.start('suffix')
         #     +---- m.start('qty')
         #           and also m2.start('day')
-        m2 = self.ptc.CRE_DAY2.search(s)
+        return self._UnitsTrappedBy(self.ptc.CRE_DAY2.search(s), m, key)
+
+    def _UnitsTrappedBy(self, m2, m, key, base=0):
+        # same as _UnitsTrapped() with the CRE_DAY2 match already found,
+        # base is added to the positions of m to line them up with m2
         if m2 is not None:
             t = '%s%s' % (m2.group('day'), m.group(key))
-            if m.start(key) == m2.start('suffix') and \
-                    m.start('qty') == m2.start('day') and \
+            if m.start(key) + base == m2.start('suffix') and \
+                    m.start('qty') + base == m2.start('day') and \
                     m.group('qty') == t:
                 return True
             else:
@@ -1281,7 +1502,24 @@ class Calendar(object):
         else:
             return False
 
-    def _partialParseModifier(self, s, sourceTime):
+    def _nlpPrefixStart(self, s, prefixMatch, end, flag):
+        # start of the on/at/in prefix in front of an nlp match ending the
+        # text s[:end], the same as searching s[:end] + ' ' + str(flag)
+        # with CRE_NLP_PREFIX given prefixMatch, its first match in all of s
+        if prefixMatch is not None and prefixMatch.end() <= end:
+            return prefixMatch.start('nlp_prefix')
+        # otherwise only a prefix word right before end can match
+        # by using the flag digit that is appended
+        start = end
+        while start > 0 and s[start - 1].isspace():
+            start -= 1
+        start = max(start - 3, 0)
+        m = self.ptc.CRE_NLP_PREFIX.search(s[start:end] + ' ' + str(flag))
+        if m is not None:
+            return m.start('nlp_prefix') + start
+        return None
+
+    def _partialParseModifier(self, s, sourceTime, m=None):
         """
         test if giving C{s} matched CRE_MODIFIER, used by L{parse()}
 
@@ -1289,6 +1527,9 @@ class Calendar(object):
         @param s:          date/time text to evaluate
         @type  sourceTime: struct_time
         @param sourceTime: C{struct_time} value to use as the base
+        @type  m:          match object
+        @param m:          match of CRE_MODIFIER in C{s} if the caller already
+                           found it
 
         @rtype:  tuple
         @return: tuple of remained date/time text, datetime object and
@@ -1299,7 +1540,8 @@ class Calendar(object):
         chunk1 = chunk2 = ''
 
         # Modifier like next/prev/from/after/prior..
-        m = self.ptc.CRE_MODIFIER.search(s)
+        if m is None:
+            m = self.ptc.CRE_MODIFIER.search(s)
         if m is not None:
             if m.group() != s:
                 # capture remaining string
@@ -1317,7 +1559,7 @@ class Calendar(object):
 
         return s, sourceTime, bool(parseStr)
 
-    def _partialParseUnits(self, s, sourceTime):
+    def _partialParseUnits(self, s, sourceTime, m=None):
         """
         test if giving C{s} matched CRE_UNITS, used by L{parse()}
 
@@ -1325,6 +1567,9 @@ class Calendar(object):
         @param s:          date/time text to evaluate
         @type  sourceTime: struct_time
         @param sourceTime: C{struct_time} value to use as the base
+        @type  m:          match object
+        @param m:          match of CRE_UNITS in C{s} if the caller already
+                           found it
 
         @rtype:  tuple
         @return: tuple of remained date/time text, datetime object and
@@ -1335,7 +1580,8 @@ class Calendar(object):
         chunk1 = chunk2 = ''
 
         # Quantity + Units
-        m = self.ptc.CRE_UNITS.search(s)
+        if m is None:
+            m = self.ptc.CRE_UNITS.search(s)
         if m is not None:
             debug and log.debug('CRE_UNITS matched')
             if self._UnitsTrapped(s, m, 'units'):
@@ -1363,7 +1609,7 @@ class Calendar(object):
 
         return s, sourceTime, bool(parseStr)
 
-    def _partialParseQUnits(self, s, sourceTime):
+    def _partialParseQUnits(self, s, sourceTime, m=None):
         """
         test if giving C{s} matched CRE_QUNITS, used by L{parse()}
 
@@ -1371,6 +1617,9 @@ class Calendar(object):
         @param s:          date/time text to evaluate
         @type  sourceTime: struct_time
         @param sourceTime: C{struct_time} value to use as the base
+        @type  m:          match object
+        @param m:          match of CRE_QUNITS in C{s} if the caller already
+                           found it
 
         @rtype:  tuple
         @return: tuple of remained date/time text, datetime object and
@@ -1381,7 +1630,8 @@ class Calendar(object):
         chunk1 = chunk2 = ''
 
         # Quantity + Units
-        m = self.ptc.CRE_QUNITS.search(s)
+        if m is None:
+            m = self.ptc.CRE_QUNITS.search(s)
         if m is not None:
             debug and log.debug('CRE_QUNITS matched')
             if self._UnitsTrapped(s, m, 'qunits'):
@@ -1410,7 +1660,7 @@ class Calendar(object):
 
         return s, sourceTime, bool(parseStr)
 
-    def _partialParseDateStr(self, s, sourceTime):
+    def _partialParseDateStr(self, s, sourceTime, m=None):
         """
         test if giving C{s} matched CRE_DATE3, used by L{parse()}
 
@@ -1418,6 +1668,9 @@ class Calendar(object):
         @param s:          date/time text to evaluate
         @type  sourceTime: struct_time
         @param sourceTime: C{struct_time} value to use as the base
+        @type  m:          match object
+        @param m:          match of CRE_DATE3 in C{s} if the caller already
+                           found it
 
         @rtype:  tuple
         @return: tuple of remained date/time text, datetime object and
@@ -1427,7 +1680,8 @@ class Calendar(object):
         parseStr = None
         chunk1 = chunk2 = ''
 
-        m = self.ptc.CRE_DATE3.search(s)
+        if m is None:
+            m = self.ptc.CRE_DATE3.search(s)
         # NO LONGER NEEDED, THE REGEXP HANDLED MTHNAME NOW
         # for match in self.ptc.CRE_DATE3.finditer(s):
         # to prevent "HH:MM(:SS) time strings" expressions from
@@ -1484,7 +1738,7 @@ class Calendar(object):
 
         return s, sourceTime, bool(parseStr)
 
-    def _partialParseDateStd(self, s, sourceTime):
+    def _partialParseDateStd(self, s, sourceTime, m=None):
         """
         test if giving C{s} matched CRE_DATE, used by L{parse()}
 
@@ -1492,6 +1746,9 @@ class Calendar(object):
         @param s:          date/time text to evaluate
         @type  sourceTime: struct_time
         @param sourceTime: C{struct_time} value to use as the base
+        @type  m:          match object
+        @param m:          match of CRE_DATE in C{s} if the caller already
+                           found it
 
         @rtype:  tuple
         @return: tuple of remained date/time text, datetime object and
@@ -1502,7 +1759,8 @@ class Calendar(object):
         chunk1 = chunk2 = ''
 
         # Standard date format
-        m = self.ptc.CRE_DATE.search(s)
+        if m is None:
+            m = self.ptc.CRE_DATE.search(s)
         if m is not None:
 
             if (m.group('date') != s):
@@ -1522,7 +1780,7 @@ class Calendar(object):
 
         return s, sourceTime, bool(parseStr)
 
-    def _partialParseDayStr(self, s, sourceTime):
+    def _partialParseDayStr(self, s, sourceTime, m=None):
         """
         test if giving C{s} matched CRE_DAY, used by L{parse()}
 
@@ -1530,6 +1788,9 @@ class Calendar(object):
         @param s:          date/time text to evaluate
         @type  sourceTime: struct_time
         @param sourceTime: C{struct_time} value to use as the base
+        @type  m:          match object
+        @param m:          match of CRE_DAY in C{s} if the caller already
+                           found it
 
         @rtype:  tuple
         @return: tuple of remained date/time text, datetime object and
@@ -1540,7 +1801,8 @@ class Calendar(object):
         chunk1 = chunk2 = ''
 
         # Natural language day strings
-        m = self.ptc.CRE_DAY.search(s)
+        if m is None:
+            m = self.ptc.CRE_DAY.search(s)
         if m is not None:
 
             if (m.group() != s):
@@ -1560,7 +1822,7 @@ class Calendar(object):
 
         return s, sourceTime, bool(parseStr)
 
-    def _partialParseWeekday(self, s, sourceTime):
+    def _partialParseWeekday(self, s, sourceTime, m=None):
         """
         test if giving C{s} matched CRE_WEEKDAY, used by L{parse()}
 
@@ -1568,6 +1830,9 @@ class Calendar(object):
         @param s:          date/time text to evaluate
         @type  sourceTime: struct_time
         @param sourceTime: C{struct_time} value to use as the base
+        @type  m:          match object
+        @param m:          match of CRE_WEEKDAY in C{s} if the caller already
+                           found it
 
         @rtype:  tuple
         @return: tuple of remained date/time text, datetime object and
@@ -1578,10 +1843,12 @@ class Calendar(object):
         chunk1 = chunk2 = ''
 
         ctx = self.currentContext
-        log.debug('eval %s with context - %s, %s', s, ctx.hasDate, ctx.hasTime)
+        debug and log.debug('eval %s with context - %s, %s',
+                            s, ctx.hasDate, ctx.hasTime)
 
         # Weekday
-        m = self.ptc.CRE_WEEKDAY.search(s)
+        if m is None:
+            m = self.ptc.CRE_WEEKDAY.search(s)
         if m is not None:
             gv = m.group()
             if s not in self.ptc.dayOffsets:
@@ -1603,7 +1870,7 @@ class Calendar(object):
 
         return s, sourceTime, bool(parseStr)
 
-    def _partialParseTimeStr(self, s, sourceTime):
+    def _partialParseTimeStr(self, s, sourceTime, m=None):
         """
         test if giving C{s} matched CRE_TIME, used by L{parse()}
 
@@ -1611,6 +1878,9 @@ class Calendar(object):
         @param s:          date/time text to evaluate
         @type  sourceTime: struct_time
         @param sourceTime: C{struct_time} value to use as the base
+        @type  m:          match object
+        @param m:          match of CRE_TIME in C{s} if the caller already
+                           found it
 
         @rtype:  tuple
         @return: tuple of remained date/time text, datetime object and
@@ -1621,7 +1891,8 @@ class Calendar(object):
         chunk1 = chunk2 = ''
 
         # Natural language time strings
-        m = self.ptc.CRE_TIME.search(s)
+        if m is None:
+            m = self.ptc.CRE_TIME.search(s)
         if m is not None or s in self.ptc.re_values['now']:
 
             if (m and m.group() != s):
@@ -1641,7 +1912,7 @@ class Calendar(object):
 
         return s, sourceTime, bool(parseStr)
 
-    def _partialParseMeridian(self, s, sourceTime):
+    def _partialParseMeridian(self, s, sourceTime, m=None):
         """
         test if giving C{s} matched CRE_TIMEHMS2, used by L{parse()}
 
@@ -1649,6 +1920,9 @@ class Calendar(object):
         @param s:          date/time text to evaluate
         @type  sourceTime: struct_time
         @param sourceTime: C{struct_time} value to use as the base
+        @type  m:          match object
+        @param m:          match of CRE_TIMEHMS2 in C{s} if the caller already
+                           found it
 
         @rtype:  tuple
         @return: tuple of remained date/time text, datetime object and
@@ -1659,7 +1933,8 @@ class Calendar(object):
         chunk1 = chunk2 = ''
 
         # HH:MM(:SS) am/pm time strings
-        m = self.ptc.CRE_TIMEHMS2.search(s)
+        if m is None:
+            m = self.ptc.CRE_TIMEHMS2.search(s)
         if m is not None:
 
             if m.group('minutes') is not None:
@@ -1686,7 +1961,7 @@ class Calendar(object):
 
         return s, sourceTime, bool(parseStr)
 
-    def _partialParseTimeStd(self, s, sourceTime):
+    def _partialParseTimeStd(self, s, sourceTime, m=None):
         """
         test if giving C{s} matched CRE_TIMEHMS, used by L{parse()}
 
@@ -1694,6 +1969,9 @@ class Calendar(object):
         @param s:          date/time text to evaluate
         @type  sourceTime: struct_time
         @param sourceTime: C{struct_time} value to use as the base
+        @type  m:          match object
+        @param m:          match of CRE_TIMEHMS in C{s} if the caller already
+                           found it
 
         @rtype:  tuple
         @return: tuple of remained date/time text, datetime object and
@@ -1704,7 +1982,8 @@ class Calendar(object):
         chunk1 = chunk2 = ''
 
         # HH:MM(:SS) time strings
-        m = self.ptc.CRE_TIMEHMS.search(s)
+        if m is None:
+            m = self.ptc.CRE_TIMEHMS.search(s)
         if m is not None:
 
             if m.group('seconds') is not None:
@@ -1765,16 +2044,40 @@ class Calendar(object):
         )
 
         # Punt
-        time_struct, ret_code = self.parse(
-            datetimeString,
-            sourceTime=sourceTime,
-            version=version)
+        parsed, ctx = self._parseRaw(datetimeString, sourceTime)
 
         # Comments from GHI indicate that it is desired to have the same return
         # signature on this method as that one it punts to, with the exception
         # of using datetime objects instead of time_structs.
-        dt = localize(datetime.datetime(*time_struct[:6]))
-        return dt, ret_code
+        dt = localize(datetime.datetime(*parsed[:6]))
+        return dt, self._flag(ctx, version)
+
+    def parseTimestamp(self, datetimeString, sourceTime=None, version=None):
+        """
+        C{datetimeString} is as C{.parse} and C{sourceTime} as C{.parseDT},
+        but the result is given as seconds since the epoch, as
+        C{time.mktime()} would give for the local time C{.parse} returns.
+
+        @type  datetimeString: string
+        @param datetimeString: date/time text to evaluate
+        @type  sourceTime:     struct_time, datetime, date, time
+        @param sourceTime:     time value to use as the base
+        @type  version:        integer
+        @param version:        style version, default will use L{Calendar}
+                               parameter version value
+
+        @rtype:  tuple
+        @return: tuple of: seconds since the epoch and the result
+                 flag/context
+
+        see .parse for return code details.
+        """
+        sourceTime = getattr(sourceTime, 'timetuple', (lambda: sourceTime))()
+        parsed, ctx = self._parseRaw(datetimeString, sourceTime)
+
+        # leave it to mktime() to work out daylight saving time, as the
+        # fields may have been moved away from those of sourceTime
+        return time.mktime(tuple(parsed[:8]) + (-1,)), self._flag(ctx, version)
 
     def parse(self, datetimeString, sourceTime=None, version=None):
         """
@@ -1812,10 +2115,72 @@ class Calendar(object):
         """
         debug and log.debug('parse()')
 
-        datetimeString = re.sub(r'(\w)\.(\s)', r'\1\2', datetimeString)
-        datetimeString = re.sub(r'(\w)[\'"](\s|$)', r'\1 \2', datetimeString)
-        datetimeString = re.sub(r'(\s|^)[\'"](\w)', r'\1 \2', datetimeString)
+        sourceTime, ctx = self._parseRaw(datetimeString, sourceTime)
+        return self._styled(sourceTime, ctx, version)
+
+    def parseMany(self, datetimeStrings, sourceTime=None, version=None):
+        """
+        Parse each of the given C{datetimeStrings} exactly as L{parse()}
+        would, yielding the results lazily and in order.
+
+        The source time is captured once for the whole batch, so when
+        C{sourceTime} is None every item is evaluated against the same
+        current date/time.  Work that does not depend on the text being
+        parsed is also done only once per batch.
+
+        @type  datetimeStrings: iterable
+        @param datetimeStrings: date/time texts to evaluate
+        @type  sourceTime:      struct_time
+        @param sourceTime:      C{struct_time} value to use as the base
+        @type  version:         integer
+        @param version:         style version, default will use L{Calendar}
+                                parameter version value
+
+        @rtype:  generator
+        @return: generator of tuples of: modified C{sourceTime} and the
+                 result flag/context, see L{parse()}
+        """
+        sourceTime = self._sourceTime(sourceTime)
+        parseRegex = self._localeParseRegex()
+        parseMeths = self._partialParseMethods()
+        parse = self._parse
+        styled = self._styled
+
+        for datetimeString in datetimeStrings:
+            with self._clockScope():
+                result, ctx = parse(datetimeString, sourceTime, parseRegex,
+                                    parseMeths)
+            yield styled(result, ctx, version)
+
+    def compile(self, datetimeString):
+        """
+        Work out once what L{parse()} does with C{datetimeString} so that
+        it can be evaluated against many source times.
+
+        The returned L{pdtPlan} keeps the parts of the text that the
+        date/time patterns picked out and the evaluation steps they go
+        through, C{plan.evaluate(sourceTime)} runs these steps only and
+        gives the same result as C{parse(datetimeString, sourceTime)}::
+
+            plan = cal.compile('next friday at 5pm')
+            for sourceTime in sourceTimes:
+                result, ctx = plan.evaluate(sourceTime)
+
+        @type  datetimeString: string
+        @param datetimeString: date/time text to compile
+
+        @rtype:  L{pdtPlan}
+        @return: the evaluation plan of C{datetimeString}
+        """
+        datetimeString = self._normalize(datetimeString)
+        steps, ctx = _recordPlan(self, datetimeString)
+        return pdtPlan(self, datetimeString, steps, ctx.accuracy)
 
+    def _sourceTime(self, sourceTime):
+        """
+        Validate the C{sourceTime} given to L{parse()}, defaulting to the
+        current local time when it is not set.
+        """
         if sourceTime:
             if isinstance(sourceTime, datetime.datetime):
                 debug and log.debug('coercing datetime to timetuple')
@@ -1825,32 +2190,223 @@ class Calendar(object):
                         not isinstance(sourceTime, tuple):
                     raise ValueError('sourceTime is not a struct_time')
         else:
-            sourceTime = time.localtime()
+            sourceTime = self._now()
+
+        return sourceTime
+
+    def _localeParseRegex(self):
+        """
+        Return the C{parseRegex} function of the locale, or None if the
+        locale does not have one.
+        """
+        return getattr(self.ptc.locale, 'parseRegex', None)
+
+    def _normalize(self, datetimeString):
+        """
+        Drop the periods ending a word and the quotes around a word from
+        the text given to L{parse()}.
+        """
+        datetimeString = _CRE_WORD_PERIOD.sub(r'\1\2', datetimeString)
+        datetimeString = _CRE_QUOTE_AFTER.sub(r'\1 \2', datetimeString)
+        return _CRE_QUOTE_BEFORE.sub(r'\1 \2', datetimeString)
+
+    def _partialParseMethods(self):
+        """
+        Return the C{_partialParse*} methods in the order L{parse()} tries
+        them.
+        """
+        return (self._partialParseModifier,
+                self._partialParseUnits,
+                self._partialParseQUnits,
+                self._partialParseDateStr,
+                self._partialParseDateStd,
+                self._partialParseDayStr,
+                self._partialParseWeekday,
+                self._partialParseTimeStr,
+                self._partialParseMeridian,
+                self._partialParseTimeStd)
+
+    def _dispatchSequential(self, s, sourceTime, parseMeths):
+        """
+        Try each of C{parseMeths} on C{s} in turn and return the result of
+        the first one that matched, see L{DISPATCH_SEQUENTIAL}.
+
+        @rtype:  tuple
+        @return: tuple of remained date/time text, datetime object and
+                 an boolean value to describ if matched or not
+        """
+        for parseMeth in parseMeths:
+            retS, retTime, matched = parseMeth(s, sourceTime)
+            if matched:
+                return retS, retTime, matched
+
+        return s, sourceTime, False
+
+    def _dispatchCombined(self, s, sourceTime, parseMeths):
+        """
+        Same as L{_dispatchSequential()} but finds the first of
+        C{parseMeths} whose pattern matches C{s} by searching for all of
+        them at once, see L{DISPATCH_COMBINED}.
+
+        @rtype:  tuple
+        @return: tuple of remained date/time text, datetime object and
+                 an boolean value to describ if matched or not
+        """
+        ptc = self.ptc
+        first = len(parseMeths)
+
+        m = ptc.combinedPattern(_DISPATCH_KEYS).search(s)
+        if m is not None:
+            first = int(m.lastgroup[1:])
+            pos = m.start()
+            m = getattr(ptc, _DISPATCH_KEYS[first]).match(s, pos)
+
+            # nothing matched before pos, the patterns preferred over the
+            # one found can only match further on
+            for index in range(first):
+                other = getattr(ptc, _DISPATCH_KEYS[index]).search(s,
+                                                                   pos + 1)
+                if other is not None:
+                    first, m = index, other
+                    break
+
+        if first > _DISPATCH_NOW and s in ptc.re_values['now']:
+            # _partialParseTimeStr() accepts 'now' without a pattern match
+            first = _DISPATCH_NOW
+        elif first < len(parseMeths):
+            retS, retTime, matched = parseMeths[first](s, sourceTime, m)
+            if matched:
+                return retS, retTime, matched
+            # declined the match, e.g. a trapped day suffix
+            first += 1
+
+        return self._dispatchSequential(s, sourceTime, parseMeths[first:])
+
+    def _parseRaw(self, datetimeString, sourceTime):
+        """
+        L{_parse()} C{datetimeString} against C{sourceTime} as given to
+        L{parse()}.
+        """
+        with self._clockScope():
+            return self._parse(datetimeString, self._sourceTime(sourceTime),
+                               self._localeParseRegex(),
+                               self._partialParseMethods())
+
+    def _parse(self, datetimeString, sourceTime, parseRegex, parseMeths):
+        """
+        Body of L{parse()} once C{sourceTime} has been validated.
+
+        The date/time is left as the 9-tuple the C{_eval*} methods give
+        back, it is only turned into the value the caller asked for, such
+        as a C{struct_time} by L{_styled()}, once parsing is done.
+
+        @type  parseRegex: callable
+        @param parseRegex: locale specific C{parseRegex} function or None
+        @type  parseMeths: tuple
+        @param parseMeths: as returned by L{_partialParseMethods()}
+
+        @rtype:  tuple
+        @return: tuple of: modified C{sourceTime} and the L{pdtContext}, or
+                 the result of the locale C{parseRegex} if it matched
+        """
+        datetimeString = self._normalize(datetimeString)
+
+        # nested calls must run so that their context updates the parent's
+        cache = self.cache
+        if cache is None or self._ctxStack.stack:
+            sourceTime, ctx = self._parseNormalized(
+                datetimeString, sourceTime, parseRegex, parseMeths)
+        else:
+            ptc = self.ptc
+            key = (self._parseKey(datetimeString, parseRegex),
+                   tuple(sourceTime), ptc.YearParseStyle, ptc.DOWParseStyle,
+                   ptc.CurrentDOWParseStyle, ptc.StartTimeFromSourceTime,
+                   ptc.BirthdayEpoch)
+            result = cache.get(key)
+            if result is None:
+                result = self._parseNormalized(
+                    datetimeString, sourceTime, parseRegex, parseMeths)
+                cache.put(key, result)
+            sourceTime, ctx = result
+            if isinstance(ctx, pdtContext):
+                # hand out copies so callers cannot alter cached entries
+                ctx = pdtContext(ctx.accuracy, ctx.useAccuracy)
+
+        return sourceTime, ctx
+
+    def _styled(self, sourceTime, ctx, version):
+        """
+        Return the result of L{_parse()} as L{parse()} does, a
+        C{struct_time} and the result flag/context in the style of
+        C{version}.
+        """
+        if not isinstance(ctx, pdtContext):
+            # matched by the locale parseRegex
+            return sourceTime, ctx
+
+        if not isinstance(sourceTime, time.struct_time):
+            sourceTime = time.struct_time(sourceTime)
+        return sourceTime, self._flag(ctx, version)
+
+    def _flag(self, ctx, version):
+        """
+        Return the L{pdtContext} of a parse in the style of C{version}.
+        """
+        if not isinstance(ctx, pdtContext):
+            # matched by the locale parseRegex
+            return ctx
+
+        version = self.version if version is None else version
+        if version == VERSION_CONTEXT_STYLE:
+            return ctx
+        else:
+            return ctx.dateTimeFlag
+
+    def _parseKey(self, datetimeString, parseRegex):
+        """
+        Return the part of the normalized C{datetimeString} that the result
+        of L{_parseNormalized()} depends on, texts with the same key parse
+        the same against the same C{sourceTime}.
+        """
+        if parseRegex is None:
+            return datetimeString.lower().strip()
+        return datetimeString
+
+    def _parseNormalized(self, datetimeString, sourceTime, parseRegex,
+                         parseMeths):
+        """
+        Evaluate the normalized C{datetimeString} for L{_parse()}.
 
-        if hasattr(self.ptc.locale, 'parseRegex'):
-            retTime, matched = self.ptc.locale.parseRegex(datetimeString, sourceTime)
+        @rtype:  tuple
+        @return: tuple of: modified C{sourceTime} and the L{pdtContext}, or
+                 the result of C{parseRegex} if it matched
+        """
+        if parseRegex is not None:
+            retTime, matched = parseRegex(datetimeString, sourceTime)
             if matched:
                 return retTime, matched
 
+        if self.prefilter and not self.ptc.couldMatch(datetimeString):
+            debug and log.debug('no date/time words in [%s]', datetimeString)
+            return sourceTime, pdtContext(0, self.ptc.locale.useAccuracy)
+
+        if self.dispatch == DISPATCH_COMBINED:
+            dispatch = self._dispatchCombined
+        else:
+            dispatch = self._dispatchSequential
+
         with self.context() as ctx:
             s = datetimeString.lower().strip()
             debug and log.debug('remainedString (before parsing): [%s]', s)
 
+            retTime = self._evalStrict(s, sourceTime)
+            if retTime is not None:
+                s, sourceTime = '', retTime
+
             while s:
-                for parseMeth in (self._partialParseModifier,
-                                  self._partialParseUnits,
-                                  self._partialParseQUnits,
-                                  self._partialParseDateStr,
-                                  self._partialParseDateStd,
-                                  self._partialParseDayStr,
-                                  self._partialParseWeekday,
-                                  self._partialParseTimeStr,
-                                  self._partialParseMeridian,
-                                  self._partialParseTimeStd):
-                    retS, retTime, matched = parseMeth(s, sourceTime)
-                    if matched:
-                        s, sourceTime = retS.strip(), retTime
-                        break
+                retS, retTime, matched = dispatch(s, sourceTime, parseMeths)
+                if matched:
+                    s, sourceTime = retS.strip(), retTime
                 else:
                     # nothing matched
                     s = ''
@@ -1862,16 +2418,9 @@ class Calendar(object):
             # String is not parsed at all
             if sourceTime is None:
                 debug and log.debug('not parsed [%s]', str(sourceTime))
-                sourceTime = time.localtime()
+                sourceTime = self._now()
 
-        if not isinstance(sourceTime, time.struct_time):
-            sourceTime = time.struct_time(sourceTime)
-
-        version = self.version if version is None else version
-        if version == VERSION_CONTEXT_STYLE:
-            return sourceTime, ctx
-        else:
-            return sourceTime, ctx.dateTimeFlag
+        return sourceTime, ctx
 
     def inc(self, source, month=None, year=None):
         """
@@ -1964,7 +2513,13 @@ class Calendar(object):
                  end_pos as int, matched_text as string) or None if there
                  were no matches
         """
+        with self._clockScope():
+            return self._nlp(inputString, sourceTime, version)
 
+    def _nlp(self, inputString, sourceTime, version):
+        """
+        Body of L{nlp()}.
+        """
         orig_inputstring = inputString
 
         # replace periods at the end of sentences w/ spaces
@@ -1975,70 +2530,98 @@ class Calendar(object):
         inputString = re.sub(r'(\w)(\'|")(\s|$)', r'\1 \3', inputString)
         inputString = re.sub(r'(\s|^)(\'|")(\w)', r'\1 \3', inputString)
 
+        if self.prefilter and not self.ptc.couldMatch(inputString):
+            return None
+
         startpos = 0  # the start position in the inputString during the loop
+        inputLength = len(inputString)
+
+        # every pattern remembers where its next match is so the text is
+        # scanned once per pattern instead of once for every match found,
+        # see L{pdtScanCursor} for how the slice semantics are kept
+        ptc = self.ptc
+        modifierScan = pdtScanCursor(ptc.CRE_MODIFIER, inputString)
+        unitsScan = pdtScanCursor(ptc.CRE_UNITS, inputString)
+        qunitsScan = pdtScanCursor(ptc.CRE_QUNITS, inputString)
+        day2Scan = pdtScanCursor(ptc.CRE_DAY2, inputString, SCAN_FREE)
+        date3Scan = pdtScanCursor(ptc.CRE_DATE3, inputString, SCAN_START)
+        dateScan = pdtScanCursor(ptc.CRE_DATE, inputString, SCAN_START)
+        dayScan = pdtScanCursor(ptc.CRE_DAY, inputString)
+        weekdayScan = pdtScanCursor(ptc.CRE_WEEKDAY, inputString)
+        timeScan = pdtScanCursor(ptc.CRE_TIME, inputString)
+        timeHMS2Scan = pdtScanCursor(ptc.CRE_TIMEHMS2, inputString,
+                                     SCAN_START)
+        timeHMSScan = pdtScanCursor(ptc.CRE_TIMEHMS, inputString, SCAN_START)
+        unitsOnlyScan = pdtScanCursor(ptc.CRE_UNITS_ONLY, inputString)
+        maxDayOffset = max([len(k) for k in ptc.dayOffsets] or [0])
+        prefixMatch = ptc.CRE_NLP_PREFIX.search(inputString)
 
         # list of lists in format:
         # [startpos, endpos, matchedstring, flags, type]
         matches = []
 
-        while startpos < len(inputString):
+        while startpos < inputLength:
 
             # empty match
             leftmost_match = [0, 0, None, 0, None]
 
             # Modifier like next\prev..
-            m = self.ptc.CRE_MODIFIER.search(inputString[startpos:])
+            m, base = modifierScan.search(startpos)
             if m is not None:
                 if leftmost_match[1] == 0 or \
-                        leftmost_match[0] > m.start() + startpos:
-                    leftmost_match[0] = m.start() + startpos
-                    leftmost_match[1] = m.end() + startpos
+                        leftmost_match[0] > m.start() + base:
+                    leftmost_match[0] = m.start() + base
+                    leftmost_match[1] = m.end() + base
                     leftmost_match[2] = m.group()
                     leftmost_match[3] = 0
                     leftmost_match[4] = 'modifier'
 
             # Quantity + Units
-            m = self.ptc.CRE_UNITS.search(inputString[startpos:])
+            m, base = unitsScan.search(startpos)
             if m is not None:
                 debug and log.debug('CRE_UNITS matched')
-                if self._UnitsTrapped(inputString[startpos:], m, 'units'):
+                if self._UnitsTrappedBy(day2Scan.search(startpos)[0],
+                                        m, 'units', base):
                     debug and log.debug('day suffix trapped by unit match')
                 else:
 
                     if leftmost_match[1] == 0 or \
-                            leftmost_match[0] > m.start('qty') + startpos:
-                        leftmost_match[0] = m.start('qty') + startpos
-                        leftmost_match[1] = m.end('qty') + startpos
+                            leftmost_match[0] > m.start('qty') + base:
+                        leftmost_match[0] = m.start('qty') + base
+                        leftmost_match[1] = m.end('qty') + base
                         leftmost_match[2] = m.group('qty')
                         leftmost_match[3] = 3
                         leftmost_match[4] = 'units'
 
-                        if m.start('qty') > 0 and \
-                                inputString[m.start('qty') - 1] == '-':
+                        # the offset of qty is relative to startpos here
+                        qty = m.start('qty') + base - startpos
+                        if qty > 0 and inputString[qty - 1] == '-':
                             leftmost_match[0] = leftmost_match[0] - 1
                             leftmost_match[2] = '-' + leftmost_match[2]
 
             # Quantity + Units
-            m = self.ptc.CRE_QUNITS.search(inputString[startpos:])
+            m, base = qunitsScan.search(startpos)
             if m is not None:
                 debug and log.debug('CRE_QUNITS matched')
-                if self._UnitsTrapped(inputString[startpos:], m, 'qunits'):
+                if self._UnitsTrappedBy(day2Scan.search(startpos)[0],
+                                        m, 'qunits', base):
                     debug and log.debug('day suffix trapped by qunit match')
                 else:
                     if leftmost_match[1] == 0 or \
-                            leftmost_match[0] > m.start('qty') + startpos:
-                        leftmost_match[0] = m.start('qty') + startpos
-                        leftmost_match[1] = m.end('qty') + startpos
+                            leftmost_match[0] > m.start('qty') + base:
+                        leftmost_match[0] = m.start('qty') + base
+                        leftmost_match[1] = m.end('qty') + base
                         leftmost_match[2] = m.group('qty')
                         leftmost_match[3] = 3
                         leftmost_match[4] = 'qunits'
 
-                        if m.start('qty') > 0 and \
-                                inputString[m.start('qty') - 1] == '-':
+                        # the offset of qty is relative to startpos here
+                        qty = m.start('qty') + base - startpos
+                        if qty > 0 and inputString[qty - 1] == '-':
                             leftmost_match[0] = leftmost_match[0] - 1
                             leftmost_match[2] = '-' + leftmost_match[2]
 
-            m = self.ptc.CRE_DATE3.search(inputString[startpos:])
+            m, base = date3Scan.search(startpos)
             # NO LONGER NEEDED, THE REGEXP HANDLED MTHNAME NOW
             # for match in self.ptc.CRE_DATE3.finditer(inputString[startpos:]):
             # to prevent "HH:MM(:SS) time strings" expressions from
@@ -2053,80 +2636,81 @@ class Calendar(object):
             # String date format
             if m is not None:
                 if leftmost_match[1] == 0 or \
-                        leftmost_match[0] > m.start('date') + startpos:
-                    leftmost_match[0] = m.start('date') + startpos
-                    leftmost_match[1] = m.end('date') + startpos
+                        leftmost_match[0] > m.start('date') + base:
+                    leftmost_match[0] = m.start('date') + base
+                    leftmost_match[1] = m.end('date') + base
                     leftmost_match[2] = m.group('date')
                     leftmost_match[3] = 1
                     leftmost_match[4] = 'dateStr'
 
             # Standard date format
-            m = self.ptc.CRE_DATE.search(inputString[startpos:])
+            m, base = dateScan.search(startpos)
             if m is not None:
                 if leftmost_match[1] == 0 or \
-                        leftmost_match[0] > m.start('date') + startpos:
-                    leftmost_match[0] = m.start('date') + startpos
-                    leftmost_match[1] = m.end('date') + startpos
+                        leftmost_match[0] > m.start('date') + base:
+                    leftmost_match[0] = m.start('date') + base
+                    leftmost_match[1] = m.end('date') + base
                     leftmost_match[2] = m.group('date')
                     leftmost_match[3] = 1
                     leftmost_match[4] = 'dateStd'
 
             # Natural language day strings
-            m = self.ptc.CRE_DAY.search(inputString[startpos:])
+            m, base = dayScan.search(startpos)
             if m is not None:
                 if leftmost_match[1] == 0 or \
-                        leftmost_match[0] > m.start() + startpos:
-                    leftmost_match[0] = m.start() + startpos
-                    leftmost_match[1] = m.end() + startpos
+                        leftmost_match[0] > m.start() + base:
+                    leftmost_match[0] = m.start() + base
+                    leftmost_match[1] = m.end() + base
                     leftmost_match[2] = m.group()
                     leftmost_match[3] = 1
                     leftmost_match[4] = 'dayStr'
 
             # Weekday
-            m = self.ptc.CRE_WEEKDAY.search(inputString[startpos:])
+            m, base = weekdayScan.search(startpos)
             if m is not None:
-                if inputString[startpos:] not in self.ptc.dayOffsets:
+                if inputLength - startpos > maxDayOffset or \
+                        inputString[startpos:] not in ptc.dayOffsets:
                     if leftmost_match[1] == 0 or \
-                            leftmost_match[0] > m.start() + startpos:
-                        leftmost_match[0] = m.start() + startpos
-                        leftmost_match[1] = m.end() + startpos
+                            leftmost_match[0] > m.start() + base:
+                        leftmost_match[0] = m.start() + base
+                        leftmost_match[1] = m.end() + base
                         leftmost_match[2] = m.group()
                         leftmost_match[3] = 1
                         leftmost_match[4] = 'weekdy'
 
             # Natural language time strings
-            m = self.ptc.CRE_TIME.search(inputString[startpos:])
+            m, base = timeScan.search(startpos)
             if m is not None:
                 if leftmost_match[1] == 0 or \
-                        leftmost_match[0] > m.start() + startpos:
-                    leftmost_match[0] = m.start() + startpos
-                    leftmost_match[1] = m.end() + startpos
+                        leftmost_match[0] > m.start() + base:
+                    leftmost_match[0] = m.start() + base
+                    leftmost_match[1] = m.end() + base
                     leftmost_match[2] = m.group()
                     leftmost_match[3] = 2
                     leftmost_match[4] = 'timeStr'
 
             # HH:MM(:SS) am/pm time strings
-            m = self.ptc.CRE_TIMEHMS2.search(inputString[startpos:])
+            m, base = timeHMS2Scan.search(startpos)
             if m is not None:
                 if leftmost_match[1] == 0 or \
-                        leftmost_match[0] > m.start('hours') + startpos:
-                    leftmost_match[0] = m.start('hours') + startpos
-                    leftmost_match[1] = m.end('meridian') + startpos
+                        leftmost_match[0] > m.start('hours') + base:
+                    leftmost_match[0] = m.start('hours') + base
+                    leftmost_match[1] = m.end('meridian') + base
                     leftmost_match[2] = inputString[leftmost_match[0]:
                                                     leftmost_match[1]]
                     leftmost_match[3] = 2
                     leftmost_match[4] = 'meridian'
 
             # HH:MM(:SS) time strings
-            m = self.ptc.CRE_TIMEHMS.search(inputString[startpos:])
+            m, base = timeHMSScan.search(startpos)
             if m is not None:
                 if leftmost_match[1] == 0 or \
-                        leftmost_match[0] > m.start('hours') + startpos:
-                    leftmost_match[0] = m.start('hours') + startpos
+                        leftmost_match[0] > m.start('hours') + base:
+                    leftmost_match[0] = m.start('hours') + base
                     if m.group('seconds') is not None:
-                        leftmost_match[1] = m.end('seconds') + startpos
+                        leftmost_match[1] = m.end('seconds') + base
                     else:
-                        leftmost_match[1] = m.end('minutes') + startpos
+                        leftmost_match[1] = m.end('minutes') + base
                     leftmost_match[2] = inputString[leftmost_match[0]:
                                                     leftmost_match[1]]
                     leftmost_match[3] = 2
@@ -2134,19 +2718,18 @@ class Calendar(object):
 
             # Units only; must be preceded by a modifier
             if len(matches) > 0 and matches[-1][3] == 0:
-                m = self.ptc.CRE_UNITS_ONLY.search(inputString[startpos:])
+                m, base = unitsOnlyScan.search(startpos)
                 # Ensure that any match is immediately proceded by the
                 # modifier. "Next is the word 'month'" should not parse as a
                 # date while "next month" should
                 if m is not None and \
-                        inputString[startpos:startpos +
-                                    m.start()].strip() == '':
+                        inputString[startpos:m.start() + base].strip() == '':
                     debug and log.debug('CRE_UNITS_ONLY matched [%s]',
                                         m.group())
                     if leftmost_match[1] == 0 or \
-                            leftmost_match[0] > m.start() + startpos:
-                        leftmost_match[0] = m.start() + startpos
-                        leftmost_match[1] = m.end() + startpos
+                            leftmost_match[0] > m.start() + base:
+                        leftmost_match[0] = m.start() + base
+                        leftmost_match[1] = m.end() + base
                         leftmost_match[2] = m.group()
                         leftmost_match[3] = 3
                         leftmost_match[4] = 'unitsOnly'
@@ -2157,14 +2740,14 @@ class Calendar(object):
             # nothing was detected
             # so break out of the loop
             if startpos == 0:
-                startpos = len(inputString)
+                startpos = inputLength
             else:
                 if leftmost_match[3] > 0:
-                    m = self.ptc.CRE_NLP_PREFIX.search(
-                        inputString[:leftmost_match[0]] +
-                        ' ' + str(leftmost_match[3]))
-                    if m is not None:
-                        leftmost_match[0] = m.start('nlp_prefix')
+                    start = self._nlpPrefixStart(inputString, prefixMatch,
+                                                 leftmost_match[0],
+                                                 leftmost_match[3])
+                    if start is not None:
+                        leftmost_match[0] = start
                         leftmost_match[2] = inputString[leftmost_match[0]:
                                                         leftmost_match[1]]
                 matches.append(leftmost_match)
@@ -2193,12 +2776,10 @@ class Calendar(object):
                     if date or time or units:
                         combined = orig_inputstring[matches[from_match_index]
                                                     [0]:matches[i - 1][1]]
-                        parsed_datetime, flags = self.parse(combined,
-                                                            sourceTime,
-                                                            version)
+                        parsed, ctx = self._parseRaw(combined, sourceTime)
                         proximity_matches.append((
-                            datetime.datetime(*parsed_datetime[:6]),
-                            flags,
+                            datetime.datetime(*parsed[:6]),
+                            self._flag(ctx, version),
                             matches[from_match_index][0],
                             matches[i - 1][1],
                             combined))
@@ -2221,11 +2802,10 @@ class Calendar(object):
             if date or time or units:
                 combined = orig_inputstring[matches[from_match_index][0]:
                                             matches[len(matches) - 1][1]]
-                parsed_datetime, flags = self.parse(combined, sourceTime,
-                                                    version)
+                parsed, ctx = self._parseRaw(combined, sourceTime)
                 proximity_matches.append((
-                    datetime.datetime(*parsed_datetime[:6]),
-                    flags,
+                    datetime.datetime(*parsed[:6]),
+                    self._flag(ctx, version),
                     matches[from_match_index][0],
                     matches[len(matches) - 1][1],
                     combined))
@@ -2237,17 +2817,154 @@ class Calendar(object):
                 return None
             else:
                 combined = orig_inputstring[matches[0][0]:matches[0][1]]
-                parsed_datetime, flags = self.parse(matches[0][2], sourceTime,
-                                                    version)
+                parsed, ctx = self._parseRaw(matches[0][2], sourceTime)
                 proximity_matches.append((
-                    datetime.datetime(*parsed_datetime[:6]),
-                    flags,
+                    datetime.datetime(*parsed[:6]),
+                    self._flag(ctx, version),
                     matches[0][0],
                     matches[0][1],
                     combined))
 
         return tuple(proximity_matches)
 
+    def nlpStream(self, source, sourceTime=None, version=None,
+                  chunkSize=65536, window=256):
+        """
+        Evaluate L{nlp()} over text read piece by piece from C{source},
+        yielding each match as soon as it is known to be complete.
+
+        The text is processed in buffers of about C{chunkSize} characters.
+        Matches ending within the last C{window} characters of a buffer
+        might still grow or be grouped with text that was not read yet, so
+        they are carried over and evaluated again with the next buffer,
+        together with up to C{window} characters before them.  Only that
+        text is kept in memory between buffers.
+
+        The results are the same as those of L{nlp()} over the whole text
+        as long as no date/time expression, or whitespace between the parts
+        of one, is longer than C{window}, and the text has no 'at', 'in' or
+        'on' followed by a digit, as in 'in 3 days'.  L{nlp()} moves the
+        start of the later matches back to the first of those words in the
+        whole text, which groups them with text that may be further back
+        than the stream keeps, so the results can then differ.
+
+        The source time is captured once for the whole stream, so when
+        C{sourceTime} is None every match is evaluated against the same
+        current date/time.
+
+        @type  source:     file or iterable
+        @param source:     object with a C{read()} method, iterable of text
+                           chunks or a string
+        @type  sourceTime: struct_time
+        @param sourceTime: C{struct_time} value to use as the base
+        @type  version:    integer
+        @param version:    style version, default will use L{Calendar}
+                           parameter version value
+        @type  chunkSize:  integer
+        @param chunkSize:  number of characters read at once
+        @type  window:     integer
+        @param window:     number of characters carried over between
+                           buffers, must be less than C{chunkSize}
+
+        @rtype:  generator
+        @return: generator of tuples in the format returned by L{nlp()},
+                 with C{start_pos} and C{end_pos} counted from the start
+                 of the whole text
+        """
+        if window < 1 or chunkSize <= window:
+            raise ValueError('window must be at least 1 and less than '
+                             'chunkSize')
+
+        sourceTime = self._sourceTime(sourceTime)
+        offset = 0     # position of buffer in the whole text
+        skip = 0       # matches starting before it were yielded already
+        buffer = ''
+
+        pending = []
+        pendingLength = 0
+        chunks = _iterChunks(source, chunkSize)
+        while True:
+            # collect at least chunkSize characters, or the rest of the text
+            atEnd = True
+            for chunk in chunks:
+                pending.append(chunk)
+                pendingLength += len(chunk)
+                if len(buffer) + pendingLength >= chunkSize:
+                    atEnd = False
+                    break
+            buffer += ''.join(pending)
+            pending = []
+            pendingLength = 0
+
+            results = self.nlp(buffer, sourceTime, version) or ()
+            first = skip - offset
+            if atEnd:
+                for dt, flags, start, end, text in results:
+                    if start >= first:
+                        yield dt, flags, start + offset, end + offset, text
+                return
+
+            limit = len(buffer) - window
+            cut = limit
+            for dt, flags, start, end, text in results:
+                if start < first:
+                    continue
+                if end > limit:
+                    cut = max(min(start, limit), first)
+                    break
+                yield dt, flags, start + offset, end + offset, text
+
+            # nlp() finds the matches from left to right and groups them
+            # with the ones before, so the text before the cut is evaluated
+            # again, starting at a word, for the matches to fall into place
+            keep = max(cut - window, 0)
+            lowest = max(keep - window, 0)
+            while keep > lowest and not buffer[keep - 1].isspace():
+                keep -= 1
+
+            buffer = buffer[keep:]
+            skip = offset + cut
+            offset += keep
+
+
+try:
+    _stringTypes = (str, unicode)
+    _unichr = unichr
+except NameError:  # Python 3
+    _stringTypes = (str,)
+    _unichr = chr
+
+
+_bmp = []
+
+
+def _bmpChars():
+    """
+    Return a string of all characters of the basic multilingual plane
+    outside of ASCII, made on first use.
+    """
+    if not _bmp:
+        _bmp.append(''.join(map(_unichr, range(0x80, 0x10000))))
+    return _bmp[0]
+
+
+def _iterChunks(source, chunkSize):
+    """
+    Yield the text of C{source} in pieces, see L{Calendar.nlpStream()}.
+    """
+    if isinstance(source, _stringTypes):
+        for start in range(0, len(source), chunkSize):
+            yield source[start:start + chunkSize]
+    elif hasattr(source, 'read'):
+        while True:
+            chunk = source.read(chunkSize)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        for chunk in source:
+            yield chunk
+
 
 def _initSymbols(ptc):
     """
@@ -2270,6 +2987,11 @@ def _initSymbols(ptc):
                            lxm, lxm[0], '{0}.{1}.'.format(*lxm)))
 
 
+# Constants.shared() instances keyed by class and constructor arguments
+_sharedConstants = {}
+_sharedConstantsLock = threading.Lock()
+
+
 class Constants(object):
 
     """
@@ -2285,10 +3007,17 @@ class Constants(object):
 
     if PyICU is not present or not requested, only the locales defined by
     C{pdtLocales} will be searched.
+
+    The C{CRE_*} patterns are compiled the first time they are used, so
+    that C{cre_source} can still be adjusted after construction.  Pass
+    C{precompile=True} to compile all of them up front instead.
+
+    Building an instance is not cheap, use L{Constants.shared()} to get a
+    frozen instance that can be handed to any number of L{Calendar}s.
     """
 
     def __init__(self, localeID=None, usePyICU=True,
-                 fallbackLocales=['en_US']):
+                 fallbackLocales=['en_US'], precompile=False):
         self.localeID = localeID
         self.fallbackLocales = fallbackLocales[:]
 
@@ -2299,11 +3028,6 @@ class Constants(object):
         self.locale = None
         self.usePyICU = usePyICU
 
-        # starting cache of leap years
-        # daysInMonth will add to this if during
-        # runtime it gets a request for a year not found
-        self._leapYears = list(range(1904, 2097, 4))
-
         self.Second = 1
         self.Minute = 60  # 60 * self.Second
         self.Hour = 3600  # 60 * self.Minute
@@ -2414,33 +3138,39 @@ class Constants(object):
             def re_join(g):
                 return '|'.join(re.escape(i) for i in g)
 
+            # work on copies, the locale data is shared by every instance
+            # and by the other locales it was derived from
+            self.re_values = dict(self.locale.re_values)
+            self.WeekdayOffsets = dict(self.locale.WeekdayOffsets)
+            self.MonthOffsets = dict(self.locale.MonthOffsets)
+
             mths = _getLocaleDataAdjusted(self.locale.Months)
             smths = _getLocaleDataAdjusted(self.locale.shortMonths)
             swds = _getLocaleDataAdjusted(self.locale.shortWeekdays)
             wds = _getLocaleDataAdjusted(self.locale.Weekdays)
 
             # escape any regex special characters that may be found
-            self.locale.re_values['months'] = re_join(mths)
-            self.locale.re_values['shortmonths'] = re_join(smths)
-            self.locale.re_values['days'] = re_join(wds)
-            self.locale.re_values['shortdays'] = re_join(swds)
-            self.locale.re_values['dayoffsets'] = \
+            self.re_values['months'] = re_join(mths)
+            self.re_values['shortmonths'] = re_join(smths)
+            self.re_values['days'] = re_join(wds)
+            self.re_values['shortdays'] = re_join(swds)
+            self.re_values['dayoffsets'] = \
                 re_join(self.locale.dayOffsets)
-            self.locale.re_values['numbers'] = \
+            self.re_values['numbers'] = \
                 re_join(self.locale.numbers)
-            self.locale.re_values['decimal_mark'] = \
+            self.re_values['decimal_mark'] = \
                 re.escape(self.locale.decimal_mark)
 
             units = [unit for units in self.locale.units.values()
                      for unit in units]  # flatten
             units.sort(key=len, reverse=True)  # longest first
-            self.locale.re_values['units'] = re_join(units)
-            self.locale.re_values['modifiers'] = re_join(self.locale.Modifiers)
-            self.locale.re_values['sources'] = re_join(self.locale.re_sources)
+            self.re_values['units'] = re_join(units)
+            self.re_values['modifiers'] = re_join(self.locale.Modifiers)
+            self.re_values['sources'] = re_join(self.locale.re_sources)
 
             # For distinguishing numeric dates from times, look for timeSep
             # and meridian, if specified in the locale
-            self.locale.re_values['timecomponents'] = \
+            self.re_values['timecomponents'] = \
                 re_join(self.locale.timeSep + self.locale.meridian)
 
             # build weekday offsets - yes, it assumes the Weekday and
@@ -2456,17 +3186,37 @@ class Constants(object):
                         offsetDict[key] = o
                     o += 1
 
-            _buildOffsets(self.locale.WeekdayOffsets,
-                          self.locale.Weekdays, 0)
-            _buildOffsets(self.locale.WeekdayOffsets,
-                          self.locale.shortWeekdays, 0)
+            _buildOffsets(self.WeekdayOffsets, self.locale.Weekdays, 0)
+            _buildOffsets(self.WeekdayOffsets, self.locale.shortWeekdays, 0)
 
             # build month offsets - yes, it assumes the Months and shortMonths
             # lists are in the same order and Jan..Dec
-            _buildOffsets(self.locale.MonthOffsets,
-                          self.locale.Months, 1)
-            _buildOffsets(self.locale.MonthOffsets,
-                          self.locale.shortMonths, 1)
+            _buildOffsets(self.MonthOffsets, self.locale.Months, 1)
+            _buildOffsets(self.MonthOffsets, self.locale.shortMonths, 1)
+
+            # RFC 822 dates use the English month names, other locales
+            # read the same text differently, see Calendar._evalStrict()
+            self.englishMonths = all(
+                self.MonthOffsets.get(name) == month
+                for month, name in enumerate(_RFC822_MONTHS, 1))
+
+            # reverse index of the unit aliases, "mins" --> "minutes", and
+            # the accuracy flag each of them sets
+            self.unitAliases = {}
+            self.unitAccuracy = {}
+            for unit, aliases in self.locale.units.items():
+                acc = pdtContext._ACCURACY_REVERSE_MAPPING.get(unit)
+                for alias in aliases:
+                    if alias not in self.unitAliases:
+                        self.unitAliases[alias] = unit
+                        if acc is not None:
+                            self.unitAccuracy[alias] = acc
+
+            # copy the rest of the locale data so that reading it is a plain
+            # attribute lookup instead of a trip through __getattr__
+            for name in self.locale.locale_keys:
+                if name not in self.__dict__ and hasattr(self.locale, name):
+                    setattr(self, name, getattr(self.locale, name))
 
         _initSymbols(self)
 
@@ -2490,7 +3240,7 @@ class Constants(object):
                                         (\d\d)?
                                     )?
                                 )
-                            )'''.format(**self.locale.re_values)
+                            )'''.format(**self.re_values)
 
         # still not completely sure of the behavior of the regex and
         # whether it would be best to consume all possible irrelevant
@@ -2516,7 +3266,7 @@ class Constants(object):
                                     (?!\s*(?:{timecomponents}))
                                 ){{1,3}}
                                 (?(mthname)|$-^)
-                            )'''.format(**self.locale.re_values)
+                            )'''.format(**self.re_values)
 
         # not being used in code, but kept in case others are manually
         # utilizing this regex for their own purposes
@@ -2531,38 +3281,42 @@ class Constants(object):
                                     )?
                                 )
                             )
-                            (?=\s+|$|[^\w])'''.format(**self.locale.re_values)
+                            (?=\s+|$|[^\w])'''.format(**self.re_values)
 
         self.RE_WEEKDAY = r'''\b
                               (?:
                                   {days}|{shortdays}
                               )
-                              \b'''.format(**self.locale.re_values)
+                              \b'''.format(**self.re_values)
 
         self.RE_NUMBER = (r'(\b(?:{numbers})\b|\d+(?:{decimal_mark}\d+|))'
-                          .format(**self.locale.re_values))
+                          .format(**self.re_values))
 
-        self.RE_SPECIAL = (r'(?P<special>^[{specials}]+)\s+'
-                           .format(**self.locale.re_values))
+        if self.re_values['specials']:
+            self.RE_SPECIAL = (r'(?P<special>^[{specials}]+)\s+'
+                               .format(**self.re_values))
+        else:
+            # a character set cannot be empty, match nothing instead
+            self.RE_SPECIAL = r'(?P<special>(?!))'
 
         self.RE_UNITS_ONLY = (r'''\b({units})\b'''
-                              .format(**self.locale.re_values))
+                              .format(**self.re_values))
 
         self.RE_UNITS = r'''\b(?P<qty>
                                 -?
                                 (?:\d+(?:{decimal_mark}\d+|)|(?:{numbers})\b)\s*
                                 (?P<units>{units})
-                            )\b'''.format(**self.locale.re_values)
+                            )\b'''.format(**self.re_values)
 
         self.RE_QUNITS = r'''\b(?P<qty>
                                  -?
                                  (?:\d+(?:{decimal_mark}\d+|)|(?:{numbers})\s+)\s*
                                  (?P<qunits>{qunits})
-                             )\b'''.format(**self.locale.re_values)
+                             )\b'''.format(**self.re_values)
 
         self.RE_MODIFIER = r'''\b(?:
                                    {modifiers}
-                               )\b'''.format(**self.locale.re_values)
+                               )\b'''.format(**self.re_values)
 
         self.RE_TIMEHMS = r'''([\s(\["'-]|^)
                               (?P<hours>\d\d?)
@@ -2572,7 +3326,7 @@ class Constants(object):
                                   (?P<seconds>\d\d
                                       (?:[\.,]\d+)?
                                   )
-                              )?\b'''.format(**self.locale.re_values)
+                              )?\b'''.format(**self.re_values)
 
         self.RE_TIMEHMS2 = r'''([\s(\["'-]|^)
                                (?P<hours>\d\d?)
@@ -2584,7 +3338,7 @@ class Constants(object):
                                            (?:[\.,]\d+)?
                                        )
                                    )?
-                               )?'''.format(**self.locale.re_values)
+                               )?'''.format(**self.re_values)
 
         # 1, 2, and 3 here refer to the type of match date, time, or units
         self.RE_NLP_PREFIX = r'''\b(?P<nlp_prefix>
@@ -2598,9 +3352,9 @@ class Constants(object):
                                   (\s)+3
                                  )'''
 
-        if 'meridian' in self.locale.re_values:
+        if 'meridian' in self.re_values:
             self.RE_TIMEHMS2 += (r'\s*(?P<meridian>{meridian})\b'
-                                 .format(**self.locale.re_values))
+                                 .format(**self.re_values))
         else:
             self.RE_TIMEHMS2 += r'\b'
 
@@ -2618,23 +3372,23 @@ class Constants(object):
 
         self.RE_DATE2 = r'[{0}]'.format(dateSeps)
 
-        assert 'dayoffsets' in self.locale.re_values
+        assert 'dayoffsets' in self.re_values
 
         self.RE_DAY = r'''\b
                           (?:
                               {dayoffsets}
                           )
-                          \b'''.format(**self.locale.re_values)
+                          \b'''.format(**self.re_values)
 
         self.RE_DAY2 = r'''(?P<day>\d\d?)
                            (?P<suffix>{daysuffix})?
-                       '''.format(**self.locale.re_values)
+                       '''.format(**self.re_values)
 
         self.RE_TIME = r'''\b
                            (?:
                                {sources}
                            )
-                           \b'''.format(**self.locale.re_values)
+                           \b'''.format(**self.re_values)
 
         self.RE_REMAINING = r'\s+'
 
@@ -2643,17 +3397,17 @@ class Constants(object):
                                (\d\d?){timeseparator}
                                (\d\d)
                                ({timeseparator}(\d\d))?
-                               (\s*|$)'''.format(**self.locale.re_values)
+                               (\s*|$)'''.format(**self.re_values)
 
         self.RE_RTIMEHMS2 = (r'''(\s*|^)
                                  (\d\d?)
                                  ({timeseparator}(\d\d?))?
                                  ({timeseparator}(\d\d?))?'''
-                             .format(**self.locale.re_values))
+                             .format(**self.re_values))
 
-        if 'meridian' in self.locale.re_values:
+        if 'meridian' in self.re_values:
             self.RE_RTIMEHMS2 += (r'\s*({meridian})'
-                                  .format(**self.locale.re_values))
+                                  .format(**self.re_values))
 
         self.RE_RDATE = r'(\d+([%s]\d+)+)' % dateSeps
         self.RE_RDATE3 = r'''(
@@ -2667,35 +3421,35 @@ class Constants(object):
                                     )?
                                     (,\s*\d{{4}})?
                                 )
-                            )'''.format(**self.locale.re_values)
+                            )'''.format(**self.re_values)
 
         # "06/07/06 - 08/09/06"
         self.DATERNG1 = (r'{0}\s*{rangeseparator}\s*{0}'
-                         .format(self.RE_RDATE, **self.locale.re_values))
+                         .format(self.RE_RDATE, **self.re_values))
 
         # "march 31 - june 1st, 2006"
         self.DATERNG2 = (r'{0}\s*{rangeseparator}\s*{0}'
-                         .format(self.RE_RDATE3, **self.locale.re_values))
+                         .format(self.RE_RDATE3, **self.re_values))
 
         # "march 1rd -13th"
         self.DATERNG3 = (r'{0}\s*{rangeseparator}\s*(\d\d?)\s*(rd|st|nd|th)?'
-                         .format(self.RE_RDATE3, **self.locale.re_values))
+                         .format(self.RE_RDATE3, **self.re_values))
 
         # "4:00:55 pm - 5:90:44 am", '4p-5p'
         self.TIMERNG1 = (r'{0}\s*{rangeseparator}\s*{0}'
-                         .format(self.RE_RTIMEHMS2, **self.locale.re_values))
+                         .format(self.RE_RTIMEHMS2, **self.re_values))
 
         self.TIMERNG2 = (r'{0}\s*{rangeseparator}\s*{0}'
-                         .format(self.RE_RTIMEHMS, **self.locale.re_values))
+                         .format(self.RE_RTIMEHMS, **self.re_values))
 
         # "4-5pm "
         self.TIMERNG3 = (r'\d\d?\s*{rangeseparator}\s*{0}'
-                         .format(self.RE_RTIMEHMS2, **self.locale.re_values))
+                         .format(self.RE_RTIMEHMS2, **self.re_values))
 
         # "4:30-5pm "
         self.TIMERNG4 = (r'{0}\s*{rangeseparator}\s*{1}'
                          .format(self.RE_RTIMEHMS, self.RE_RTIMEHMS2,
-                                 **self.locale.re_values))
+                                 **self.re_values))
 
         self.re_option = re.IGNORECASE + re.VERBOSE
         self.cre_source = {'CRE_SPECIAL': self.RE_SPECIAL,
@@ -2729,36 +3483,201 @@ class Constants(object):
                            'CRE_DATERNG3': self.DATERNG3,
                            'CRE_NLP_PREFIX': self.RE_NLP_PREFIX}
         self.cre_keys = set(self.cre_source.keys())
+        self._combined = {}
+
+        if precompile:
+            self.compile()
+
+    @classmethod
+    def shared(cls, localeID=None, usePyICU=True, fallbackLocales=['en_US']):
+        """
+        Return the process wide instance for the given arguments, creating
+        it on first use.
+
+        The instance has all of its patterns compiled and is frozen with
+        L{freeze()}, so it can be used by several L{Calendar}s and threads
+        at the same time.  Settings like C{DOWParseStyle} cannot be changed
+        on it, create a separate instance for that.
+
+        @type  localeID:        string
+        @param localeID:        see L{Constants}
+        @type  usePyICU:        boolean
+        @param usePyICU:        see L{Constants}
+        @type  fallbackLocales: list
+        @param fallbackLocales: see L{Constants}
+
+        @rtype:  object
+        @return: shared L{Constants} instance
+        """
+        key = (cls, localeID, usePyICU, tuple(fallbackLocales))
+        try:
+            return _sharedConstants[key]
+        except KeyError:
+            pass
+
+        with _sharedConstantsLock:
+            ptc = _sharedConstants.get(key)
+            if ptc is None:
+                ptc = cls(localeID, usePyICU, list(fallbackLocales))
+                ptc.freeze()
+                _sharedConstants[key] = ptc
+        return ptc
+
+    def compile(self):
+        """
+        Compile all of the C{CRE_*} patterns now instead of on first use,
+        along with the word list of L{couldMatch()}.
+        """
+        for name in self.cre_keys:
+            getattr(self, name)
+        self._prefilter
+
+    def freeze(self):
+        """
+        Compile all patterns and refuse any further attribute changes.
+        Mutable values such as C{re_values} must be left alone as well.
+        """
+        self.compile()
+        self._frozen = True
+
+    def __setattr__(self, name, value):
+        if self.__dict__.get('_frozen'):
+            raise AttributeError('%s is frozen and cannot be changed, '
+                                 'create a new Constants instead' % name)
+        object.__setattr__(self, name, value)
 
     def __getattr__(self, name):
         if name in self.cre_keys:
             value = re.compile(self.cre_source[name], self.re_option)
             setattr(self, name, value)
             return value
+        elif name == '_prefilter':
+            value = self._buildPrefilter()
+            setattr(self, name, value)
+            return value
         elif name in self.locale.locale_keys:
             return getattr(self.locale, name)
         else:
             raise AttributeError(name)
 
+    def couldMatch(self, text):
+        """
+        Tell if any of the patterns L{Calendar.parse()} and
+        L{Calendar.nlp()} look for might match C{text}.
+
+        Every text those patterns match has a digit in it or one of the
+        words of their sources, such as month, weekday, modifier and unit
+        names.  The words of patterns that only match whole words, the ones
+        using C{\\b}, are looked up among the words of C{text}, the others
+        anywhere in it.  Texts with none of them are ruled out without
+        running the patterns.
+
+        @type  text: string
+        @param text: text to check
+
+        @rtype:  boolean
+        @return: False if none of the patterns can match C{text}
+        """
+        if _CRE_DIGIT.search(text) is not None:
+            return True
+        words, pieces, fold = self._prefilter
+        text = text.lower()
+        if fold is not None and fold[0].search(text) is not None:
+            text = text.translate(fold[1])
+        if pieces is not None and pieces.search(text) is not None:
+            return True
+        return not words.isdisjoint(_CRE_LETTERS.findall(text))
+
+    def _buildPrefilter(self):
+        """
+        Collect the words of L{couldMatch()} from the C{cre_source} of the
+        patterns and find the letters the patterns take for theirs.
+        """
+        words = set()
+        pieces = set()
+        for key in _PREFILTER_KEYS:
+            source = self.cre_source[key]
+            found = _CRE_LETTERS.findall(
+                _CRE_SOURCE_SYNTAX.sub(' ', source).lower())
+            if '\\b' in source:
+                words.update(found)
+            else:
+                pieces.update(found)
+        # _partialParseTimeStr() also takes these without a pattern match
+        for value in self.re_values['now']:
+            words.update(_CRE_LETTERS.findall(value.lower()))
+
+        letters = frozenset(''.join(words) + ''.join(pieces))
+        if pieces:
+            pieces = re.compile('|'.join(map(re.escape, sorted(pieces))),
+                                re.UNICODE)
+        else:
+            pieces = None
+
+        key = (letters, self.re_option)
+        fold = _prefilterFolds.get(key)
+        if key not in _prefilterFolds:
+            table = {}
+            cre = re.compile('[%s]' % re.escape(''.join(sorted(letters))),
+                             self.re_option)
+            for char in set(cre.findall(_bmpChars())):
+                if char in letters or char.lower() in letters:
+                    continue
+                for letter in letters:
+                    if re.match(re.escape(letter), char, self.re_option):
+                        table[ord(char)] = letter
+                        break
+            if table:
+                fold = (re.compile('[%s]' % re.escape(''.join(
+                    sorted(map(_unichr, table)))), re.UNICODE), table)
+            _prefilterFolds[key] = fold
+
+        return frozenset(words), pieces, fold
+
+    def combinedPattern(self, keys):
+        """
+        Return a compiled pattern that matches wherever one of the patterns
+        named by C{keys} matches.  The name of the last group of a match,
+        C{'d'} followed by an index into C{keys}, tells which one did, the
+        first of C{keys} winning when several match at the same position.
+
+        Groups of the patterns are renamed to keep them apart, match the
+        original pattern at the same position to get at them.
+
+        @type  keys: tuple
+        @param keys: names of patterns in C{cre_source}
+
+        @rtype:  compiled regular expression
+        @return: combined pattern, compiled on first use
+        """
+        try:
+            return self._combined[keys]
+        except KeyError:
+            pass
+
+        alternatives = []
+        for index, key in enumerate(keys):
+            prefix = 'd%d_' % index
+            source = _CRE_GROUP_NAME.sub(
+                lambda m: '(?%s%s%s' % (m.group(1), prefix, m.group(2)),
+                self.cre_source[key])
+            alternatives.append('(?P<d%d>\n%s\n)' % (index, source))
+
+        value = re.compile('|'.join(alternatives), self.re_option)
+        self._combined[keys] = value
+        return value
+
     def daysInMonth(self, month, year):
         """
         Take the given month (1-12) and a given year (4 digit) return
         the number of days in the month adjusting for leap year as needed
         """
-        result = None
         debug and log.debug('daysInMonth(%s, %s)', month, year)
+        if month == 2:
+            return 29 if calendar.isleap(year) else 28
         if month > 0 and month <= 12:
-            result = self._DaysInMonthList[month - 1]
-
-            if month == 2:
-                if year in self._leapYears:
-                    result += 1
-                else:
-                    if calendar.isleap(year):
-                        self._leapYears.append(year)
-                        result += 1
-
-        return result
+            return self._DaysInMonthList[month - 1]
+        return None
 
     def getSource(self, sourceKey, sourceTime=None):
         """
@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+"""
+parsedatetime/aio.py
+
+Coroutine versions of the L{Calendar<parsedatetime.Calendar>} methods that
+do the parsing in an executor so they do not block the event loop
+
+Requires Python 3.5 or later, the module is not importable on Python 2
+"""
+from __future__ import absolute_import, unicode_literals
+
+import asyncio
+import functools
+
+from concurrent.futures import ProcessPoolExecutor
+
+from . import Calendar, Constants
+from .parallel import _workerCalendar
+
+# asyncio.get_running_loop() is new in Python 3.7, before that
+# get_event_loop() returns the running loop when called from a coroutine
+_runningLoop = getattr(asyncio, 'get_running_loop', asyncio.get_event_loop)
+
+
+def _runBatch(calendar, calls):
+    """
+    Call C{calendar.name(*args)} for each C{(name, args)} of C{calls},
+    returning a C{(True, result)} or C{(False, exception)} tuple for each.
+    """
+    results = []
+    for name, args in calls:
+        try:
+            results.append((True, getattr(calendar, name)(*args)))
+        except Exception as e:
+            results.append((False, e))
+    return results
+
+
+def _runWorkerBatch(config, calls):
+    return _runBatch(_workerCalendar(config), calls)
+
+
+class AsyncCalendar(object):
+
+    """
+    Asyncio facade of a L{Calendar<parsedatetime.Calendar>}.
+
+    L{parse()}, L{parseDT()}, L{parseTimestamp()}, L{nlp()} and
+    L{evalRanges()} are coroutines taking the same arguments as the
+    L{Calendar<parsedatetime.Calendar>} methods.  The calls are queued and sent to C{executor} in batches of up
+    to C{batchSize}, so that many small requests share the cost of one
+    dispatch, and at most C{maxInFlight} calls are queued or running at any
+    time, further calls wait for a slot::
+
+        acal = AsyncCalendar(version=VERSION_CONTEXT_STYLE)
+        result = await acal.nlp(payload)
+
+    With a C{concurrent.futures.ProcessPoolExecutor} each worker process
+    builds its own L{Calendar<parsedatetime.Calendar>} from C{localeID},
+    C{usePyICU} and C{calendarArgs}, with any other executor, or None for
+    the default executor of the event loop, the calls run in a thread on
+    L{calendar}.
+
+    The executor is not shut down by L{aclose()}, it belongs to the caller.
+    The same instance can be used by one event loop after the other, for
+    example by several C{asyncio.run()} calls, but not by two event loops
+    at the same time.
+    """
+
+    def __init__(self, localeID=None, usePyICU=True, executor=None,
+                 maxInFlight=64, batchSize=16, batchDelay=0,
+                 **calendarArgs):
+        """
+        @type  localeID:     string
+        @param localeID:     locale of the L{Constants} used
+        @type  usePyICU:     boolean
+        @param usePyICU:     passed on to L{Constants}
+        @type  executor:     concurrent.futures.Executor
+        @param executor:     executor to parse in, None for the default
+                             executor of the event loop
+        @type  maxInFlight:  integer
+        @param maxInFlight:  number of calls that can be queued or running
+                             at the same time
+        @type  batchSize:    integer
+        @param batchSize:    largest number of calls sent to the executor
+                             at once
+        @type  batchDelay:   float
+        @param batchDelay:   seconds to wait for more calls before sending
+                             a batch that is not full, 0 to send it as soon
+                             as the event loop gets to it
+        @param calendarArgs: keyword arguments for L{Calendar}, such as
+                             C{version}
+
+        @rtype:  object
+        @return: L{AsyncCalendar} instance
+        """
+        if maxInFlight < 1 or batchSize < 1:
+            raise ValueError('maxInFlight and batchSize must be at least 1')
+
+        self.executor = executor
+        self.maxInFlight = maxInFlight
+        self.batchSize = batchSize
+        self.batchDelay = batchDelay
+
+        if isinstance(executor, ProcessPoolExecutor):
+            self.calendar = None
+            config = (localeID, usePyICU,
+                      tuple(sorted(calendarArgs.items())))
+            self._run = functools.partial(_runWorkerBatch, config)
+        else:
+            self.calendar = Calendar(Constants.shared(localeID, usePyICU),
+                                     **calendarArgs)
+            self._run = functools.partial(_runBatch, self.calendar)
+
+        # created by _attach() so that they belong to the running loop
+        self._loop = None
+        self._slots = None
+        self._batch = []
+        self._flushHandle = None
+        self._running = set()
+
+    def _attach(self):
+        """
+        Return the running event loop, setting up the queue and the slots
+        again when it is not the loop they were made for.
+        """
+        loop = _runningLoop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._slots = asyncio.Semaphore(self.maxInFlight)
+            self._batch = []
+            self._flushHandle = None
+            self._running = set()
+        return loop
+
+    async def _call(self, name, *args):
+        loop = self._attach()
+
+        async with self._slots:
+            future = loop.create_future()
+            self._batch.append((name, args, future))
+            if len(self._batch) >= self.batchSize:
+                self._flush(loop)
+            elif self._flushHandle is None:
+                if self.batchDelay:
+                    self._flushHandle = loop.call_later(self.batchDelay,
+                                                        self._flush, loop)
+                else:
+                    self._flushHandle = loop.call_soon(self._flush, loop)
+            return await future
+
+    def _flush(self, loop):
+        """
+        Send the queued calls to the executor.
+        """
+        if self._flushHandle is not None:
+            self._flushHandle.cancel()
+            self._flushHandle = None
+
+        batch, self._batch = self._batch, []
+        if not batch:
+            return
+
+        calls = [(name, args) for name, args, future in batch]
+        running = loop.run_in_executor(self.executor, self._run, calls)
+        self._running.add(running)
+        running.add_done_callback(
+            functools.partial(self._deliver, batch))
+
+    def _deliver(self, batch, running):
+        self._running.discard(running)
+        if running.cancelled():
+            for name, args, future in batch:
+                future.cancel()
+            return
+
+        error = running.exception()
+        for index, (name, args, future) in enumerate(batch):
+            # the caller may have stopped waiting
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+                continue
+            ok, value = running.result()[index]
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+    async def aclose(self):
+        """
+        Send the queued calls and wait until all calls are done.
+        """
+        loop = self._attach()
+        if self._batch:
+            self._flush(loop)
+        if self._running:
+            await asyncio.wait(list(self._running))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, excType, excValue, traceback):
+        await self.aclose()
+
+    async def parse(self, datetimeString, sourceTime=None, version=None):
+        """
+        Coroutine version of L{Calendar.parse()}.
+        """
+        return await self._call('parse', datetimeString, sourceTime,
+                                version)
+
+    async def parseDT(self, datetimeString, sourceTime=None, tzinfo=None,
+                      version=None):
+        """
+        Coroutine version of L{Calendar.parseDT()}.
+        """
+        return await self._call('parseDT', datetimeString, sourceTime,
+                                tzinfo, version)
+
+    async def parseTimestamp(self, datetimeString, sourceTime=None,
+                             version=None):
+        """
+        Coroutine version of L{Calendar.parseTimestamp()}.
+        """
+        return await self._call('parseTimestamp', datetimeString, sourceTime,
+                                version)
+
+    async def nlp(self, inputString, sourceTime=None, version=None):
+        """
+        Coroutine version of L{Calendar.nlp()}.
+        """
+        return await self._call('nlp', inputString, sourceTime, version)
+
+    async def evalRanges(self, datetimeString, sourceTime=None):
+        """
+        Coroutine version of L{Calendar.evalRanges()}.
+        """
+        return await self._call('evalRanges', datetimeString, sourceTime)
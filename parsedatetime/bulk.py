@@ -0,0 +1,989 @@
+# -*- coding: utf-8 -*-
+"""
+parsedatetime/bulk.py
+
+Parse sequences of date/time texts into columns of numbers
+
+The columns are NumPy arrays when NumPy is installed, see the C{numpy}
+extra, any preallocated arrays supporting item assignment, such as those
+of the C{array} module, can be filled without it.
+"""
+from __future__ import absolute_import, division, unicode_literals
+
+import time
+import datetime
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from . import VERSION_CONTEXT_STYLE
+from .context import pdtContext, pdtContextStack, pdtContextScope
+from .plan import pdtPlan, _HAS_DATE
+
+# days in each month of a common year
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# seconds in one unit of a datetime64 array
+_DATETIME64_SCALE = {'s': 1, 'ms': 10 ** 3, 'us': 10 ** 6, 'ns': 10 ** 9}
+
+# the value numpy uses for NaT
+_NAT = -2 ** 63
+
+# accuracy of the dates a locale parseRegex gives, it returns True instead
+# of a pdtContext
+_ACU_DATE = pdtContext.ACU_YEAR | pdtContext.ACU_MONTH | pdtContext.ACU_DAY
+
+
+def daysInMonth(months, years):
+    """
+    L{Constants.daysInMonth()} for arrays of months (1-12) and years.
+
+    Returns a NumPy array when NumPy is installed and a list otherwise.
+
+    @type  months: sequence
+    @param months: months
+    @type  years:  sequence
+    @param years:  years, of the same length as C{months} or a single year
+
+    @rtype:  array or list
+    @return: number of days in each month
+    """
+    if numpy is None:
+        if not hasattr(years, '__iter__'):
+            years = [years] * len(months)
+        result = []
+        for month, year in zip(months, years):
+            if not 1 <= month <= 12:
+                raise ValueError('month out of range: %r' % (month,))
+            leap = year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+            result.append(_DAYS_IN_MONTH[month - 1] +
+                          (month == 2 and leap))
+        return result
+
+    months = numpy.asarray(months)
+    years = numpy.asarray(years)
+    if months.size and (months.min() < 1 or months.max() > 12):
+        raise ValueError('month out of range')
+    leap = (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+    return (numpy.array(_DAYS_IN_MONTH)[months - 1] +
+            ((months == 2) & leap))
+
+
+def wallSeconds(year, month, day, hour, minute, second):
+    """
+    Seconds since 1970-01-01 00:00:00 of a date and time of the proleptic
+    Gregorian calendar, without looking at any time zone.
+
+    This is what a naive C{datetime64} stores and is worked out with
+    integers only, see U{http://howardhinnant.github.io/date_algorithms.html}
+
+    @rtype:  integer
+    @return: seconds since the epoch
+    """
+    return (_daysFromCivil(year, month, day) * 86400 + hour * 3600 +
+            minute * 60 + second)
+
+
+def _daysFromCivil(year, month, day):
+    # days since 1970-01-01, for integers or NumPy arrays alike
+    year = year - (month <= 2)
+    era = year // 400
+    yearOfEra = year - era * 400
+    dayOfYear = (153 * ((month + 9) % 12) + 2) // 5 + day - 1
+    dayOfEra = (yearOfEra * 365 + yearOfEra // 4 - yearOfEra // 100 +
+                dayOfYear)
+    return era * 146097 + dayOfEra - 719468
+
+
+def _civilFromDays(days):
+    # inverse of _daysFromCivil() for NumPy arrays
+    days = days + 719468
+    era = days // 146097
+    dayOfEra = days - era * 146097
+    yearOfEra = (dayOfEra - dayOfEra // 1460 + dayOfEra // 36524 -
+                 dayOfEra // 146096) // 365
+    dayOfYear = dayOfEra - (365 * yearOfEra + yearOfEra // 4 -
+                            yearOfEra // 100)
+    shifted = (5 * dayOfYear + 2) // 153
+    day = dayOfYear - (153 * shifted + 2) // 5 + 1
+    month = numpy.where(shifted < 10, shifted + 3, shifted - 9)
+    year = yearOfEra + era * 400 + (month <= 2)
+    return year, month, day
+
+
+class pdtDedupStats(object):
+
+    """
+    How much L{deduplicate()} collapsed its input.
+
+    C{rows} is the number of texts given, C{unique} the number of them
+    that had to be parsed and C{ratio} the number of rows per parsed text.
+    """
+
+    __slots__ = ('rows', 'unique')
+
+    def __init__(self, rows=0, unique=0):
+        self.rows = rows
+        self.unique = unique
+
+    @property
+    def ratio(self):
+        return self.rows / self.unique if self.unique else 1.0
+
+    def __repr__(self):
+        return 'pdtDedupStats(rows=%d, unique=%d, ratio=%.2f)' % (
+            self.rows, self.unique, self.ratio)
+
+
+def deduplicate(calendar, datetimeStrings):
+    """
+    Group the texts that L{Calendar.parse()} evaluates the same, the ones
+    that are equal after the normalization it applies.
+
+    @type  calendar:        L{Calendar}
+    @param calendar:        calendar the texts are going to be parsed with
+    @type  datetimeStrings: iterable
+    @param datetimeStrings: date/time texts
+
+    @rtype:  tuple
+    @return: tuple of the list of unique texts, a list with the index into
+             it of each of C{datetimeStrings} and a L{pdtDedupStats}
+    """
+    parseRegex = calendar._localeParseRegex()
+    normalize = calendar._normalize
+    parseKey = calendar._parseKey
+
+    # exact repeats are found without normalizing them again
+    seen = {}
+    keys = {}
+    unique = []
+    rows = []
+    for text in datetimeStrings:
+        index = seen.get(text)
+        if index is None:
+            key = parseKey(normalize(text), parseRegex)
+            index = keys.get(key)
+            if index is None:
+                index = keys[key] = len(unique)
+                unique.append(text)
+            seen[text] = index
+        rows.append(index)
+
+    return unique, rows, pdtDedupStats(len(rows), len(unique))
+
+
+def parseDeduplicated(calendar, datetimeStrings, sourceTime=None,
+                      version=None):
+    """
+    Parse C{datetimeStrings} like L{Calendar.parseMany()} but evaluate each
+    group of texts found by L{deduplicate()} only once.
+
+    The source time is captured once for the whole batch, so when
+    C{sourceTime} is None every text is evaluated against the same current
+    date/time.
+
+    @type  calendar:        L{Calendar}
+    @param calendar:        calendar to parse with
+    @type  datetimeStrings: iterable
+    @param datetimeStrings: date/time texts to evaluate
+    @type  sourceTime:      struct_time
+    @param sourceTime:      C{struct_time} value to use as the base
+    @type  version:         integer
+    @param version:         style version, default will use L{Calendar}
+                            parameter version value
+
+    @rtype:  tuple
+    @return: tuple of the list of results, in the order of
+             C{datetimeStrings} and as returned by L{Calendar.parse()}, and
+             a L{pdtDedupStats}
+    """
+    unique, rows, stats = deduplicate(calendar, datetimeStrings)
+    parsed = list(calendar.parseMany(unique, sourceTime, version))
+
+    results = []
+    for index in rows:
+        result, flag = parsed[index]
+        if isinstance(flag, pdtContext):
+            # every row gets a context of its own
+            flag = pdtContext(flag.accuracy, flag.useAccuracy)
+        results.append((result, flag))
+    return results, stats
+
+
+def _timeColumn(times):
+    """
+    Return the array to write the values of C{times} into, the value for
+    texts that did not parse and the number of array units in a second.
+    """
+    dtype = getattr(times, 'dtype', None)
+    if dtype is not None and dtype.kind == 'M':
+        unit, count = numpy.datetime_data(dtype)
+        if unit not in _DATETIME64_SCALE or count != 1:
+            raise ValueError('unsupported datetime64 unit %s' % dtype)
+        return times.view('int64'), _NAT, _DATETIME64_SCALE[unit]
+    return times, 0, 1
+
+
+def parseColumns(calendar, datetimeStrings, sourceTime=None, out=None,
+                 posix=False, unique=False):
+    """
+    Parse each of C{datetimeStrings} like L{Calendar.parse()} and store the
+    results in three columns instead of a tuple per text:
+
+     - the date/time, as a naive C{datetime64} of the parsed wall clock
+       time or, with C{posix}, the POSIX timestamp of the parsed local
+       time; NaT or 0 for texts that did not parse
+     - the accuracy, the C{pdtContext.ACU_*} flags of the result; the
+       year, month and day flags for dates matched by a locale
+       C{parseRegex}, which gives no L{pdtContext}; 0 for the other texts
+       of locales that keep no accuracy, see C{useAccuracy}
+     - True for the texts that parsed
+
+    No C{datetime} objects are made on the way.  The columns are filled in
+    place when C{out} is given, otherwise NumPy arrays of type
+    C{datetime64[s]} (or C{int64} with C{posix}), C{int16} and C{bool} are
+    allocated.
+
+    @type  calendar:        L{Calendar}
+    @param calendar:        calendar to parse with
+    @type  datetimeStrings: iterable
+    @param datetimeStrings: date/time texts to evaluate
+    @type  sourceTime:      struct_time
+    @param sourceTime:      C{struct_time} value to use as the base
+    @type  out:             tuple
+    @param out:             C{(times, accuracy, parsed)} arrays with room
+                            for all texts, a C{datetime64} C{times} array
+                            can use any unit from seconds to nanoseconds
+    @type  posix:           boolean
+    @param posix:           store POSIX timestamps instead of wall clock
+                            times
+    @type  unique:          boolean
+    @param unique:          parse each group of texts found by
+                            L{deduplicate()} only once
+
+    @rtype:  tuple
+    @return: the C{(times, accuracy, parsed)} arrays
+    """
+    if out is None:
+        if numpy is None:
+            raise ImportError('parseColumns() needs NumPy to allocate its '
+                              'result, install it or pass out')
+        if not hasattr(datetimeStrings, '__len__'):
+            datetimeStrings = list(datetimeStrings)
+        size = len(datetimeStrings)
+        out = (numpy.empty(size, 'int64' if posix else 'datetime64[s]'),
+               numpy.zeros(size, 'int16'),
+               numpy.zeros(size, 'bool'))
+
+    times, accuracy, parsed = out
+    values, missing, scale = _timeColumn(times)
+
+    texts = datetimeStrings
+    if unique:
+        texts, rows, stats = deduplicate(calendar, datetimeStrings)
+
+    useAccuracy = calendar.ptc.locale.useAccuracy
+    if not useAccuracy:
+        # an accuracy of 0 does not tell that a text did not parse
+        calendar = _accurateCalendar(calendar)
+    cells = _cells(calendar.parseMany(texts, sourceTime,
+                                      VERSION_CONTEXT_STYLE),
+                   posix, scale, missing, useAccuracy)
+    if unique:
+        uniqueCells = list(cells)
+        cells = (uniqueCells[index] for index in rows)
+
+    for index, (value, flags, ok) in enumerate(cells):
+        values[index] = value
+        accuracy[index] = flags
+        parsed[index] = ok
+
+    return out
+
+
+def _accuracy(ctx):
+    """
+    Return the C{pdtContext.ACU_*} flags of the flag/context of a
+    L{Calendar.parse()} result in the context style, the year, month and
+    day flags when a locale C{parseRegex} matched the text.
+    """
+    if isinstance(ctx, pdtContext):
+        return ctx.accuracy
+    return _ACU_DATE if ctx else 0
+
+
+def _accurateCalendar(calendar):
+    """
+    Return a copy of C{calendar} whose contexts keep their accuracy even
+    when its locale sets C{useAccuracy} to False, it parses the same.
+    """
+    cls = type(calendar)
+    accurate = object.__new__(cls)
+    # leave out the methods a profiler or tracer put on the instance
+    accurate.__dict__.update((name, value)
+                             for name, value in calendar.__dict__.items()
+                             if not hasattr(cls, name))
+    # the cached contexts keep no accuracy
+    accurate.cache = None
+    accurate.profiler = None
+    accurate._ctxStack = ctxStack = pdtContextStack()
+    accurate.context = lambda: pdtContextScope(ctxStack.stack, pdtContext())
+    return accurate
+
+
+def _cells(results, posix, scale, missing, useAccuracy=True):
+    # the (time, accuracy, parsed) cells of the parse() results
+    mktime = time.mktime
+    for result, ctx in results:
+        flags = _accuracy(ctx)
+        if not flags:
+            yield missing, 0, False
+            continue
+        if isinstance(ctx, pdtContext) and not useAccuracy:
+            flags = 0
+        if posix:
+            yield int(mktime(tuple(result[:8]) + (-1,))) * scale, flags, True
+        else:
+            yield wallSeconds(*result[:6]) * scale, flags, True
+
+
+def parseAnchored(calendar, datetimeString, anchors, version=None):
+    """
+    Parse C{datetimeString} like L{Calendar.parse()} against each of
+    C{anchors} as the source time.
+
+    The text is compiled once with L{Calendar.compile()}.  When NumPy is
+    installed the steps of the plan are then applied to all anchors at
+    once, as arithmetic on columns of the date and time fields: day and
+    week offsets, weekdays, month and year increments, time of day
+    settings and the relative phrases made of them.  Anchors that one of
+    these steps cannot handle, like a date that would go past year 9999,
+    and texts whose steps have no column version, such as month names,
+    are evaluated one by one with L{pdtPlan.evaluate()}, so the results
+    are always those of L{Calendar.parse()}.
+
+    @type  calendar:       L{Calendar}
+    @param calendar:       calendar to parse with
+    @type  datetimeString: string or L{pdtPlan}
+    @param datetimeString: date/time text to evaluate, or its plan
+    @type  anchors:        sequence or array
+    @param anchors:        C{struct_time} values or C{datetime} objects, or
+                           a NumPy C{datetime64} array with a unit from
+                           seconds to nanoseconds
+    @type  version:        integer
+    @param version:        style version, default will use L{Calendar}
+                           parameter version value
+
+    @rtype:  list or tuple
+    @return: for a sequence, the list of what L{Calendar.parse()} returns
+             for each anchor, for a C{datetime64} array, a C{(times,
+             accuracy)} tuple of arrays with the naive C{datetime64} of
+             each result, in the unit of C{anchors}, and its
+             C{pdtContext.ACU_*} flags, as for L{parseColumns()}, 0 when
+             the text did not parse and the anchor was returned, NaT
+             anchors give NaT and 0
+    """
+    if isinstance(datetimeString, pdtPlan):
+        plan = datetimeString
+    else:
+        plan = calendar.compile(datetimeString)
+
+    dtype = getattr(anchors, 'dtype', None)
+    column = dtype is not None and dtype.kind == 'M'
+    if numpy is None:
+        return [plan.evaluate(anchor, version) for anchor in anchors]
+
+    ctx = pdtContext(0, calendar.ptc.locale.useAccuracy)
+    ops = None
+    if calendar._localeParseRegex() is None:
+        ops = _anchorOps(calendar, plan.steps, ctx)
+
+    if column:
+        values, missing, scale = _timeColumn(anchors)
+        nat = values == missing
+        days, seconds = numpy.divmod(values // scale, 86400)
+        state = _pdtAnchors.fromSeconds(days, seconds, nat)
+        rows = None
+    else:
+        with calendar._clockScope():
+            rows = [calendar._sourceTime(anchor) for anchor in anchors]
+        fields = numpy.array([tuple(row) for row in rows],
+                             'int64').reshape(len(rows), 9)
+        state = _pdtAnchors(fields.T, numpy.zeros(len(rows), 'bool'))
+
+    start = state.copy()
+    state.bad = state.bad | _invalid(state.year, state.month, state.day,
+                                     state.hour, state.minute, state.second)
+    state.bad = state.bad | (state.weekday < 0) | (state.weekday > 6)
+    if ops is None:
+        state.bad[:] = True
+    else:
+        for op in ops:
+            op(state)
+
+    if not column:
+        fields = numpy.stack(numpy.broadcast_arrays(
+            *[getattr(state, name) for name in _FIELDS]), axis=1).tolist()
+        results = []
+        for index, bad in enumerate(state.bad.tolist()):
+            if bad:
+                results.append(plan.evaluate(rows[index], version))
+            else:
+                results.append(calendar._styled(
+                    time.struct_time(fields[index]),
+                    pdtContext(ctx.accuracy, ctx.useAccuracy), version))
+        return results
+
+    times = numpy.empty_like(anchors)
+    accuracy = numpy.full(len(times), ctx.accuracy, 'int16')
+    out = times.view('int64')
+    out[:] = wallSeconds(state.year, state.month, state.day, state.hour,
+                         state.minute, state.second) * scale
+    out[nat] = missing
+    accuracy[nat] = 0
+
+    redo = numpy.flatnonzero(state.bad & ~nat)
+    if len(redo):
+        fields = numpy.stack([getattr(start, name)[redo]
+                              for name in _FIELDS], axis=1).tolist()
+        for index, row in zip(redo.tolist(), fields):
+            result, ctx = plan.evaluate(time.struct_time(row),
+                                        VERSION_CONTEXT_STYLE)
+            out[index] = wallSeconds(*result[:6]) * scale
+            accuracy[index] = _accuracy(ctx)
+    return times, accuracy
+
+
+def parsePairs(calendar, datetimeStrings, anchors, version=None):
+    """
+    Parse each of C{datetimeStrings} like L{Calendar.parse()} against the
+    anchor in the same row of C{anchors} as the source time.
+
+    The rows are grouped by the texts L{deduplicate()} finds to evaluate
+    the same, each group is compiled once and evaluated for the anchors of
+    its rows with L{parseAnchored()}, and rows of a group with the same
+    anchor share one evaluation.  The results are returned in the order of
+    the rows.
+
+    The current time is captured once for the whole batch, so every
+    anchor that is None is the same date/time.
+
+    @type  calendar:        L{Calendar}
+    @param calendar:        calendar to parse with
+    @type  datetimeStrings: iterable
+    @param datetimeStrings: date/time texts to evaluate
+    @type  anchors:         sequence or array
+    @param anchors:         source time of each text, as for
+                            L{parseAnchored()}
+    @type  version:         integer
+    @param version:         style version, default will use L{Calendar}
+                            parameter version value
+
+    @rtype:  list or tuple
+    @return: for a sequence of anchors, the list of what L{Calendar.parse()}
+             returns for each row, for a C{datetime64} array, the C{(times,
+             accuracy)} arrays described in L{parseAnchored()}
+    """
+    unique, rows, stats = deduplicate(calendar, datetimeStrings)
+    if len(anchors) != len(rows):
+        raise ValueError('%d texts but %d anchors' % (len(rows),
+                                                      len(anchors)))
+
+    groups = [[] for text in unique]
+    for row, index in enumerate(rows):
+        groups[index].append(row)
+
+    dtype = getattr(anchors, 'dtype', None)
+    if numpy is not None and dtype is not None and dtype.kind == 'M':
+        times = numpy.empty_like(anchors)
+        accuracy = numpy.zeros(len(rows), 'int16')
+        for text, members in zip(unique, groups):
+            members = numpy.array(members)
+            times[members], accuracy[members] = parseAnchored(
+                calendar, calendar.compile(text), anchors[members])
+        return times, accuracy
+
+    now = None
+    results = [None] * len(rows)
+    for text, members in zip(unique, groups):
+        slots = {}
+        distinct = []
+        positions = []
+        for row in members:
+            anchor = anchors[row]
+            if not anchor:
+                if now is None:
+                    now = calendar.clock()
+                anchor = now
+            sourceTime = calendar._sourceTime(anchor)
+            key = (type(sourceTime), tuple(sourceTime))
+            if key not in slots:
+                slots[key] = len(distinct)
+                distinct.append(sourceTime)
+            positions.append(slots[key])
+
+        evaluated = parseAnchored(calendar, calendar.compile(text),
+                                  distinct, version)
+        for row, position in zip(members, positions):
+            result, flag = evaluated[position]
+            if isinstance(flag, pdtContext):
+                # every row gets a context of its own
+                flag = pdtContext(flag.accuracy, flag.useAccuracy)
+            results[row] = result, flag
+    return results
+
+
+# the struct_time fields, in order, as the columns of a _pdtAnchors
+_FIELDS = ('year', 'month', 'day', 'hour', 'minute', 'second', 'weekday',
+           'yearday', 'isdst')
+
+# largest shift in microseconds that a column of seconds can take without
+# overflowing, far more than the years a datetime can hold
+_MAX_SHIFT = 10 ** 17
+
+
+def _invalid(year, month, day, hour, minute, second):
+    # the rows datetime.datetime() would refuse
+    days = daysInMonth(numpy.clip(month, 1, 12), year)
+    return ((year < 1) | (year > 9999) | (month < 1) | (month > 12) |
+            (day < 1) | (day > days) | (hour < 0) | (hour > 23) |
+            (minute < 0) | (minute > 59) | (second < 0) | (second > 59))
+
+
+class _pdtAnchors(object):
+
+    """
+    The anchors of L{parseAnchored()}, with one column per C{struct_time}
+    field, as the steps of a plan are applied to them.
+
+    Rows in C{bad} went where the columns cannot follow
+    L{Calendar.parse()} and are evaluated on their own instead.  The
+    columns are replaced and never changed in place, so a copy is cheap.
+    """
+
+    __slots__ = _FIELDS + ('bad',)
+
+    def __init__(self, columns, bad):
+        for name, column in zip(_FIELDS, columns):
+            setattr(self, name, column)
+        self.bad = bad
+
+    @classmethod
+    def fromSeconds(cls, days, seconds, bad):
+        anchors = cls((None,) * len(_FIELDS), bad)
+        anchors._setDatetime(days, seconds)
+        return anchors
+
+    def copy(self):
+        return _pdtAnchors([getattr(self, name) for name in _FIELDS],
+                           self.bad)
+
+    def assign(self, other):
+        for name in _FIELDS + ('bad',):
+            setattr(self, name, getattr(other, name))
+
+    def set(self, values):
+        """
+        Replace fields by the given values and keep the others, the way
+        the steps that build a new tuple from the source time do.
+        """
+        for name, value in values.items():
+            setattr(self, name, value + numpy.zeros_like(self.year))
+
+    def _seconds(self, hms):
+        # the datetime a step starts from, in seconds since the epoch, the
+        # fields of hms that are None are those of the source time
+        hour, minute, second = [value if value is not None else
+                                getattr(self, name)
+                                for name, value in zip(
+                                    ('hour', 'minute', 'second'), hms)]
+        self.bad = self.bad | _invalid(self.year, self.month, self.day,
+                                       hour, minute, second)
+        return wallSeconds(self.year, self.month, self.day, hour, minute,
+                           second)
+
+    def _setDatetime(self, days, seconds):
+        # the timetuple() of a datetime
+        year, month, day = _civilFromDays(days)
+        self.bad = self.bad | (year < 1) | (year > 9999)
+        self.year = year
+        self.month = month
+        self.day = day
+        self.hour, seconds = numpy.divmod(seconds, 3600)
+        self.minute, self.second = numpy.divmod(seconds, 60)
+        self.weekday = (days + 3) % 7
+        self.yearday = days - _daysFromCivil(year, 1, 1) + 1
+        self.isdst = numpy.full_like(days, -1)
+
+    def shift(self, days=0, microseconds=0, hms=(None, None, None)):
+        """
+        C{datetime(year, month, day, *hms) + timedelta(days,
+        microseconds=microseconds)}
+        """
+        seconds = self._seconds(hms) + days * 86400
+        if microseconds:
+            seconds = (seconds * 10 ** 6 + microseconds) // 10 ** 6
+        self._setDatetime(*numpy.divmod(seconds, 86400))
+
+    def incMonths(self, months, hms=(None, None, None), day=None):
+        """
+        C{Calendar.inc(datetime(year, month, day, *hms), month=months)}
+        for a whole number of months.
+        """
+        if day is not None:
+            self.day = day + numpy.zeros_like(self.year)
+        seconds = self._seconds(hms)
+        if months:
+            years = int(months / 12.0)
+            month = self.month + (months - years * 12)
+            year = self.year + years + (month > 12) - (month < 1)
+            month = numpy.where(month < 1, month + 12,
+                                numpy.where(month > 12, month - 12, month))
+            self.bad = self.bad | (year < 1) | (year > 9999)
+            day = numpy.minimum(self.day, daysInMonth(
+                numpy.clip(month, 1, 12), numpy.clip(year, 1, 9999)))
+            seconds = (_daysFromCivil(year, month, day) * 86400 +
+                       seconds % 86400)
+        self._setDatetime(*numpy.divmod(seconds, 86400))
+
+    def lastDay(self):
+        # the day Constants.daysInMonth() gives for the month
+        return daysInMonth(numpy.clip(self.month, 1, 12), self.year)
+
+
+def _anchorOps(calendar, steps, ctx):
+    """
+    Translate the steps of a L{pdtPlan} into operations on a
+    L{_pdtAnchors}, updating C{ctx} with the accuracy they give.
+
+    @rtype:  list
+    @return: list of callables taking a L{_pdtAnchors}, or None if one of
+             the steps has no column version
+    """
+    ops = []
+    for name, args, expected in steps:
+        if name == _HAS_DATE:
+            if not ctx.hasDate:
+                return None
+            continue
+
+        if name == '_evalWeekday':
+            if ctx.hasDate:
+                return None
+            op = _weekdayOp(calendar, ctx, *args)
+        elif name == '_evalDayStr':
+            op = _dayOp(calendar, ctx, *args)
+        elif name == '_evalUnits':
+            op = _unitsOp(calendar, ctx, args[0], calendar.ptc.CRE_UNITS,
+                          'units')
+        elif name == '_evalQUnits':
+            op = _unitsOp(calendar, ctx, args[0], calendar.ptc.CRE_QUNITS,
+                          'qunits')
+        elif name == '_evalModifier':
+            op = _modifierOp(calendar, ctx, *(args + (expected,)))
+        elif name in _PROBED:
+            op = _probedOp(calendar, ctx, name, args)
+        else:
+            return None
+
+        if op is None:
+            return None
+        ops.append(op)
+    return ops
+
+
+# steps that only replace some fields of the source time by values taken
+# from the text
+_PROBED = ('_evalStrict', '_evalMeridian', '_evalTimeStd', '_evalTimeStr')
+
+# two source times that differ in every field
+_PROBES = ((2001, 2, 3, 4, 5, 6, 5, 34, 0),
+           (2002, 3, 4, 5, 6, 7, 0, 63, 1))
+
+
+def _probedOp(calendar, ctx, name, args):
+    # run the step against both probes, the fields that come out the same
+    # are set by the step and the others are passed through
+    method = getattr(type(calendar), name)
+    results = []
+    for probe in _PROBES:
+        with calendar.context() as probeCtx:
+            results.append(tuple(method(calendar, *(args + (probe,)))))
+
+    values = {}
+    for index, name in enumerate(_FIELDS):
+        first, second = results[0][index], results[1][index]
+        if first == _PROBES[0][index] and second == _PROBES[1][index]:
+            continue
+        if index > 5 or first != second:
+            return None
+        values[name] = first
+
+    ctx.update(probeCtx)
+    return lambda anchors: anchors.set(values)
+
+
+def _startTime(ptc):
+    # the time of day most steps start from
+    if ptc.StartTimeFromSourceTime:
+        return None, None, None
+    return 9, 0, 0
+
+
+def _dayOp(calendar, ctx, datetimeString):
+    # Calendar._evalDayStr()
+    ptc = calendar.ptc
+    offset = ptc.dayOffsets.get(datetimeString.strip(), 0)
+    hms = _startTime(ptc)
+    ctx.updateAccuracy(ctx.ACU_DAY)
+    return lambda anchors: anchors.shift(offset, hms=hms)
+
+
+def _weekdayTable(calendar, wkdy, offset):
+    # Calendar._CalculateDOWDelta() for each weekday of the source time
+    ptc = calendar.ptc
+    return numpy.array([calendar._CalculateDOWDelta(
+        wd, wkdy, offset, ptc.DOWParseStyle, ptc.CurrentDOWParseStyle)
+        for wd in range(7)])
+
+
+def _weekdayOp(calendar, ctx, datetimeString):
+    # Calendar._evalWeekday()
+    wkdy = calendar.ptc.WeekdayOffsets[datetimeString.strip()]
+    table = _weekdayTable(calendar, wkdy, 2)
+    ctx.updateAccuracy(ctx.ACU_DAY)
+    return lambda anchors: anchors.shift(table[anchors.weekday % 7])
+
+
+def _unitsOp(calendar, ctx, datetimeString, cre, group):
+    # Calendar._evalUnits() and _evalQUnits(), through _buildTime()
+    ptc = calendar.ptc
+    s = datetimeString.strip()
+    m = cre.search(s)
+    if m is None or '' in ptc.Modifiers:
+        return None
+    units = m.group(group)
+    qty = calendar._quantityToReal(s[:m.start(group)].strip())
+    realunit = ptc.unitAliases.get(units, units)
+
+    if realunit in ('years', 'months'):
+        months = float(qty) * (12 if realunit == 'years' else 1)
+        if not abs(months) < 10 ** 6 or months != int(months):
+            return None
+
+        def op(anchors):
+            anchors.incMonths(int(months))
+    else:
+        microseconds = 0
+        if realunit in ('days', 'hours', 'minutes', 'seconds', 'weeks'):
+            try:
+                delta = datetime.timedelta(**{realunit: qty})
+            except OverflowError:
+                # the source time is kept and the accuracy is not updated
+                return lambda anchors: anchors.shift()
+            microseconds = ((delta.days * 86400 + delta.seconds) * 10 ** 6 +
+                            delta.microseconds)
+            if abs(microseconds) > _MAX_SHIFT:
+                return None
+
+        def op(anchors):
+            anchors.shift(microseconds=microseconds)
+
+    try:
+        ctx.updateAccuracy(ptc.unitAccuracy.get(units, realunit))
+    except KeyError:
+        return None
+    return op
+
+
+def _subParseOp(calendar, ctx, datetimeString):
+    # the nested Calendar.parse() of a step, its context is merged into
+    # the one of the step
+    subCtx = pdtContext(0, ctx.useAccuracy)
+    ops = _anchorOps(calendar, calendar.compile(datetimeString).steps,
+                     subCtx)
+    if ops is None:
+        return None, subCtx
+    ctx.update(subCtx)
+    return ops, subCtx
+
+
+def _nested(ops, used):
+    # run ops on a copy of the anchors and keep the result if used
+    def op(anchors):
+        result = anchors.copy()
+        for subOp in ops:
+            subOp(result)
+        if used:
+            anchors.assign(result)
+        else:
+            anchors.bad = anchors.bad | result.bad
+    return op
+
+
+def _modifierOp(calendar, ctx, modifier, chunk1, chunk2, expected):
+    # Calendar._evalModifier()
+    ptc = calendar.ptc
+    offset = ptc.Modifiers[modifier]
+    hms = _startTime(ptc)
+    localeOffset2 = (ptc.locale.localeID not in ['ko_KR', 'ja_JP'] and
+                     offset == 2)
+
+    m = ptc.CRE_REMAINING.search(chunk2)
+    if m is not None:
+        unit = chunk2[:m.start()]
+        chunk2 = chunk2[m.start() + 1:]
+    else:
+        unit = chunk2
+        chunk2 = ''
+
+    realunit = ptc.unitAliases.get(unit)
+    ops = []
+
+    if realunit == 'months':
+        if offset == 0:
+            ops.append(lambda anchors: anchors.set(dict(
+                zip(('day', 'hour', 'minute', 'second'),
+                    (anchors.lastDay(),) + _fill(anchors, hms)))))
+        elif offset == 2:
+            def op(anchors):
+                last = anchors.lastDay()
+                # December has no next month in Constants.daysInMonth()
+                anchors.bad = anchors.bad | ((anchors.day == last) &
+                                             (anchors.month == 12))
+                anchors.day = numpy.where(
+                    anchors.day == last,
+                    daysInMonth(numpy.clip(anchors.month + 1, 1, 12),
+                                anchors.year), anchors.day)
+                anchors.incMonths(1, hms)
+            ops.append(op)
+        else:
+            ops.append(lambda anchors: anchors.incMonths(offset, hms, 1))
+        ctx.updateAccuracy(ctx.ACU_MONTH)
+
+    elif realunit == 'weeks':
+        if offset == 0:
+            ops.append(lambda anchors: anchors.shift(4 - anchors.weekday,
+                                                     hms=(17, 0, 0)))
+        elif localeOffset2:
+            ops.append(lambda anchors: anchors.shift(7, hms=hms))
+        else:
+            ops.append(lambda anchors: anchors.shift(7 * offset, hms=hms))
+        ctx.updateAccuracy(ctx.ACU_WEEK)
+
+    elif realunit == 'days':
+        if offset == 0:
+            ops.append(lambda anchors: anchors.set(
+                {'hour': 17, 'minute': 0, 'second': 0}))
+            ctx.updateAccuracy(ctx.ACU_HALFDAY)
+        elif localeOffset2:
+            ops.append(lambda anchors: anchors.shift(1))
+        else:
+            ops.append(lambda anchors: anchors.shift(offset, hms=hms))
+        ctx.updateAccuracy(ctx.ACU_DAY)
+
+    elif realunit == 'hours':
+        if offset == 0:
+            ops.append(lambda anchors: anchors.set({'minute': 0,
+                                                    'second': 0}))
+        else:
+            ops.append(lambda anchors: anchors.shift(
+                microseconds=offset * 3600 * 10 ** 6, hms=(None, 0, 0)))
+        ctx.updateAccuracy(ctx.ACU_HOUR)
+
+    elif realunit == 'years':
+        if offset == 0:
+            ops.append(lambda anchors: anchors.set({'month': 12,
+                                                    'day': 31}))
+        elif offset == 2:
+            ops.append(lambda anchors: anchors.set(
+                {'year': anchors.year + 1}))
+        else:
+            ops.append(lambda anchors: anchors.set(dict(
+                zip(_FIELDS[:6], (anchors.year + offset, 1, 1) +
+                    _fill(anchors, hms)))))
+        ctx.updateAccuracy(ctx.ACU_YEAR)
+
+    elif modifier == 'eom':
+        ops.append(lambda anchors: anchors.set(dict(
+            zip(('day', 'hour', 'minute', 'second'),
+                (anchors.lastDay(),) + _fill(anchors, hms)))))
+        ctx.updateAccuracy(ctx.ACU_DAY)
+
+    elif modifier == 'eoy':
+        ops.append(lambda anchors: anchors.set(dict(
+            zip(_FIELDS[1:6], (12, 31) + _fill(anchors, hms)))))
+        ctx.updateAccuracy(ctx.ACU_MONTH)
+
+    elif ptc.CRE_WEEKDAY.match(unit):
+        relativeModifier = modifier not in ['this', 'next', 'last', 'prior',
+                                            'previous']
+        if modifier == 'eod' or chunk1 != '' and relativeModifier:
+            return None
+        wkdy = ptc.WeekdayOffsets[ptc.CRE_WEEKDAY.match(unit).group()]
+        table = _weekdayTable(calendar, wkdy,
+                              0 if relativeModifier else offset)
+        ops.append(lambda anchors: anchors.shift(
+            table[anchors.weekday % 7], hms=hms))
+        ctx.updateAccuracy(ctx.ACU_DAY)
+
+    elif chunk1 == '' and chunk2 == '' and ptc.CRE_TIME.match(unit):
+        # evaluated against the current time instead of the source time
+        return None
+
+    else:
+        unit = unit.strip()
+        if unit:
+            subOps, subCtx = _subParseOp(calendar, ctx,
+                                         '%s %s' % (unit, chunk2))
+            if subOps is None:
+                return None
+            if subCtx.hasDate:
+                u = unit.lower()
+                if u in ptc.Months or u in ptc.shortMonths:
+                    subOps = subOps + [lambda anchors: anchors.incMonths(
+                        12 * offset)]
+                elif u in ptc.Weekdays:
+                    return None
+            ops.append(_nested(subOps, subCtx.hasDateOrTime))
+            if subCtx.hasDateOrTime:
+                chunk2 = ''
+
+        chunk1 = chunk1.strip()
+        if chunk1:
+            numbers = list(ptc.CRE_NUMBER.finditer(chunk1))
+            if numbers:
+                m = numbers[-1]
+                qty = calendar._quantityToReal(m.group()) * offset
+                chunk1 = '%s%s%s' % (chunk1[:m.start()], qty,
+                                     chunk1[m.end():])
+            subOps, subCtx = _subParseOp(calendar, ctx, chunk1)
+            if subOps is None:
+                return None
+            ops.append(_nested(subOps, subCtx.hasDateOrTime))
+            chunk1 = ''
+
+        source = ptc.re_sources.get(modifier)
+        if source is not None:
+            names = dict(zip(('yr', 'mth', 'dy', 'hr', 'mn', 'sec'),
+                             _FIELDS))
+            values = dict((names[key], value)
+                          for key, value in source.items() if key in names)
+            ops.append(lambda anchors: anchors.set(values))
+            ctx.updateAccuracy(ctx.ACU_HALFDAY)
+
+    if '%s %s' % (chunk1, chunk2) != expected:
+        return None
+
+    def op(anchors):
+        for subOp in ops:
+            subOp(anchors)
+    return op
+
+
+def _fill(anchors, hms):
+    # hms with the fields that are None taken from the anchors
+    return tuple(value if value is not None else getattr(anchors, name)
+                 for name, value in zip(('hour', 'minute', 'second'), hms))
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+parsedatetime/cache.py
+
+Result cache used by L{Calendar.parse()}
+
+"""
+
+from collections import OrderedDict
+from threading import Lock
+
+
+class pdtResultCache(object):
+    """
+    A thread-safe, bounded mapping that evicts the least recently used
+    entry once it holds C{maxSize} entries.
+
+    Internally used by L{Calendar} object when created with a C{cacheSize}
+    """
+
+    def __init__(self, maxSize):
+        """
+        Default constructor of L{pdtResultCache} class.
+
+        @type  maxSize: integer
+        @param maxSize: maximum number of entries kept in the cache
+
+        @rtype:  object
+        @return: L{pdtResultCache} instance
+        """
+        if maxSize < 1:
+            raise ValueError('cache size must be at least 1')
+
+        self.maxSize = maxSize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = Lock()
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        """
+        Return the value stored for C{key}, or None if there is none
+        """
+        with self._lock:
+            try:
+                value = self._entries.pop(key)
+            except KeyError:
+                self.misses += 1
+                return None
+            self._entries[key] = value
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """
+        Store C{value} for C{key}, evicting the least recently used entry
+        if the cache is full
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = value
+            if len(self._entries) > self.maxSize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """
+        Remove every entry and reset the hit, miss and eviction counters
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return ('pdtResultCache(maxSize=%d, size=%d, hits=%d, misses=%d, '
+                'evictions=%d)' % (self.maxSize, len(self), self.hits,
+                                   self.misses, self.evictions))
@@ -9,39 +9,108 @@ Context related classes
 from threading import local
 
 
-class pdtContextStack(object):
+class pdtContextStack(local):
     """
     A thread-safe stack to store context(s)
 
+    Every thread sees its own C{stack} list, so code that needs more than
+    one operation can fetch it once and work on the list directly.  The
+    clock reading shared by a L{pdtClockScope} is kept per thread as well.
+
     Internally used by L{Calendar} object
     """
 
     def __init__(self):
-        self.__local = local()
-
-    @property
-    def __stack(self):
-        if not hasattr(self.__local, 'stack'):
-            self.__local.stack = []
-        return self.__local.stack
+        # runs again the first time each thread uses the instance
+        self.stack = []
+        self.clocked = False
+        self.now = None
 
     def push(self, ctx):
-        self.__stack.append(ctx)
+        self.stack.append(ctx)
 
     def pop(self):
         try:
-            return self.__stack.pop()
+            return self.stack.pop()
         except IndexError:
             return None
 
     def last(self):
         try:
-            return self.__stack[-1]
+            return self.stack[-1]
         except IndexError:
             raise RuntimeError('context stack is empty')
 
     def isEmpty(self):
-        return not self.__stack
+        return not self.stack
+
+
+class pdtContextScope(object):
+    """
+    Context manager that keeps a L{pdtContext} on a context stack for the
+    duration of a C{with} block and then merges it into the context below
+    it, if any.
+
+    The context is also taken off the stack when the block raises, but
+    then it is not merged.
+
+    Internally used by L{Calendar.context()}
+    """
+
+    __slots__ = ('stack', 'ctx')
+
+    def __init__(self, stack, ctx):
+        """
+        @type  stack: list
+        @param stack: C{stack} of a L{pdtContextStack}
+        @type  ctx:   L{pdtContext}
+        @param ctx:   context to push
+        """
+        self.stack = stack
+        self.ctx = ctx
+
+    def __enter__(self):
+        self.stack.append(self.ctx)
+        return self.ctx
+
+    def __exit__(self, excType, excValue, traceback):
+        stack = self.stack
+        ctx = stack.pop()
+        if stack and excType is None:
+            stack[-1].update(ctx)
+
+
+class pdtClockScope(object):
+    """
+    Context manager that makes the current time read through a
+    L{pdtContextStack} the same for the duration of a C{with} block: the
+    clock is read the first time it is needed and that reading is used for
+    the rest of the block, including by nested scopes.
+
+    Internally used by L{Calendar} object
+    """
+
+    __slots__ = ('ctxStack', 'outermost')
+
+    def __init__(self, ctxStack):
+        """
+        @type  ctxStack: L{pdtContextStack}
+        @param ctxStack: stack to keep the clock reading on
+        """
+        self.ctxStack = ctxStack
+        self.outermost = False
+
+    def __enter__(self):
+        ctxStack = self.ctxStack
+        if not ctxStack.clocked:
+            ctxStack.clocked = self.outermost = True
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        if self.outermost:
+            ctxStack = self.ctxStack
+            ctxStack.clocked = False
+            ctxStack.now = None
 
 
 class pdtContext(object):
@@ -137,15 +206,18 @@ class pdtContext(object):
             return
 
         for acc in accuracy:
-            if not isinstance(acc, int):
-                acc = self._ACCURACY_REVERSE_MAPPING[acc]
-            self.accuracy |= acc
+            try:
+                self.accuracy |= acc
+            except TypeError:
+                # accuracy given by name
+                self.accuracy |= self._ACCURACY_REVERSE_MAPPING[acc]
 
     def update(self, context):
         """
         Uses another L{pdtContext} instance to update current one
         """
-        self.updateAccuracy(context.accuracy)
+        if self.useAccuracy:
+            self.accuracy |= context.accuracy
 
     @property
     def hasDate(self):
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+parsedatetime/parallel.py
+
+Run L{Calendar.nlp()<parsedatetime.Calendar.nlp>} over large collections
+of texts in a pool of worker processes
+
+"""
+from __future__ import absolute_import, unicode_literals
+
+import sys
+import time
+import itertools
+import collections
+import multiprocessing
+
+try:
+    from concurrent.futures import (ProcessPoolExecutor, FIRST_COMPLETED,
+                                    wait)
+except ImportError:  # Python 2 without the futures backport
+    ProcessPoolExecutor = None
+
+from . import Calendar, Constants
+
+# (config, Calendar) of the worker process
+_worker = None
+
+
+def _workerCalendar(config):
+    """
+    Return the L{Calendar} of the current worker process, building it the
+    first time or when C{config} changed.
+    """
+    global _worker
+    if _worker is None or _worker[0] != config:
+        localeID, usePyICU, calendarArgs = config
+        constants = Constants(localeID, usePyICU, precompile=True)
+        _worker = (config, Calendar(constants, **dict(calendarArgs)))
+    return _worker[1]
+
+
+def _initWorker(config):
+    # a failing initializer only breaks the pool, leave the error to the
+    # first chunk, which hands it on to the caller
+    try:
+        _workerCalendar(config)
+    except Exception:
+        pass
+
+
+def _nlpChunk(config, chunk, sourceTime):
+    nlp = _workerCalendar(config).nlp
+    return [(key, nlp(text, sourceTime)) for key, text in chunk]
+
+
+def _chunks(texts, chunkSize):
+    """
+    Split C{texts} into lists of C{(id, text)} pairs, a plain text gets its
+    position in C{texts} as id.
+    """
+    def keyed():
+        for index, item in enumerate(texts):
+            if isinstance(item, tuple):
+                yield item
+            else:
+                yield index, item
+
+    items = keyed()
+    while True:
+        chunk = list(itertools.islice(items, chunkSize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def nlpMany(texts, localeID=None, sourceTime=None, usePyICU=True,
+            ordered=True, maxWorkers=None, chunkSize=256, **calendarArgs):
+    """
+    Evaluate L{Calendar.nlp()<parsedatetime.Calendar.nlp>} for each of
+    C{texts} in a pool of worker processes, yielding the results as they
+    are returned by the workers.
+
+    Each worker builds its own L{Constants} and L{Calendar} once and the
+    texts are sent to it in chunks of C{chunkSize}, at most two chunks per
+    worker are in flight at any time so C{texts} can be a generator over
+    more data than fits in memory.
+
+    The source time is captured once for the whole run, so when
+    C{sourceTime} is None every text is evaluated against the same
+    current date/time regardless of when its worker got to it.
+
+    @type  texts:        iterable
+    @param texts:        texts to evaluate or C{(id, text)} tuples
+    @type  localeID:     string
+    @param localeID:     locale of the L{Constants} built by the workers
+    @type  sourceTime:   struct_time
+    @param sourceTime:   C{struct_time} value to use as the base
+    @type  usePyICU:     boolean
+    @param usePyICU:     passed on to L{Constants}
+    @type  ordered:      boolean
+    @param ordered:      yield the results in the order of C{texts}
+                         instead of as soon as a chunk is done
+    @type  maxWorkers:   integer
+    @param maxWorkers:   number of worker processes, defaults to the
+                         number of CPUs
+    @type  chunkSize:    integer
+    @param chunkSize:    number of texts sent to a worker at once
+    @param calendarArgs: keyword arguments for L{Calendar}, such as
+                         C{version} or C{cacheSize}
+
+    @rtype:  generator
+    @return: generator of C{(id, result)} tuples where C{id} is the id
+             given with the text or its position in C{texts} and
+             C{result} is the return value of
+             L{Calendar.nlp()<parsedatetime.Calendar.nlp>}
+    """
+    if ProcessPoolExecutor is None:
+        raise ImportError('nlpMany() requires concurrent.futures, install '
+                          'the futures package on Python 2')
+    if chunkSize < 1:
+        raise ValueError('chunk size must be at least 1')
+
+    if sourceTime is None:
+        sourceTime = time.localtime()
+    sourceTime = tuple(getattr(sourceTime, 'timetuple',
+                               lambda: sourceTime)())
+
+    config = (localeID, usePyICU, tuple(sorted(calendarArgs.items())))
+    maxWorkers = maxWorkers or multiprocessing.cpu_count()
+    poolArgs = {'max_workers': maxWorkers}
+    if sys.version_info >= (3, 7):
+        poolArgs.update(initializer=_initWorker, initargs=(config,))
+
+    chunks = _chunks(texts, chunkSize)
+    with ProcessPoolExecutor(**poolArgs) as executor:
+        def submit(chunk):
+            return executor.submit(_nlpChunk, config, chunk, sourceTime)
+
+        pending = collections.deque(
+            submit(chunk) for chunk in itertools.islice(chunks,
+                                                        2 * maxWorkers))
+        try:
+            while pending:
+                if ordered:
+                    done = [pending.popleft()]
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        pending.remove(future)
+
+                for future in done:
+                    for chunk in itertools.islice(chunks, 1):
+                        pending.append(submit(chunk))
+                    for result in future.result():
+                        yield result
+        finally:
+            # the caller stopped early or a chunk failed
+            for future in pending:
+                future.cancel()
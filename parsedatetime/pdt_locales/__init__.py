@@ -9,11 +9,16 @@ All of the included locale classes shipped with pdt.
 from __future__ import absolute_import
 from .icu import get_icu
 
+try:
+    from collections.abc import MutableMapping
+except ImportError:
+    from collections import MutableMapping
+
 locales = ['de_DE', 'en_AU', 'en_US', 'es', 'nl_NL', 'pt_BR', 'ru_RU', 'fr_FR', 'ko_KR', 'ja_JP']
 
 __locale_caches = {}
 
-__all__ = ['get_icu', 'load_locale']
+__all__ = ['get_icu', 'load_locale', 'pdtLazyLocales']
 
 
 def load_locale(locale, icu=False):
@@ -28,3 +33,53 @@ def load_locale(locale, icu=False):
         mod = __import__(__name__, fromlist=[locale], level=0)
         __locale_caches[locale] = getattr(mod, locale)
     return __locale_caches[locale]
+
+
+class pdtLazyLocales(MutableMapping):
+    """
+    Mapping of locale IDs to locale data that imports each of the shipped
+    locales with L{load_locale} the first time it is looked up.
+
+    Entries can be added or replaced, e.g. to install a customized locale,
+    without importing the locale they replace.
+    """
+
+    def __init__(self, localeIDs):
+        self._localeIDs = list(localeIDs)
+        self._custom = {}
+
+    def __getitem__(self, localeID):
+        try:
+            return self._custom[localeID]
+        except KeyError:
+            pass
+        if localeID not in self._localeIDs:
+            raise KeyError(localeID)
+        return load_locale(localeID)
+
+    def __setitem__(self, localeID, locale):
+        self._custom[localeID] = locale
+
+    def __delitem__(self, localeID):
+        if localeID in self._custom:
+            del self._custom[localeID]
+        elif localeID in self._localeIDs:
+            self._localeIDs.remove(localeID)
+        else:
+            raise KeyError(localeID)
+
+    def __contains__(self, localeID):
+        return localeID in self._custom or localeID in self._localeIDs
+
+    def __iter__(self):
+        for localeID in self._localeIDs:
+            yield localeID
+        for localeID in self._custom:
+            if localeID not in self._localeIDs:
+                yield localeID
+
+    def __len__(self):
+        return len(set(self._localeIDs).union(self._custom))
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, list(self))
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+parsedatetime/plan.py
+
+Evaluation plans made by L{Calendar.compile()}
+
+"""
+from __future__ import absolute_import, unicode_literals
+
+from .context import pdtContext, pdtContextStack
+
+# the methods L{Calendar.parse()} hands the text it matched to, everything
+# before them only looks at the text and everything they do is replayed
+_STEPS = ('_evalStrict', '_evalModifier', '_evalUnits', '_evalQUnits',
+          '_evalDateStr', '_evalDateStd', '_evalDayStr', '_evalWeekday',
+          '_evalTimeStr', '_evalMeridian', '_evalTimeStd')
+
+# pseudo step of a weekday that was matched but not evaluated because the
+# text already had a date
+_HAS_DATE = 'hasDate'
+
+
+class _pdtPlanMismatch(Exception):
+    """
+    Raised when evaluating a plan against a source time takes another path
+    through L{Calendar.parse()} than the one it was compiled from.
+    """
+
+
+def record(calendar, datetimeString):
+    """
+    Parse the normalized C{datetimeString} with a copy of C{calendar} that
+    records the evaluation steps called for it.
+
+    @rtype:  tuple
+    @return: tuple of the steps and the L{pdtContext} of the parse
+    """
+    cls = type(calendar)
+    recorder = object.__new__(cls)
+    # leave out the methods a profiler or tracer put on the instance
+    recorder.__dict__.update((name, value)
+                             for name, value in calendar.__dict__.items()
+                             if not hasattr(cls, name))
+    recorder.cache = None
+    recorder.profiler = None
+    recorder._ctxStack = pdtContextStack()
+
+    steps = []
+    # nesting of the steps, only the outermost ones are recorded, the
+    # others run again as part of them
+    depth = [0]
+
+    def recording(name, method):
+        def step(*args):
+            depth[0] += 1
+            try:
+                result = method(*args)
+            finally:
+                depth[0] -= 1
+            if depth[0] == 0:
+                if name == '_evalModifier':
+                    steps.append((name, args[:-1], result[0]))
+                elif result is not None:
+                    steps.append((name, args[:-1], None))
+            return result
+        return step
+
+    for name in _STEPS:
+        setattr(recorder, name, recording(name, getattr(recorder, name)))
+
+    partialParseWeekday = recorder._partialParseWeekday
+
+    def weekday(s, sourceTime, m=None):
+        count = len(steps)
+        result = partialParseWeekday(s, sourceTime, m)
+        if depth[0] == 0 and result[2] and len(steps) == count:
+            steps.append((_HAS_DATE, (), True))
+        return result
+
+    recorder._partialParseWeekday = weekday
+
+    sourceTime, ctx = recorder._parseNormalized(
+        datetimeString, recorder.clock(), None,
+        recorder._partialParseMethods())
+    return tuple(steps), ctx
+
+
+class pdtPlan(object):
+
+    """
+    The evaluation steps of a date/time text, see L{Calendar.compile()}.
+
+    C{steps} is a tuple of C{(method, arguments, expected)} tuples, the
+    C{_eval*} methods of the L{Calendar} that L{Calendar.parse()} calls for
+    the text, in order, with the parts of the text they were given.
+    L{evaluate()} calls them again for another source time without looking
+    for them in the text, C{expected} is what a step must give back, or
+    None, for the rest of the plan to hold.  C{accuracy} is the accuracy
+    the text was parsed with when it was compiled.
+
+    Plans cannot be changed, they compare equal when they are for the same
+    L{Calendar} and steps and can be used as dictionary keys.
+    """
+
+    __slots__ = ('calendar', 'text', 'steps', 'accuracy')
+
+    def __init__(self, calendar, text, steps, accuracy):
+        """
+        @type  calendar: L{Calendar}
+        @param calendar: calendar whose methods evaluate the steps
+        @type  text:     string
+        @param text:     normalized date/time text
+        @type  steps:    tuple
+        @param steps:    evaluation steps
+        @type  accuracy: integer
+        @param accuracy: C{pdtContext.ACU_*} flags found when compiling
+
+        @rtype:  object
+        @return: L{pdtPlan} instance
+        """
+        object.__setattr__(self, 'calendar', calendar)
+        object.__setattr__(self, 'text', text)
+        object.__setattr__(self, 'steps', steps)
+        object.__setattr__(self, 'accuracy', accuracy)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('pdtPlan is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('pdtPlan is immutable')
+
+    def __hash__(self):
+        return hash((self.text, self.steps))
+
+    def __eq__(self, other):
+        return (isinstance(other, pdtPlan) and
+                self.calendar is other.calendar and
+                self.text == other.text and self.steps == other.steps)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return 'pdtPlan(%r, steps=%r)' % (self.text, self.steps)
+
+    def evaluate(self, sourceTime=None, version=None):
+        """
+        Evaluate the text of the plan against C{sourceTime}, giving the
+        same result as L{Calendar.parse()}.
+
+        @type  sourceTime: struct_time
+        @param sourceTime: C{struct_time} value to use as the base
+        @type  version:    integer
+        @param version:    style version, default will use L{Calendar}
+                           parameter version value
+
+        @rtype:  tuple
+        @return: tuple of: modified C{sourceTime} and the result
+                 flag/context, see L{Calendar.parse()}
+        """
+        calendar = self.calendar
+        with calendar._clockScope():
+            sourceTime, ctx = self._evaluate(calendar._sourceTime(sourceTime))
+        return calendar._styled(sourceTime, ctx, version)
+
+    def _evaluate(self, sourceTime):
+        calendar = self.calendar
+        parseRegex = calendar._localeParseRegex()
+        if parseRegex is not None:
+            retTime, matched = parseRegex(self.text, sourceTime)
+            if matched:
+                return retTime, matched
+
+        if not self.steps:
+            return sourceTime, pdtContext(0, calendar.ptc.locale.useAccuracy)
+
+        try:
+            return self._replay(sourceTime)
+        except _pdtPlanMismatch:
+            # e.g. a step ran into the end of the calendar
+            return calendar._parseNormalized(
+                self.text, sourceTime, None, calendar._partialParseMethods())
+
+    def _replay(self, sourceTime):
+        calendar = self.calendar
+        with calendar.context() as ctx:
+            for name, args, expected in self.steps:
+                if name == _HAS_DATE:
+                    if not ctx.hasDate:
+                        raise _pdtPlanMismatch()
+                    continue
+                if name == '_evalWeekday' and ctx.hasDate:
+                    raise _pdtPlanMismatch()
+
+                result = getattr(calendar, name)(*(args + (sourceTime,)))
+                if name == '_evalModifier':
+                    remaining, result = result
+                    if remaining != expected:
+                        raise _pdtPlanMismatch()
+                elif result is None:
+                    raise _pdtPlanMismatch()
+                sourceTime = result
+
+            if sourceTime is None:
+                sourceTime = calendar._now()
+
+        return sourceTime, ctx
@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+"""
+parsedatetime/profiling.py
+
+Per stage call counts, timings and tracing of C{Calendar.parse()} and
+C{Calendar.nlp()}
+
+"""
+from __future__ import absolute_import, division, unicode_literals
+
+import time
+import timeit
+import logging
+import functools
+import threading
+
+from .context import pdtContext
+
+try:
+    _clock = time.perf_counter_ns
+except AttributeError:  # Python < 3.7
+    def _clock():
+        return int(timeit.default_timer() * 1e9)
+
+
+def _parseMatched(result):
+    flag = result[1]
+    if isinstance(flag, pdtContext):
+        return flag.hasDateOrTime
+    return bool(flag)
+
+
+def _partialParseMatched(result):
+    return result[2]
+
+
+def _found(result):
+    return result is not None
+
+
+# methods of a Calendar that are profiled, and how to tell from their
+# return value if they matched or None for stages that always do their
+# work.  _parse() is behind both parse() and parseMany()
+STAGES = (
+    ('_parse', _parseMatched),
+    ('nlp', _found),
+    ('_normalize', None),
+    ('parseRegex', _parseMatched),
+    ('_evalStrict', _found),
+    ('_partialParseModifier', _partialParseMatched),
+    ('_partialParseUnits', _partialParseMatched),
+    ('_partialParseQUnits', _partialParseMatched),
+    ('_partialParseDateStr', _partialParseMatched),
+    ('_partialParseDateStd', _partialParseMatched),
+    ('_partialParseDayStr', _partialParseMatched),
+    ('_partialParseWeekday', _partialParseMatched),
+    ('_partialParseTimeStr', _partialParseMatched),
+    ('_partialParseMeridian', _partialParseMatched),
+    ('_partialParseTimeStd', _partialParseMatched),
+    ('_evalModifier', None),
+    ('_evalDT', None),
+)
+
+
+def instrument(calendar, wrap):
+    """
+    Replace the L{STAGES} methods of C{calendar}, on that instance only,
+    with C{wrap(name, method, matched)}.
+    """
+    for name, matched in STAGES:
+        if name != 'parseRegex':
+            setattr(calendar, name, wrap(name, getattr(calendar, name),
+                                         matched))
+
+    # the locale function is looked up on every parse() call
+    localeParseRegex = calendar._localeParseRegex
+
+    def instrumentedLocaleParseRegex():
+        parseRegex = localeParseRegex()
+        if parseRegex is not None:
+            parseRegex = wrap('parseRegex', parseRegex, _parseMatched)
+        return parseRegex
+
+    calendar._localeParseRegex = instrumentedLocaleParseRegex
+
+
+class pdtStageStats(object):
+
+    """
+    Counters of one profiled stage.
+
+    C{nanoseconds} is inclusive, the time of a C{Calendar.parse()} call
+    made from within C{_evalModifier} counts for both stages.
+    C{maxDepth} is the deepest nesting of C{Calendar.parse()} calls the
+    stage was seen at, 1 for a call made by the outermost one and 0 for
+    calls outside of C{Calendar.parse()}.
+    """
+
+    __slots__ = ('calls', 'matched', 'missed', 'nanoseconds', 'maxDepth')
+
+    def __init__(self):
+        self.calls = 0
+        self.matched = 0
+        self.missed = 0
+        self.nanoseconds = 0
+        self.maxDepth = 0
+
+    def __repr__(self):
+        return ('pdtStageStats(calls=%d, matched=%d, missed=%d, '
+                'nanoseconds=%d, maxDepth=%d)' %
+                (self.calls, self.matched, self.missed, self.nanoseconds,
+                 self.maxDepth))
+
+
+class pdtProfiler(object):
+
+    """
+    Collects L{pdtStageStats} for the stages listed in L{STAGES}.
+
+    A profiler is attached to a C{Calendar} by passing it as the
+    C{profiler} argument.  This replaces the profiled methods of that one
+    instance with timing wrappers, a C{Calendar} created without a
+    profiler runs the plain methods and pays nothing.  A profiler can be
+    shared by several calendars and threads::
+
+        profiler = pdtProfiler()
+        cal = Calendar(profiler=profiler)
+        cal.parse('3 days after next friday')
+        print(profiler.summary())
+    """
+
+    def __init__(self):
+        """
+        @rtype:  object
+        @return: L{pdtProfiler} instance
+        """
+        self.stats = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def reset(self):
+        """
+        Forget everything collected so far.
+        """
+        with self._lock:
+            self.stats = {}
+
+    def wrap(self, name, func, matched=None):
+        """
+        Return C{func} wrapped to record its calls as stage C{name}.
+
+        @type  name:    string
+        @param name:    stage name
+        @type  func:    callable
+        @param func:    function to profile
+        @type  matched: callable
+        @param matched: called with the result of C{func} to tell a match
+                        from a miss, or None
+
+        @rtype:  callable
+        @return: wrapped C{func}
+        """
+        local = self._local
+        nested = name == '_parse'
+
+        @functools.wraps(func)
+        def profiled(*args, **kwargs):
+            depth = getattr(local, 'depth', 0)
+            if nested:
+                depth += 1
+                local.depth = depth
+            start = _clock()
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                elapsed = _clock() - start
+                if nested:
+                    local.depth = depth - 1
+            self._record(name, elapsed, depth,
+                         None if matched is None else matched(result))
+            return result
+
+        return profiled
+
+    def _record(self, name, elapsed, depth, found):
+        with self._lock:
+            stats = self.stats.get(name)
+            if stats is None:
+                stats = self.stats[name] = pdtStageStats()
+            stats.calls += 1
+            stats.nanoseconds += elapsed
+            if depth > stats.maxDepth:
+                stats.maxDepth = depth
+            if found is True:
+                stats.matched += 1
+            elif found is False:
+                stats.missed += 1
+
+    def attach(self, calendar):
+        """
+        Profile the stages of C{calendar}, see L{STAGES}.
+
+        @type  calendar: C{Calendar}
+        @param calendar: calendar to instrument
+        """
+        instrument(calendar, self.wrap)
+
+    def summary(self):
+        """
+        Format the collected stats as a table, slowest stage first.
+
+        @rtype:  string
+        @return: summary table
+        """
+        with self._lock:
+            rows = sorted(self.stats.items(),
+                          key=lambda item: item[1].nanoseconds, reverse=True)
+
+        lines = ['%-24s %8s %8s %8s %12s %10s %6s' %
+                 ('stage', 'calls', 'matched', 'missed', 'total ms',
+                  'mean us', 'depth')]
+        for name, stats in rows:
+            lines.append('%-24s %8d %8d %8d %12.3f %10.2f %6d' %
+                         (name, stats.calls, stats.matched, stats.missed,
+                          stats.nanoseconds / 1e6,
+                          stats.nanoseconds / stats.calls / 1e3,
+                          stats.maxDepth))
+        return '\n'.join(lines)
+
+
+class pdtTracer(object):
+
+    """
+    Logs every call of the L{STAGES} of a C{Calendar}, indented by the
+    nesting of the calls, with its arguments and result.
+
+    Used by C{Calendar(trace=True)}.  The messages are logged at DEBUG
+    level so the logger has to be configured to show them.
+    """
+
+    def __init__(self, logger):
+        """
+        @type  logger: logging.Logger
+        @param logger: logger the trace is written to
+
+        @rtype:  object
+        @return: L{pdtTracer} instance
+        """
+        self.log = logger
+        self._local = threading.local()
+
+    def wrap(self, name, func, matched=None):
+        """
+        Return C{func} wrapped to log its calls as stage C{name}.
+
+        @type  name:    string
+        @param name:    stage name
+        @type  func:    callable
+        @param func:    function to trace
+        @type  matched: callable
+        @param matched: called with the result of C{func} to tell a match
+                        from a miss, or None
+
+        @rtype:  callable
+        @return: wrapped C{func}
+        """
+        log = self.log
+        local = self._local
+
+        @functools.wraps(func)
+        def traced(*args, **kwargs):
+            if not log.isEnabledFor(logging.DEBUG):
+                return func(*args, **kwargs)
+
+            depth = getattr(local, 'depth', 0)
+            indent = '  ' * depth
+            # leave out the parse methods and locale function of _parse()
+            log.debug('%s> %s%r', indent, name,
+                      args[:2] if name == '_parse' else args)
+            local.depth = depth + 1
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                local.depth = depth
+            if matched is None:
+                outcome = 'done'
+            else:
+                outcome = 'matched' if matched(result) else 'missed'
+            log.debug('%s< %s %s %r', indent, name, outcome, result)
+            return result
+
+        return traced
+
+    def attach(self, calendar):
+        """
+        Trace the stages of C{calendar}, see L{STAGES}.
+
+        @type  calendar: C{Calendar}
+        @param calendar: calendar to instrument
+        """
+        instrument(calendar, self.wrap)
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+Incremental pattern search used by L{Calendar.nlp()<parsedatetime.Calendar.nlp>}
+"""
+from __future__ import absolute_import, unicode_literals
+
+import re
+
+_CRE_WORDCHAR = re.compile(r'\w')
+
+# how the assertions a pattern can make at its first position compare
+# between searching C{text[pos:]} and searching C{text} from C{pos}
+SCAN_ANY = 0       # unknown, the remaining text has to be sliced
+SCAN_FREE = 1      # no assertion looks outside of the matched text
+SCAN_WORD = 2      # starts with a \b and has no ^
+SCAN_START = 3     # ^ only ever precedes a word character, no leading \b
+
+
+def scanKind(source):
+    """
+    Guess the L{SCAN_ANY}..L{SCAN_START} kind of a pattern from its source.
+
+    Only the shape of a leading C{\\b} can be detected reliably from the
+    source alone, every other pattern is reported as L{SCAN_ANY} and
+    callers that know better pass the kind explicitly.
+
+    @type  source: string
+    @param source: regular expression source
+
+    @rtype:  integer
+    @return: scan kind
+    """
+    if source.lstrip().startswith('\\b') and '^' not in source:
+        return SCAN_WORD
+    return SCAN_ANY
+
+
+class pdtScanCursor(object):
+
+    """
+    Finds the leftmost match of a compiled pattern in C{text[pos:]} for an
+    increasing C{pos} without copying the remaining text for every search.
+
+    A match found by an earlier search stays valid until C{pos} moves past
+    its start, so each pattern only scans any part of the text once.  The
+    only position where searching from an offset can differ from searching
+    a slice is the first one (C{^}, C{\\b} and lookbehinds see the text in
+    front of C{pos}) and that position is always checked separately
+    according to the kind of the pattern.
+
+    Matches are returned as C{(match, base)} where C{base} has to be added
+    to the match positions to get an offset into the whole text.
+    """
+
+    __slots__ = ('cre', 'kind', 'text', 'found', 'foundFrom')
+
+    def __init__(self, cre, text, kind=None):
+        """
+        @type  cre:  compiled regular expression
+        @param cre:  pattern to search for
+        @type  text: string
+        @param text: text to search
+        @type  kind: integer
+        @param kind: one of the C{SCAN_*} values, guessed with L{scanKind}
+                     when not given
+        """
+        self.cre = cre
+        self.kind = scanKind(cre.pattern) if kind is None else kind
+        self.text = text
+        self.found = None
+        self.foundFrom = None
+
+    def _matchFirst(self, pos):
+        # match anchored at pos with the semantics of text[pos:]
+        text = self.text
+        kind = self.kind
+        if pos == 0 or kind == SCAN_FREE:
+            return self.cre.match(text, pos), 0
+        wordHere = _CRE_WORDCHAR.match(text, pos) is not None
+        if kind == SCAN_WORD:
+            if not wordHere:
+                return None, 0
+            if _CRE_WORDCHAR.match(text, pos - 1) is None:
+                return self.cre.match(text, pos), 0
+        elif kind == SCAN_START:
+            if not wordHere:
+                return self.cre.match(text, pos), 0
+        return self.cre.match(text[pos:]), pos
+
+    def search(self, pos):
+        """
+        Search C{text[pos:]} for the pattern.
+
+        @type  pos: integer
+        @param pos: start offset, never smaller than on the previous call
+
+        @rtype:  tuple
+        @return: C{(match, base)} or C{(None, 0)}
+        """
+        m, base = self._matchFirst(pos)
+        if m is not None:
+            return m, base
+        pos += 1
+        found = self.found
+        if self.foundFrom is None or self.foundFrom > pos or \
+                (found is not None and found.start() < pos):
+            found = self.found = self.cre.search(self.text, pos)
+            self.foundFrom = pos
+        return found, 0
@@ -32,10 +32,14 @@ setup(
     download_url=extract_metaitem('download_url'),
     description=extract_metaitem('description'),
     license=extract_metaitem('license'),
-    packages=find_packages(exclude=['tests', 'docs']),
+    packages=find_packages(exclude=['tests', 'docs', 'benchmarks']),
     platforms=['Any'],
     long_description=read('README.rst'),
     install_requires=['future'],
+    extras_require={
+        'parallel': ['futures; python_version < "3"'],
+        'numpy': ['numpy'],
+    },
     tests_require=['pytest'],
     test_suite='tests',
     classifiers=[
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+Test the asyncio facade of Calendar
+"""
+from __future__ import unicode_literals
+
+import sys
+import datetime
+import parsedatetime as pdt
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+if sys.version_info >= (3, 5):
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+    from parsedatetime.aio import AsyncCalendar
+
+    class RecordingExecutor(ThreadPoolExecutor):
+
+        def __init__(self):
+            super(RecordingExecutor, self).__init__(max_workers=2)
+            self.batches = []
+
+        def submit(self, fn, calls):
+            self.batches.append(len(calls))
+            return super(RecordingExecutor, self).submit(fn, calls)
+
+
+TEXTS = ['tomorrow at 5pm', 'no dates in here', '3 days from now',
+         'next friday', 'August 25th, 2016 around noon'] * 4
+
+
+@unittest.skipIf(sys.version_info < (3, 5), 'requires asyncio')
+class test(unittest.TestCase):
+
+    def setUp(self):
+        self.start = datetime.datetime(2016, 8, 10, 9, 30, 0).timetuple()
+        self.cal = pdt.Calendar(version=pdt.VERSION_CONTEXT_STYLE)
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def gather(self, acal, method, *args):
+        async def run():
+            async with acal:
+                return await asyncio.gather(
+                    *[getattr(acal, method)(text, self.start, *args)
+                      for text in TEXTS])
+        return self.loop.run_until_complete(run())
+
+    def expected(self, method, *args):
+        return [getattr(self.cal, method)(text, self.start, *args)
+                for text in TEXTS]
+
+    def testMethods(self):
+        executor = ThreadPoolExecutor(max_workers=2)
+        acal = AsyncCalendar(executor=executor,
+                             version=pdt.VERSION_CONTEXT_STYLE)
+        for method in ('parse', 'parseDT', 'parseTimestamp', 'nlp',
+                       'evalRanges'):
+            self.assertEqual(self.gather(acal, method),
+                             self.expected(method))
+        executor.shutdown()
+
+    def testBatching(self):
+        executor = RecordingExecutor()
+        acal = AsyncCalendar(executor=executor, batchSize=8,
+                             version=pdt.VERSION_CONTEXT_STYLE)
+        self.assertEqual(self.gather(acal, 'parse'), self.expected('parse'))
+        self.assertEqual(executor.batches, [8, 8, 4])
+        executor.shutdown()
+
+    def testInFlight(self):
+        executor = RecordingExecutor()
+        acal = AsyncCalendar(executor=executor, batchSize=8, maxInFlight=3,
+                             version=pdt.VERSION_CONTEXT_STYLE)
+        self.assertEqual(self.gather(acal, 'parse'), self.expected('parse'))
+        self.assertEqual(sum(executor.batches), len(TEXTS))
+        self.assertTrue(max(executor.batches) <= 3)
+        executor.shutdown()
+
+    def testErrors(self):
+        acal = AsyncCalendar()
+
+        async def run():
+            return await asyncio.gather(acal.parse('today'),
+                                        acal.parse('today', 'not a time'),
+                                        return_exceptions=True)
+
+        ok, error = self.loop.run_until_complete(run())
+        self.assertEqual(ok[1], 1)
+        self.assertTrue(isinstance(error, ValueError))
+
+    def testLoops(self):
+        # one loop after the other, like repeated asyncio.run() calls
+        acal = AsyncCalendar(batchSize=4, maxInFlight=2,
+                             version=pdt.VERSION_CONTEXT_STYLE)
+        self.assertEqual(self.gather(acal, 'parse'), self.expected('parse'))
+        self.loop.run_until_complete(acal.aclose())
+        self.loop.close()
+
+        self.loop = asyncio.new_event_loop()
+        self.assertEqual(self.gather(acal, 'parse'), self.expected('parse'))
+
+    def testProcessPool(self):
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            acal = AsyncCalendar(executor=executor,
+                                 version=pdt.VERSION_CONTEXT_STYLE)
+            self.assertEqual(self.gather(acal, 'nlp'), self.expected('nlp'))
+
+    def testCJKLocales(self):
+        texts = ['2016年8月25日', '2016년 8월 25일', '내일 만나요']
+        for localeID in ('ja_JP', 'ko_KR'):
+            cal = pdt.Calendar(pdt.Constants.shared(localeID, False))
+            expected = [cal.nlp(text, self.start) for text in texts]
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                for pool in (None, executor):
+                    acal = AsyncCalendar(executor=pool, localeID=localeID,
+                                         usePyICU=False)
+
+                    async def run():
+                        async with acal:
+                            return await asyncio.gather(
+                                *[acal.nlp(text, self.start)
+                                  for text in texts])
+
+                    self.assertEqual(self.loop.run_until_complete(run()),
+                                     expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+"""
+Test parsing into columns
+"""
+from __future__ import unicode_literals
+
+import sys
+import time
+import array
+import calendar
+import datetime
+import parsedatetime as pdt
+from parsedatetime import bulk
+from parsedatetime.context import pdtContext
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+
+TEXTS = ['tomorrow at 5pm', 'no dates in here', '2024-05-01T13:45:00Z',
+         'next friday', 'August 25th, 2016 around noon', '']
+
+
+class test(unittest.TestCase):
+
+    def setUp(self):
+        self.start = datetime.datetime(2016, 8, 10, 9, 30, 0).timetuple()
+        self.cal = pdt.Calendar(version=pdt.VERSION_CONTEXT_STYLE)
+        self.expected = [self.cal.parse(text, self.start) for text in TEXTS]
+
+    def testWallSeconds(self):
+        for dt in (datetime.datetime(1970, 1, 1),
+                   datetime.datetime(2000, 2, 29, 23, 59, 59),
+                   datetime.datetime(1969, 12, 31, 12),
+                   datetime.datetime(1, 1, 1),
+                   datetime.datetime(9999, 12, 31, 1, 2, 3)):
+            self.assertEqual(bulk.wallSeconds(*dt.timetuple()[:6]),
+                             calendar.timegm(dt.timetuple()))
+
+    def testDaysInMonth(self):
+        months = [2, 2, 2, 2, 1, 12]
+        years = [1900, 2000, 2023, 2024, 1, 9999]
+        self.assertEqual(list(bulk.daysInMonth(months, years)),
+                         [calendar.monthrange(year, month)[1]
+                          for month, year in zip(months, years)])
+        self.assertEqual(list(bulk.daysInMonth([2, 3], 2024)), [29, 31])
+        self.assertRaises(ValueError, bulk.daysInMonth, [13], [2000])
+
+    def testArrays(self):
+        size = len(TEXTS)
+        out = (array.array('q', [7] * size), array.array('h', [0] * size),
+               array.array('b', [0] * size))
+        self.assertTrue(bulk.parseColumns(self.cal, TEXTS, self.start,
+                                          out=out) is out)
+        times, accuracy, parsed = out
+        for index, (result, ctx) in enumerate(self.expected):
+            self.assertEqual(accuracy[index], ctx.accuracy)
+            self.assertEqual(parsed[index], ctx.hasDateOrTime)
+            if ctx.hasDateOrTime:
+                self.assertEqual(times[index], calendar.timegm(result))
+            else:
+                self.assertEqual(times[index], 0)
+
+    def testPosix(self):
+        size = len(TEXTS)
+        out = (array.array('q', [0] * size), array.array('h', [0] * size),
+               array.array('b', [0] * size))
+        times = bulk.parseColumns(self.cal, iter(TEXTS), self.start,
+                                  out=out, posix=True)[0]
+        result, ctx = self.expected[0]
+        self.assertEqual(times[0], int(time.mktime(result)))
+
+    def testLocaleParseRegex(self):
+        # ja_JP dates are matched by its parseRegex, which gives no context
+        cal = pdt.Calendar(pdt.Constants('ja_JP', usePyICU=False),
+                           version=pdt.VERSION_CONTEXT_STYLE)
+        texts = ['2020年8月3日', '3日後', 'no dates in here']
+        out = (array.array('q', [0] * 3), array.array('h', [0] * 3),
+               array.array('b', [0] * 3))
+        times, accuracy, parsed = bulk.parseColumns(cal, texts, self.start,
+                                                    out=out)
+        acuDate = (pdtContext.ACU_YEAR | pdtContext.ACU_MONTH |
+                   pdtContext.ACU_DAY)
+        self.assertEqual(list(accuracy), [acuDate, acuDate, 0])
+        self.assertEqual(list(parsed), [1, 1, 0])
+        self.assertEqual(times[0], calendar.timegm((2020, 8, 3, 0, 0, 0)))
+        self.assertEqual(times[1], calendar.timegm((2016, 8, 13, 9, 30, 0)))
+
+    def testNoAccuracy(self):
+        # ko_KR keeps no accuracy, its contexts are 0 for parsed texts too
+        cal = pdt.Calendar(pdt.Constants('ko_KR', usePyICU=False),
+                           version=pdt.VERSION_CONTEXT_STYLE, cacheSize=4)
+        texts = ['내일', 'no dates in here', '2020년 8월 3일', '내일']
+        out = (array.array('q', [0] * 4), array.array('h', [0] * 4),
+               array.array('b', [0] * 4))
+        for unique in (False, True):
+            times, accuracy, parsed = bulk.parseColumns(
+                cal, texts, self.start, out=out, unique=unique)
+            acuDate = (pdtContext.ACU_YEAR | pdtContext.ACU_MONTH |
+                       pdtContext.ACU_DAY)
+            self.assertEqual(list(accuracy), [0, 0, acuDate, 0])
+            self.assertEqual(list(parsed), [1, 0, 1, 1])
+            tomorrow = calendar.timegm(tuple(cal.parse('내일',
+                                                       self.start)[0]))
+            self.assertEqual(list(times),
+                             [tomorrow, 0,
+                              calendar.timegm((2020, 8, 3, 0, 0, 0)),
+                              tomorrow])
+        self.assertEqual(cal.parse('내일', self.start)[1], pdtContext())
+
+    def testDeduplicate(self):
+        texts = ['Tomorrow', 'tomorrow', ' tomorrow. ', 'next friday',
+                 'Tomorrow', '"next friday"', 'no dates in here']
+        unique, rows, stats = bulk.deduplicate(self.cal, texts)
+        self.assertEqual(unique, ['Tomorrow', 'next friday',
+                                  'no dates in here'])
+        self.assertEqual(rows, [0, 0, 0, 1, 0, 1, 2])
+        self.assertEqual((stats.rows, stats.unique), (7, 3))
+        self.assertAlmostEqual(stats.ratio, 7 / 3.0)
+
+        results, stats = bulk.parseDeduplicated(self.cal, iter(texts * 3),
+                                                self.start)
+        self.assertEqual(results, [self.cal.parse(text, self.start)
+                                   for text in texts * 3])
+        self.assertEqual((stats.rows, stats.unique), (21, 3))
+        # contexts are not shared between rows
+        self.assertFalse(results[0][1] is results[1][1])
+
+        self.assertEqual(bulk.parseDeduplicated(self.cal, [])[1].ratio, 1.0)
+
+    def testColumnsUnique(self):
+        texts = TEXTS * 3
+        size = len(texts)
+
+        def columns(unique):
+            out = (array.array('q', [0] * size), array.array('h', [0] * size),
+                   array.array('b', [0] * size))
+            return bulk.parseColumns(self.cal, texts, self.start, out=out,
+                                     unique=unique)
+
+        self.assertEqual(columns(True), columns(False))
+
+    @unittest.skipIf(bulk.numpy is None, 'NumPy is not installed')
+    def testNumpy(self):
+        numpy = bulk.numpy
+        times, accuracy, parsed = bulk.parseColumns(self.cal, TEXTS,
+                                                    self.start)
+        self.assertEqual(times.dtype, numpy.dtype('datetime64[s]'))
+        self.assertEqual(accuracy.dtype, numpy.dtype('int16'))
+        self.assertEqual(parsed.tolist(),
+                         [ctx.hasDateOrTime for result, ctx in self.expected])
+        self.assertEqual(times[2], numpy.datetime64('2024-05-01T13:45:00'))
+        self.assertTrue(numpy.isnat(times[1]))
+        self.assertEqual(accuracy[0], pdtContext.ACU_DAY |
+                         pdtContext.ACU_HOUR)
+
+    @unittest.skipIf(bulk.numpy is None, 'NumPy is not installed')
+    def testNumpyUnits(self):
+        numpy = bulk.numpy
+        times = numpy.empty(len(TEXTS), 'datetime64[ms]')
+        out = (times, numpy.zeros(len(TEXTS), 'int16'),
+               numpy.zeros(len(TEXTS), 'bool'))
+        bulk.parseColumns(self.cal, TEXTS, self.start, out=out)
+        self.assertEqual(times[2], numpy.datetime64('2024-05-01T13:45:00'))
+        self.assertRaises(ValueError, bulk.parseColumns, self.cal, TEXTS,
+                          self.start, out=(numpy.empty(6, 'datetime64[D]'),
+                                           out[1], out[2]))
+
+    def anchors(self):
+        # every weekday, month ends and a leap day
+        anchors = [datetime.datetime(2016, 8, day, 9, 30)
+                   for day in range(1, 8)]
+        anchors += [datetime.datetime(2016, month, day, 23, 15)
+                    for month, day in ((1, 31), (2, 29), (12, 31))]
+        return anchors
+
+    def testAnchored(self):
+        anchors = self.anchors()
+        anchors += [anchor.timetuple() for anchor in anchors]
+        for text in ANCHORED:
+            self.assertEqual(bulk.parseAnchored(self.cal, text, anchors),
+                             [self.cal.parse(text, anchor)
+                              for anchor in anchors], text)
+
+        plan = self.cal.compile('next friday')
+        self.assertEqual(
+            bulk.parseAnchored(self.cal, plan, anchors[:3],
+                               pdt.VERSION_FLAG_STYLE),
+            [self.cal.parse('next friday', anchor, pdt.VERSION_FLAG_STYLE)
+             for anchor in anchors[:3]])
+
+    def testAnchoredRange(self):
+        # anchors that run past the years a datetime can hold go through
+        # parse() on their own
+        anchors = [self.start, datetime.datetime(1, 1, 1, 12),
+                   datetime.datetime(9500, 1, 1)]
+        self.assertEqual(bulk.parseAnchored(self.cal, 'in 999 years',
+                                            anchors),
+                         [self.cal.parse('in 999 years', anchor)
+                          for anchor in anchors])
+        self.assertRaises(OverflowError, bulk.parseAnchored, self.cal,
+                          'tomorrow', [datetime.datetime(9999, 12, 31)])
+
+    @unittest.skipIf(bulk.numpy is None, 'NumPy is not installed')
+    def testAnchoredColumns(self):
+        numpy = bulk.numpy
+        anchors = self.anchors()
+        column = numpy.array(anchors + [None], 'datetime64[ms]')
+        for text in ANCHORED:
+            times, accuracy = bulk.parseAnchored(self.cal, text, column)
+            self.assertEqual(times.dtype, column.dtype)
+            self.assertTrue(numpy.isnat(times[-1]))
+            self.assertEqual(accuracy[-1], 0)
+            for index, anchor in enumerate(anchors):
+                result, ctx = self.cal.parse(text, anchor)
+                self.assertEqual(times[index], numpy.datetime64(
+                    datetime.datetime(*result[:6])), text)
+                self.assertEqual(accuracy[index], ctx.accuracy, text)
+
+    @unittest.skipIf(bulk.numpy is None, 'NumPy is not installed')
+    def testAnchoredLocaleParseRegex(self):
+        numpy = bulk.numpy
+        cal = pdt.Calendar(pdt.Constants('ja_JP', usePyICU=False),
+                           version=pdt.VERSION_CONTEXT_STYLE)
+        column = numpy.array(['2021-06-15T10:30', 'NaT'], 'datetime64[s]')
+        times, accuracy = bulk.parseAnchored(cal, '2020年8月3日', column)
+        self.assertEqual(times[0], numpy.datetime64('2020-08-03T00:00'))
+        self.assertTrue(numpy.isnat(times[1]))
+        self.assertEqual(accuracy.tolist(),
+                         [pdtContext.ACU_YEAR | pdtContext.ACU_MONTH |
+                          pdtContext.ACU_DAY, 0])
+
+    @unittest.skipIf(bulk.numpy is None, 'NumPy is not installed')
+    def testAnchoredOps(self):
+        # the phrases that are applied to all anchors at once
+        for text in ('tomorrow 9am', 'next monday', '3 days ago',
+                     'in 2 months', 'eom', 'no dates in here'):
+            steps = self.cal.compile(text).steps
+            self.assertTrue(bulk._anchorOps(self.cal, steps, pdtContext())
+                            is not None, text)
+        steps = self.cal.compile('August 25th').steps
+        self.assertEqual(bulk._anchorOps(self.cal, steps, pdtContext()),
+                         None)
+
+    def testPairs(self):
+        anchors = self.anchors()
+        texts = [ANCHORED[index % len(ANCHORED)]
+                 for index in range(len(anchors))]
+        texts += ['Tomorrow 9am', ' tomorrow 9AM. '] + texts
+        anchors += anchors[:2] + anchors
+        results = bulk.parsePairs(self.cal, texts, anchors)
+        self.assertEqual(results, [self.cal.parse(text, anchor)
+                                   for text, anchor in zip(texts, anchors)])
+        # repeated rows still get contexts of their own
+        self.assertFalse(results[0][1] is results[12][1])
+        self.assertRaises(ValueError, bulk.parsePairs, self.cal, texts,
+                          anchors[1:])
+
+    @unittest.skipIf(bulk.numpy is None, 'NumPy is not installed')
+    def testPairsColumns(self):
+        numpy = bulk.numpy
+        anchors = self.anchors()
+        texts = [ANCHORED[index % len(ANCHORED)]
+                 for index in range(len(anchors))]
+        times, accuracy = bulk.parsePairs(
+            self.cal, texts, numpy.array(anchors, 'datetime64[s]'))
+        for index, (text, anchor) in enumerate(zip(texts, anchors)):
+            result, ctx = self.cal.parse(text, anchor)
+            self.assertEqual(times[index], numpy.datetime64(
+                datetime.datetime(*result[:6])), text)
+            self.assertEqual(accuracy[index], ctx.accuracy, text)
+
+
+ANCHORED = ['tomorrow 9am', 'next monday', 'last friday at 5pm',
+            '3 days ago', '2 hours ago', '5 minutes from now', 'in 2 months',
+            'next month', 'last year', 'next week', 'this week', 'eod',
+            'eom', 'eoy', 'noon', 'sat 10am', '2016-08-25T13:45:00Z',
+            'August 25th', 'no dates in here']
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+Test the optional Calendar.parse() result cache
+"""
+from __future__ import unicode_literals
+
+import sys
+import datetime
+import parsedatetime as pdt
+from parsedatetime.context import pdtContext
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+
+class test(unittest.TestCase):
+
+    def setUp(self):
+        self.cal = pdt.Calendar(version=pdt.VERSION_CONTEXT_STYLE,
+                                cacheSize=3)
+        self.plain = pdt.Calendar(version=pdt.VERSION_CONTEXT_STYLE)
+        self.sourceTime = datetime.datetime(2016, 8, 25, 10, 30, 0).timetuple()
+
+    def testDisabledByDefault(self):
+        self.assertTrue(self.plain.cache is None)
+
+    def testSameResults(self):
+        for phrase in ('tomorrow', 'next friday at 5pm', '5 min ago',
+                       'Tomorrow.', 'nothing here'):
+            expected = self.plain.parse(phrase, self.sourceTime)
+            self.assertEqual(self.cal.parse(phrase, self.sourceTime),
+                             expected)
+            self.assertEqual(self.cal.parse(phrase, self.sourceTime),
+                             expected)
+            self.assertEqual(self.cal.parse(phrase, self.sourceTime,
+                                            version=pdt.VERSION_FLAG_STYLE),
+                             (expected[0], expected[1].dateTimeFlag))
+
+    def testCounters(self):
+        cache = self.cal.cache
+        self.cal.parse('tomorrow', self.sourceTime)
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+        # normalization maps these onto the same entry
+        self.cal.parse('tomorrow', self.sourceTime)
+        self.cal.parse(' TOMORROW ', self.sourceTime)
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+        self.assertEqual(len(cache), 1)
+
+    def testKey(self):
+        cache = self.cal.cache
+        self.cal.parse('friday', self.sourceTime)
+        self.cal.parse('friday', datetime.datetime(2016, 8, 26).timetuple())
+        self.assertEqual(cache.misses, 2)
+
+        self.cal.ptc.DOWParseStyle = -1
+        try:
+            self.assertEqual(self.cal.parse('friday', self.sourceTime)[0][:3],
+                             (2016, 8, 19))
+        finally:
+            self.cal.ptc.DOWParseStyle = 1
+        self.assertEqual(cache.misses, 3)
+        self.assertEqual(self.cal.parse('friday', self.sourceTime)[0][:3],
+                         (2016, 8, 26))
+        self.assertEqual(cache.hits, 1)
+
+    def testClock(self):
+        now = [self.sourceTime]
+        cal = pdt.Calendar(version=pdt.VERSION_CONTEXT_STYLE, cacheSize=3,
+                           clock=lambda: now[0])
+        cache = cal.cache
+        expected = cal.parse('tomorrow', self.sourceTime)
+        self.assertEqual(cal.parse('tomorrow'), expected)
+        self.assertEqual(cal.parse('tomorrow'), expected)
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+        # the key is the clock reading, a new one is a new entry
+        now[0] = datetime.datetime(2016, 8, 25, 10, 30, 1).timetuple()
+        cal.parse('tomorrow')
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+
+    def testEviction(self):
+        cache = self.cal.cache
+        for phrase in ('today', 'tomorrow', 'yesterday', 'noon'):
+            self.cal.parse(phrase, self.sourceTime)
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(cache.evictions, 1)
+
+        # 'today' was the least recently used entry
+        self.cal.parse('today', self.sourceTime)
+        self.assertEqual(cache.misses, 5)
+        self.cal.parse('noon', self.sourceTime)
+        self.assertEqual(cache.hits, 1)
+
+    def testCopies(self):
+        ctx = self.cal.parse('tomorrow', self.sourceTime)[1]
+        ctx.updateAccuracy(pdtContext.ACU_SEC)
+        self.assertEqual(self.cal.parse('tomorrow', self.sourceTime)[1],
+                         pdtContext(pdtContext.ACU_DAY))
+
+    def testClear(self):
+        cache = self.cal.cache
+        self.cal.parse('tomorrow', self.sourceTime)
+        self.cal.parse('tomorrow', self.sourceTime)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual((cache.hits, cache.misses, cache.evictions),
+                         (0, 0, 0))
+
+    def testInvalidSize(self):
+        self.assertRaises(ValueError, pdt.pdtResultCache, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
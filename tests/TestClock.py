@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+Test the clock of Calendar
+"""
+from __future__ import unicode_literals
+
+import sys
+import datetime
+import parsedatetime as pdt
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+
+class CountingClock(object):
+
+    def __init__(self, now):
+        self.now = now
+        self.reads = 0
+
+    def __call__(self):
+        self.reads += 1
+        return self.now
+
+
+class test(unittest.TestCase):
+
+    def setUp(self):
+        self.now = datetime.datetime(2016, 8, 25, 10, 30, 0)
+        self.clock = CountingClock(self.now.timetuple())
+        self.cal = pdt.Calendar(version=pdt.VERSION_CONTEXT_STYLE,
+                                clock=self.clock)
+        self.ref = pdt.Calendar(version=pdt.VERSION_CONTEXT_STYLE)
+
+    def testFrozen(self):
+        sourceTime = self.now.timetuple()
+        for phrase in ('tomorrow', 'next friday at 5pm', 'eom', '5pm',
+                       'in 3 days', 'not a date at all'):
+            self.assertEqual(self.cal.parse(phrase),
+                             self.ref.parse(phrase, sourceTime), phrase)
+        self.assertEqual(self.cal.parseDT('tomorrow'),
+                         self.ref.parseDT('tomorrow', self.now))
+        self.assertEqual(self.cal.parseTimestamp('tomorrow'),
+                         self.ref.parseTimestamp('tomorrow', self.now))
+        self.assertEqual(self.cal.nlp('lunch tomorrow at noon'),
+                         self.ref.nlp('lunch tomorrow at noon', sourceTime))
+        self.assertEqual(self.cal.evalRanges('5pm - 6pm'),
+                         self.ref.evalRanges('5pm - 6pm', sourceTime))
+        self.assertEqual(self.cal.compile('next week').evaluate(),
+                         self.ref.parse('next week', sourceTime))
+
+    def testReadOnce(self):
+        self.cal.parse('the monday after next at 5pm')
+        self.assertEqual(self.clock.reads, 1)
+
+        self.cal.nlp('call me tomorrow at 5pm, then again in 3 days, '
+                     'or next friday')
+        self.assertEqual(self.clock.reads, 2)
+
+        self.cal.evalRanges('5pm - 6pm')
+        self.assertEqual(self.clock.reads, 3)
+
+    def testNotRead(self):
+        self.cal.parse('next friday at 5pm', self.now)
+        self.cal.parseDT('tomorrow', self.now)
+        self.assertEqual(self.clock.reads, 0)
+
+    def testReadAgain(self):
+        # each call reads the clock anew, also after one that failed
+        self.cal.parse('tomorrow')
+        self.assertRaises(ValueError, self.cal.parse, 'tomorrow', 'today')
+        self.clock.now = (self.now + datetime.timedelta(days=1)).timetuple()
+        self.assertEqual(self.cal.parseDT('tomorrow')[0].date(),
+                         datetime.date(2016, 8, 27))
+        self.assertEqual(self.clock.reads, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -52,6 +52,46 @@ class test(unittest.TestCase):
         # should not throw out AttributeError
         t.start()
 
+    def testStackPerThread(self):
+        from threading import Thread
+        stacks = []
+        with self.cal.context():
+            t = Thread(target=lambda: stacks.append(
+                list(self.cal._ctxStack.stack)))
+            t.start()
+            t.join()
+            self.assertEqual(len(self.cal._ctxStack.stack), 1)
+        self.assertEqual(stacks, [[]])
+        self.assertTrue(self.cal._ctxStack.isEmpty())
+
+    def testStackAfterError(self):
+        with self.cal.context() as outer:
+            try:
+                with self.cal.context() as inner:
+                    inner.updateAccuracy(pdtContext.ACU_DAY)
+                    raise ValueError()
+            except ValueError:
+                pass
+            self.assertTrue(self.cal.currentContext is outer)
+            # a failed block does not contribute its accuracy
+            self.assertEqual(outer.accuracy, 0)
+        self.assertTrue(self.cal._ctxStack.isEmpty())
+        self.assertRaises(RuntimeError, lambda: self.cal.currentContext)
+
+    def testUpdateAccuracy(self):
+        ctx = pdtContext()
+        ctx.updateAccuracy(pdtContext.ACU_DAY, 'hour', 'min')
+        self.assertEqual(ctx.accuracy, pdtContext.ACU_DAY |
+                         pdtContext.ACU_HOUR | pdtContext.ACU_MIN)
+        self.assertRaises(KeyError, ctx.updateAccuracy, 'fortnight')
+
+        parent = pdtContext(pdtContext.ACU_YEAR)
+        parent.update(ctx)
+        self.assertEqual(parent.accuracy, ctx.accuracy | pdtContext.ACU_YEAR)
+        noAccuracy = pdtContext(useAccuracy=False)
+        noAccuracy.update(ctx)
+        self.assertEqual(noAccuracy.accuracy, 0)
+
 
 if __name__ == "__main__":
     unittest.main()
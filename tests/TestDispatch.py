@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Test that both parse() dispatch modes give the same results
+"""
+from __future__ import unicode_literals
+
+import sys
+import datetime
+import parsedatetime as pdt
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+
+PHRASES = ['tomorrow', 'next week', '5pm', 'now', 'in 3 days',
+           'next friday at 5pm', '2 hours ago', 'August 25th, 2016',
+           'Dec 31st', 'dec 31st 10:30', '08/25/2016', '2016-08-25',
+           'noon', 'eod', 'monday', 'today', '5 minutes after noon',
+           '3 days before 12/25/2016', 'meet me at 5pm on the 3rd of august',
+           'this is not a date', '']
+
+
+class test(unittest.TestCase):
+
+    def setUp(self):
+        self.start = datetime.datetime(2016, 8, 10, 9, 30, 0).timetuple()
+        self.seq = pdt.Calendar(version=pdt.VERSION_CONTEXT_STYLE,
+                                dispatch=pdt.DISPATCH_SEQUENTIAL)
+        self.comb = pdt.Calendar(version=pdt.VERSION_CONTEXT_STYLE,
+                                 dispatch=pdt.DISPATCH_COMBINED)
+
+    def testDefault(self):
+        self.assertEqual(pdt.Calendar().dispatch, pdt.DISPATCH_SEQUENTIAL)
+
+    def testSameResults(self):
+        for phrase in PHRASES:
+            self.assertEqual(self.comb.parse(phrase, self.start),
+                             self.seq.parse(phrase, self.start), phrase)
+
+    def testSameNlpResults(self):
+        text = ('Lunch next Friday at 9PM, then in 5 minutes.  '
+                'The report is due on August 25th, 2016 at noon')
+        self.assertEqual(self.comb.nlp(text, self.start),
+                         self.seq.nlp(text, self.start))
+
+    def testCombinedPattern(self):
+        ptc = self.comb.ptc
+        keys = ('CRE_MODIFIER', 'CRE_TIMEHMS2', 'CRE_UNITS')
+        cre = ptc.combinedPattern(keys)
+        self.assertTrue(cre is ptc.combinedPattern(keys))
+
+        m = cre.search('call at 5pm')
+        self.assertEqual((m.lastgroup, m.start()), ('d1', 7))
+        self.assertEqual(m.group('d1_meridian'), 'pm')
+        # 'after' and '5 minutes' match, the earlier one wins
+        m = cre.search('5 minutes after')
+        self.assertEqual((m.lastgroup, m.start()), ('d2', 0))
+        self.assertEqual(cre.search('nothing here'), None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Test that importing parsedatetime only loads the locales that are used
+"""
+from __future__ import unicode_literals
+
+import os
+import sys
+import subprocess
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LOCALES = 'parsedatetime.pdt_locales.'
+
+
+def importTimes(code):
+    """
+    Run C{code} in a fresh interpreter with C{-X importtime} and return a
+    dictionary of module name to cumulative import time in microseconds.
+    """
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        [ROOT] + [p for p in [env.get('PYTHONPATH')] if p])
+    proc = subprocess.Popen([sys.executable, '-X', 'importtime', '-c', code],
+                            cwd=ROOT, env=env, stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE)
+    out, err = proc.communicate()
+    if proc.returncode:
+        raise AssertionError(err.decode('utf-8', 'replace'))
+
+    times = {}
+    for line in err.decode('utf-8', 'replace').splitlines():
+        # import time: self [us] | cumulative | imported package
+        if line.startswith('import time:') and '|' in line:
+            parts = line[len('import time:'):].split('|')
+            try:
+                times[parts[2].strip()] = int(parts[1])
+            except ValueError:
+                pass  # the header line
+    return times
+
+
+@unittest.skipIf(sys.version_info < (3, 7), 'needs python -X importtime')
+class test(unittest.TestCase):
+
+    def loadedLocales(self, times):
+        return sorted(name[len(LOCALES):] for name in times
+                      if name.startswith(LOCALES) and name != LOCALES + 'icu')
+
+    def testImport(self):
+        times = importTimes('import parsedatetime')
+        self.assertTrue('parsedatetime' in times)
+        self.assertEqual(self.loadedLocales(times), [])
+
+    def testDefaultCalendar(self):
+        times = importTimes('import parsedatetime; '
+                            'parsedatetime.Calendar(version=2)')
+        self.assertEqual(self.loadedLocales(times), ['base', 'en_US'])
+
+    def testLookup(self):
+        times = importTimes('import parsedatetime; '
+                            'parsedatetime.Constants("ja_JP", usePyICU=False)')
+        self.assertEqual(self.loadedLocales(times), ['base', 'ja_JP'])
+
+
+class testLazyLocales(unittest.TestCase):
+
+    def testMapping(self):
+        from parsedatetime.pdt_locales import pdtLazyLocales, load_locale
+
+        locales = pdtLazyLocales(['en_US', 'de_DE'])
+        self.assertEqual(list(locales), ['en_US', 'de_DE'])
+        self.assertTrue('de_DE' in locales)
+        self.assertFalse('fr_FR' in locales)
+        self.assertTrue(locales['de_DE'] is load_locale('de_DE'))
+        self.assertRaises(KeyError, lambda: locales['fr_FR'])
+
+        custom = object()
+        locales['en_us'] = custom
+        locales['de_DE'] = custom
+        self.assertTrue(locales['de_DE'] is custom)
+        self.assertEqual(len(locales), 3)
+        del locales['de_DE']
+        self.assertTrue(locales['de_DE'] is load_locale('de_DE'))
+        del locales['de_DE']
+        self.assertEqual(list(locales), ['en_US', 'en_us'])
+
+    def testReexport(self):
+        import parsedatetime
+        from parsedatetime.pdt_locales import load_locale
+
+        self.assertTrue(parsedatetime.load_locale is load_locale)
+
+
+if __name__ == "__main__":
+    unittest.main()
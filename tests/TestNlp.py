@@ -119,6 +119,33 @@ class test(unittest.TestCase):
         target = self.cal.nlp("Buy a balloon Monday", start)
         self.assertEqual(target[0][4], "Monday")
 
+    def testLongDocument(self):
+        # matches far into a long text keep their positions
+        start = datetime.datetime(2013, 8, 1, 21, 25, 0).timetuple()
+        filler = 'Nothing to see here, move along. ' * 50
+        sentence = 'Lunch next Friday at 9PM, then in 5 minutes. '
+        text = (filler + sentence) * 20
+
+        single = self.cal.nlp(sentence, start)
+        result = self.cal.nlp(text, start)
+        self.assertEqual(len(result), len(single) * 20)
+
+        offset = len(filler)
+        for i, value in enumerate(result):
+            dt, flags, begin, end, matched = single[i % len(single)]
+            shift = offset + (i // len(single)) * len(filler + sentence)
+            self.assertEqual(value, (dt, flags, begin + shift, end + shift,
+                                     matched))
+            self.assertEqual(text[value[2]:value[3]], value[4])
+
+    def testAdjacent(self):
+        # matches separated by a single character only
+        start = datetime.datetime(2013, 8, 1, 21, 25, 0).timetuple()
+        target = self.cal.nlp("tomorrow 5pm, 10:30 then 3 days", start)
+        self.assertEqual([t[2:] for t in target],
+                         [(0, 12, 'tomorrow 5pm'), (14, 19, '10:30'),
+                          (25, 31, '3 days')])
+
     def testFalsePositives(self):
         # negative testing - no matches should return None
         start = datetime.datetime(2013, 8, 1, 21, 25, 0).timetuple()
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+Test nlpStream() against nlp() over the whole text
+"""
+from __future__ import unicode_literals
+
+import io
+import sys
+import random
+import datetime
+import parsedatetime as pdt
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+
+PHRASES = (
+    'The meeting is on Friday at 3pm, bring the notes.',
+    'We moved it to 2024-05-01 13:45 last week.',
+    'Call me next week or in 5 days, whichever works.',
+    'Nothing happens here at all.',
+    'Lunch tomorrow at noon?',
+    'It was due 3 days after next friday',
+)
+
+# no 'at', 'in' or 'on' followed by a digit, see nlpStream()
+WORDS = ('last year', 'monday 9am', 'tomorrow', 'at 5pm', 'next week',
+         'on friday', 'in 4 days', 'noon', '2 hours ago', 'august 25th',
+         'the 3rd', '10:30', 'eod', 'this month', 'today at 4pm',
+         '3 days ago', 'and', 'then', 'meet', 'the', 'we', 'a', 'call', 'or',
+         'so', 'x')
+SEPARATORS = (' ', ' ', ' ', '  ', ', ', '. ', '\n')
+
+
+class test(unittest.TestCase):
+
+    def setUp(self):
+        self.cal = pdt.Calendar()
+        self.start = datetime.datetime(2020, 1, 2, 3, 4, 5).timetuple()
+        self.text = '\n'.join(PHRASES[i % len(PHRASES)] + ' ' * (i % 3)
+                              for i in range(60))
+        self.expected = self.cal.nlp(self.text, self.start)
+
+    def stream(self, source, **kwargs):
+        return tuple(self.cal.nlpStream(source, self.start, **kwargs))
+
+    def testFile(self):
+        for chunkSize, window in ((65536, 256), (200, 64), (61, 60)):
+            self.assertEqual(self.stream(io.StringIO(self.text),
+                                         chunkSize=chunkSize, window=window),
+                             self.expected)
+
+    def testChunks(self):
+        # pieces that split words and matches
+        pieces = [self.text[i:i + 7] for i in range(0, len(self.text), 7)]
+        self.assertEqual(self.stream(iter(pieces), chunkSize=150, window=50),
+                         self.expected)
+
+    def testString(self):
+        self.assertEqual(self.stream(self.text, chunkSize=100, window=40),
+                         self.expected)
+
+    def testOffsets(self):
+        for dt, flags, start, end, text in self.stream(
+                self.text, chunkSize=100, window=40):
+            self.assertEqual(self.text[start:end], text)
+
+    def testRandom(self):
+        # text dense with dates, grouped by nlp() across the buffers
+        rnd = random.Random(1)
+        for _ in range(20):
+            words = [rnd.choice(WORDS) + rnd.choice(SEPARATORS)
+                     for _ in range(rnd.randint(50, 300))]
+            text = ''.join(words)
+            window = rnd.randint(30, 200)
+            chunkSize = window + rnd.randint(1, 300)
+            self.assertEqual(
+                self.stream(text, chunkSize=chunkSize, window=window),
+                self.cal.nlp(text, self.start),
+                (chunkSize, window, text))
+
+    def testGroupedBefore(self):
+        # nlp() groups the match carried over with text before it
+        text = ('on friday. in 3 days. call, at 5pm. and and. next week, '
+                'then. and, in 3 days, and. and so. so. so. call and call. '
+                'in 3 days, ')
+        self.assertEqual(self.stream(text, chunkSize=105, window=57),
+                         self.cal.nlp(text, self.start))
+
+    def testEmpty(self):
+        self.assertEqual(self.stream(io.StringIO('')), ())
+        self.assertEqual(self.stream(['no dates ', 'in here']), ())
+
+    def testWindow(self):
+        self.assertRaises(ValueError, self.stream, self.text,
+                          chunkSize=100, window=100)
+        self.assertRaises(ValueError, self.stream, self.text, window=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
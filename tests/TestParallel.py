@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+Test running Calendar.nlp() in worker processes
+"""
+from __future__ import unicode_literals
+
+import sys
+import datetime
+import parsedatetime as pdt
+from parsedatetime import parallel
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+
+TEXTS = ['I will see you tomorrow at 5pm',
+         'no dates in here',
+         'the meeting moved from 10:30 to 3 days from now',
+         'next friday',
+         'call me on August 25th, 2016 around noon'] * 7
+
+
+@unittest.skipIf(parallel.ProcessPoolExecutor is None,
+                 'concurrent.futures is not available')
+class test(unittest.TestCase):
+
+    def setUp(self):
+        self.start = datetime.datetime(2016, 8, 10, 9, 30, 0).timetuple()
+        self.cal = pdt.Calendar(version=pdt.VERSION_CONTEXT_STYLE)
+        self.expected = [(index, self.cal.nlp(text, self.start))
+                         for index, text in enumerate(TEXTS)]
+
+    def testOrdered(self):
+        results = parallel.nlpMany(TEXTS, sourceTime=self.start,
+                                   maxWorkers=2, chunkSize=3,
+                                   version=pdt.VERSION_CONTEXT_STYLE)
+        self.assertEqual(list(results), self.expected)
+
+    def testAsCompleted(self):
+        results = parallel.nlpMany(iter(TEXTS), sourceTime=self.start,
+                                   ordered=False, maxWorkers=2, chunkSize=4,
+                                   version=pdt.VERSION_CONTEXT_STYLE)
+        self.assertEqual(sorted(results, key=lambda r: r[0]), self.expected)
+
+    def testIds(self):
+        texts = [('doc%d' % index, text) for index, text in enumerate(TEXTS)]
+        results = parallel.nlpMany(texts, sourceTime=self.start,
+                                   maxWorkers=2,
+                                   version=pdt.VERSION_CONTEXT_STYLE)
+        self.assertEqual(list(results),
+                         [('doc%d' % index, result)
+                          for index, result in self.expected])
+
+    def testLocale(self):
+        cal = pdt.Calendar(pdt.Constants('de_DE'))
+        text = 'wir sehen uns morgen um 17:00'
+        results = parallel.nlpMany([text], localeID='de_DE',
+                                   sourceTime=self.start, maxWorkers=1)
+        self.assertEqual(list(results), [(0, cal.nlp(text, self.start))])
+
+    def testCJKLocale(self):
+        cal = pdt.Calendar(pdt.Constants('ko_KR', usePyICU=False))
+        texts = ['내일 만나요', '2016년 8월 25일 회의']
+        results = parallel.nlpMany(texts, localeID='ko_KR', usePyICU=False,
+                                   sourceTime=self.start, maxWorkers=1)
+        self.assertEqual(list(results),
+                         [(index, cal.nlp(text, self.start))
+                          for index, text in enumerate(texts)])
+
+    def testWorkerError(self):
+        # raised by the worker's Calendar instead of a broken pool
+        self.assertRaises(ValueError, list,
+                          parallel.nlpMany(TEXTS, maxWorkers=1, cacheSize=-1))
+
+    def testChunkSize(self):
+        self.assertRaises(ValueError, list,
+                          parallel.nlpMany(TEXTS, chunkSize=0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+Test Calendar.parseMany()
+"""
+from __future__ import unicode_literals
+
+import sys
+import time
+import types
+import datetime
+import parsedatetime as pdt
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+
+class test(unittest.TestCase):
+
+    def setUp(self):
+        self.cal = pdt.Calendar(version=pdt.VERSION_CONTEXT_STYLE)
+        self.sourceTime = datetime.datetime(2016, 8, 25, 10, 30, 0).timetuple()
+        self.phrases = ['tomorrow', 'next week', '5pm', 'in 3 days',
+                        'next friday at 5pm', '"noon"', 'August 25th.',
+                        '08/25/2016', 'eom', 'not a date at all', '']
+
+    def testMatchesParse(self):
+        results = list(self.cal.parseMany(self.phrases, self.sourceTime))
+        self.assertEqual(len(results), len(self.phrases))
+        for phrase, result in zip(self.phrases, results):
+            self.assertEqual(result,
+                             self.cal.parse(phrase, self.sourceTime), phrase)
+
+    def testVersion(self):
+        for phrase, (_, flag) in zip(
+                self.phrases,
+                self.cal.parseMany(self.phrases, self.sourceTime,
+                                   version=pdt.VERSION_FLAG_STYLE)):
+            self.assertEqual(flag,
+                             self.cal.parse(phrase, self.sourceTime)[1]
+                             .dateTimeFlag)
+
+    def testLazy(self):
+        results = self.cal.parseMany(iter(self.phrases), self.sourceTime)
+        self.assertTrue(isinstance(results, types.GeneratorType))
+        self.assertEqual(next(results),
+                         self.cal.parse(self.phrases[0], self.sourceTime))
+
+    def testSharedSourceTime(self):
+        before = time.localtime()
+        results = list(self.cal.parseMany(['today', 'today']))
+        after = time.localtime()
+        self.assertEqual(results[0], results[1])
+        self.assertTrue(before[:3] <= results[0][0][:3] <= after[:3])
+
+    def testInvalidSourceTime(self):
+        self.assertRaises(ValueError, list,
+                          self.cal.parseMany(['today'], 'yesterday'))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+Test that Calendar.parseDT() and Calendar.parseTimestamp() give the same
+date/time as Calendar.parse()
+"""
+from __future__ import unicode_literals
+
+import sys
+import time
+import datetime
+import parsedatetime as pdt
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+
+PHRASES = ['tomorrow', 'next week', '5pm', 'in 3 days', '2 hours ago',
+           'next friday at 5pm', 'August 25th, 2016', '2016-08-25T13:45:00',
+           'eom', 'one day before thursday', '5 minutes after noon',
+           'not a date at all', '']
+
+
+class test(unittest.TestCase):
+
+    def setUp(self):
+        self.cal = pdt.Calendar(version=pdt.VERSION_CONTEXT_STYLE)
+        self.sourceTime = datetime.datetime(2016, 8, 25, 10, 30, 0)
+
+    def testParseDT(self):
+        for phrase in PHRASES:
+            result, ctx = self.cal.parse(phrase, self.sourceTime)
+            self.assertEqual(self.cal.parseDT(phrase, self.sourceTime),
+                             (datetime.datetime(*result[:6]), ctx), phrase)
+
+    def testParseTimestamp(self):
+        for phrase in PHRASES:
+            result, ctx = self.cal.parse(phrase, self.sourceTime)
+            self.assertEqual(
+                self.cal.parseTimestamp(phrase, self.sourceTime),
+                (time.mktime(result[:8] + (-1,)), ctx), phrase)
+
+    def testSourceTime(self):
+        timetuple = self.sourceTime.timetuple()
+        self.assertEqual(self.cal.parseTimestamp('tomorrow', timetuple),
+                         self.cal.parseTimestamp('tomorrow', self.sourceTime))
+        self.assertRaises(ValueError, self.cal.parseTimestamp, 'tomorrow',
+                          'yesterday')
+
+    def testVersion(self):
+        timestamp, flag = self.cal.parseTimestamp(
+            'tomorrow at 5pm', self.sourceTime, pdt.VERSION_FLAG_STYLE)
+        self.assertEqual(flag, 3)
+        self.assertEqual(datetime.datetime.fromtimestamp(timestamp),
+                         datetime.datetime(2016, 8, 26, 17, 0, 0))
+
+    def testNestedContext(self):
+        # nested evaluations update the context they run in
+        with self.cal.context() as ctx:
+            self.cal.parseTimestamp('next friday at 5pm', self.sourceTime)
+        self.assertTrue(ctx.hasDate and ctx.hasTime)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+Test that evaluating the plans made by Calendar.compile() gives the same
+results as Calendar.parse()
+"""
+from __future__ import unicode_literals
+
+import sys
+import datetime
+import parsedatetime as pdt
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+
+PHRASES = ['tomorrow', 'next week', '5pm', 'now', 'in 3 days', '3 days ago',
+           'next friday at 5pm', '2 hours ago', 'August 25th, 2016',
+           'Dec 31st', 'dec 31st 10:30', '08/25/2016', '2016-08-25',
+           '2016-08-25T13:45:00Z', 'Thu, 25 Aug 2016 13:45:00 GMT',
+           'noon', 'eod', 'eom', 'eoy', 'eod friday', 'monday', 'today',
+           'this week', 'last month', 'next year', 'next 4 hours',
+           '5 minutes after noon', '3 days before 12/25/2016',
+           'one day before thursday', 'the monday after next',
+           'wednesday morning', 'sat 10am', '10:30:15', '4:30-5pm',
+           '"tomorrow"', 'meet me at 5pm on the 3rd of august',
+           'this is not a date', '']
+
+SOURCE_TIMES = [datetime.datetime(2016, 8, 10, 9, 30, 0).timetuple(),
+                datetime.datetime(2015, 12, 31, 23, 15, 0).timetuple(),
+                datetime.datetime(2016, 2, 29, 12, 0, 0).timetuple(),
+                datetime.datetime(2019, 1, 6, 0, 0, 0).timetuple()]
+
+
+class test(unittest.TestCase):
+
+    def setUp(self):
+        self.cal = pdt.Calendar(version=pdt.VERSION_CONTEXT_STYLE)
+
+    def assertSameResults(self, cal, phrases, version=None):
+        for phrase in phrases:
+            plan = cal.compile(phrase)
+            for sourceTime in SOURCE_TIMES:
+                self.assertEqual(plan.evaluate(sourceTime, version),
+                                 cal.parse(phrase, sourceTime, version),
+                                 phrase)
+
+    def testSameResults(self):
+        self.assertSameResults(self.cal, PHRASES)
+        self.assertSameResults(self.cal, PHRASES, pdt.VERSION_FLAG_STYLE)
+
+    def testLocaleParseRegex(self):
+        cal = pdt.Calendar(pdt.Constants('ko_KR', usePyICU=False),
+                           version=pdt.VERSION_CONTEXT_STYLE)
+        self.assertSameResults(cal, ['3일 후', '2019년 1월 4일', '월요일',
+                                     '23:00', 'tomorrow'])
+
+    def testSteps(self):
+        plan = self.cal.compile('Next Friday. at 5pm')
+        self.assertEqual(plan.text, 'Next Friday at 5pm')
+        self.assertEqual([step[0] for step in plan.steps],
+                         ['_evalModifier', '_evalMeridian'])
+        self.assertEqual(plan.accuracy,
+                         pdt.pdtContext.ACU_DAY | pdt.pdtContext.ACU_HOUR)
+        self.assertEqual(self.cal.compile('hello world').steps, ())
+
+    def testHashable(self):
+        plans = {self.cal.compile('tomorrow'): 1}
+        self.assertEqual(plans[self.cal.compile('tomorrow')], 1)
+        self.assertTrue(self.cal.compile('tomorrow') !=
+                        pdt.Calendar().compile('tomorrow'))
+        self.assertRaises(AttributeError, setattr, self.cal.compile('now'),
+                          'steps', ())
+
+    def testMismatch(self):
+        # a step giving another result than when the plan was compiled
+        # makes the text go through parse() again
+        plan = self.cal.compile('next friday at 5pm')
+        (name, args, remaining), meridian = plan.steps
+        wrong = pdt.pdtPlan(self.cal, plan.text,
+                            ((name, args, ' at 6pm'), meridian),
+                            plan.accuracy)
+        self.assertEqual(wrong.evaluate(SOURCE_TIMES[0]),
+                         self.cal.parse(plan.text, SOURCE_TIMES[0]))
+
+    def testNested(self):
+        # evaluated inside another context the plan updates it as well
+        plan = self.cal.compile('5pm')
+        with self.cal.context() as ctx:
+            plan.evaluate(SOURCE_TIMES[0])
+        self.assertTrue(ctx.hasTime)
+
+
+if __name__ == "__main__":
+    unittest.main()
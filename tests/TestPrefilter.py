@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+Test ruling out texts without date/time words before running the patterns
+"""
+from __future__ import unicode_literals
+
+import sys
+import datetime
+import parsedatetime as pdt
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+
+PHRASES = ('hello world', 'the quick brown fox', 'the end', 'tomorrow',
+           'Next Friday at 5pm', 'in 3 days', 'a week ago', 'noon', 'now',
+           'someone said', 'mondays are hard', 'may I?', "it's 5", '')
+
+
+class test(unittest.TestCase):
+
+    def setUp(self):
+        self.ptc = pdt.Constants(usePyICU=False)
+        self.start = datetime.datetime(2016, 8, 10, 9, 30, 0).timetuple()
+
+    def compare(self, ptc, phrases):
+        cal = pdt.Calendar(ptc, version=pdt.VERSION_CONTEXT_STYLE)
+        plain = pdt.Calendar(ptc, version=pdt.VERSION_CONTEXT_STYLE,
+                             prefilter=False)
+        for phrase in phrases:
+            self.assertEqual(cal.parse(phrase, self.start),
+                             plain.parse(phrase, self.start))
+            self.assertEqual(cal.nlp(phrase, self.start),
+                             plain.nlp(phrase, self.start))
+
+    def testCouldMatch(self):
+        for text in ('hello world', 'the quick brown fox', 'someone said',
+                     'mondays', ''):
+            self.assertFalse(self.ptc.couldMatch(text), text)
+        for text in ('tomorrow', 'NEXT week', 'see you (friday)', '5',
+                     'a week', 'now', 'Dec', '٥'):
+            self.assertTrue(self.ptc.couldMatch(text), text)
+
+    def testFold(self):
+        # the case insensitive patterns take the long s for an s
+        self.assertTrue(self.ptc.CRE_WEEKDAY.search('ſun'))
+        self.assertTrue(self.ptc.couldMatch('ſun'))
+
+    def testSameResults(self):
+        self.compare(self.ptc, PHRASES)
+
+    def testWithoutWordBoundaries(self):
+        # patterns without \b match inside of words
+        ptc = pdt.Constants(usePyICU=False)
+        for key in pdt._PREFILTER_KEYS:
+            ptc.cre_source[key] = ptc.cre_source[key].replace('\\b', '')
+        self.assertTrue(ptc.couldMatch('mondays'))
+        self.compare(ptc, PHRASES)
+
+    def testOtherLocales(self):
+        for localeID in ('de_DE', 'ru_RU', 'ko_KR'):
+            ptc = pdt.Constants(localeID, usePyICU=False)
+            self.assertFalse(ptc.couldMatch('xyz'))
+            self.compare(ptc, PHRASES)
+
+
+if __name__ == "__main__":
+    unittest.main()
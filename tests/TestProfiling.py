@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+Test the per stage profiling of Calendar.parse()
+"""
+from __future__ import unicode_literals
+
+import sys
+import datetime
+import threading
+import parsedatetime as pdt
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+
+class test(unittest.TestCase):
+
+    def setUp(self):
+        self.start = datetime.datetime(2016, 8, 10, 9, 30, 0).timetuple()
+        self.profiler = pdt.pdtProfiler()
+        self.cal = pdt.Calendar(version=pdt.VERSION_CONTEXT_STYLE,
+                                profiler=self.profiler)
+
+    def testReexport(self):
+        self.assertTrue(pdt.pdtProfiler is pdt.profiling.pdtProfiler)
+
+    def testDisabled(self):
+        cal = pdt.Calendar(version=pdt.VERSION_CONTEXT_STYLE)
+        self.assertEqual(cal.profiler, None)
+        for name, _ in pdt.profiling.STAGES:
+            self.assertNotIn(name, cal.__dict__)
+
+    def testSameResults(self):
+        cal = pdt.Calendar(version=pdt.VERSION_CONTEXT_STYLE)
+        for phrase in ('tomorrow', '3 days after next friday', '5pm',
+                       '2016-08-25T10:00:00Z', 'this is not a date'):
+            self.assertEqual(self.cal.parse(phrase, self.start),
+                             cal.parse(phrase, self.start))
+
+    def testStats(self):
+        self.cal.parse('tomorrow', self.start)
+        # not a date, but has a word the patterns look for
+        self.cal.parse('the end', self.start)
+        stats = self.profiler.stats
+
+        self.assertEqual(stats['_parse'].calls, 2)
+        self.assertEqual(stats['_parse'].matched, 1)
+        self.assertEqual(stats['_parse'].missed, 1)
+        self.assertEqual(stats['_normalize'].calls, 2)
+        self.assertEqual(stats['_partialParseDayStr'].matched, 1)
+        self.assertEqual(stats['_partialParseModifier'].missed, 2)
+        self.assertNotIn('_evalModifier', stats)
+        for name in stats:
+            self.assertTrue(stats[name].nanoseconds > 0)
+            self.assertEqual(stats[name].maxDepth, 1)
+
+    def testNested(self):
+        # _evalModifier() parses the text around the modifier
+        self.cal.parse('3 days after next friday', self.start)
+        stats = self.profiler.stats
+
+        self.assertEqual(stats['_evalModifier'].calls, 2)
+        self.assertEqual(stats['_evalModifier'].maxDepth, 2)
+        self.assertEqual(stats['_parse'].calls, 3)
+        self.assertEqual(stats['_parse'].matched, 3)
+        self.assertEqual(stats['_parse'].maxDepth, 2)
+
+    def testParseMany(self):
+        list(self.cal.parseMany(['tomorrow', '5pm'], self.start))
+        self.assertEqual(self.profiler.stats['_parse'].calls, 2)
+
+    def testNlp(self):
+        self.cal.nlp('see you tomorrow at 5pm', self.start)
+        stats = self.profiler.stats
+        self.assertEqual(stats['nlp'].calls, 1)
+        self.assertEqual(stats['nlp'].matched, 1)
+        self.assertEqual(stats['nlp'].maxDepth, 0)
+
+    def testParseRegex(self):
+        cal = pdt.Calendar(pdt.Constants('ja_JP'), profiler=self.profiler)
+        cal.parse('3日後', self.start)
+        self.assertEqual(self.profiler.stats['parseRegex'].matched, 1)
+        self.assertNotIn('_partialParseModifier', self.profiler.stats)
+
+    def testThreads(self):
+        def run():
+            for _ in range(20):
+                self.cal.parse('3 days after next friday', self.start)
+
+        threads = [threading.Thread(target=run) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = self.profiler.stats
+        self.assertEqual(stats['_evalModifier'].calls, 160)
+        self.assertEqual(stats['_parse'].maxDepth, 2)
+
+    def testSummary(self):
+        self.cal.parse('tomorrow', self.start)
+        summary = self.profiler.summary().splitlines()
+        self.assertTrue(summary[0].startswith('stage'))
+        self.assertTrue(summary[1].startswith('_parse'))
+
+        self.profiler.reset()
+        self.assertEqual(self.profiler.stats, {})
+        self.assertEqual(len(self.profiler.summary().splitlines()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+Test how Constants are built and the process wide registry
+"""
+from __future__ import unicode_literals
+
+import sys
+import datetime
+import threading
+import parsedatetime as pdt
+from parsedatetime.pdt_locales import base, locales
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+
+class test(unittest.TestCase):
+
+    def testSameInstance(self):
+        ptc = pdt.Constants.shared('de_DE', usePyICU=False)
+        self.assertTrue(ptc is pdt.Constants.shared('de_DE', usePyICU=False))
+        self.assertTrue(ptc is pdt.Constants.shared(
+            'de_DE', usePyICU=False, fallbackLocales=('en_US',)))
+        self.assertFalse(ptc is pdt.Constants.shared('en_US',
+                                                     usePyICU=False))
+        self.assertEqual(ptc.localeID, 'de_DE')
+
+    def testFrozen(self):
+        ptc = pdt.Constants.shared(usePyICU=False)
+        self.assertRaises(AttributeError, setattr, ptc, 'DOWParseStyle', 0)
+        self.assertEqual(ptc.DOWParseStyle, 1)
+        for name in ptc.cre_keys:
+            self.assertTrue(name in ptc.__dict__, name)
+
+    def testThreads(self):
+        results = []
+
+        def worker():
+            results.append(pdt.Constants.shared('nl_NL', usePyICU=False))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(results), 8)
+        for ptc in results:
+            self.assertTrue(ptc is results[0])
+
+    def testEveryLocale(self):
+        for localeID in locales:
+            ptc = pdt.Constants.shared(localeID, usePyICU=False)
+            self.assertEqual(ptc.localeID, localeID)
+            pdt.Constants(localeID, usePyICU=False).compile()
+
+    def testCalendars(self):
+        start = datetime.datetime(2016, 8, 10, 9, 30, 0).timetuple()
+        ptc = pdt.Constants.shared(usePyICU=False)
+        cals = [pdt.Calendar(ptc, version=pdt.VERSION_CONTEXT_STYLE)
+                for _ in range(2)]
+        own = pdt.Calendar(pdt.Constants(usePyICU=False),
+                           version=pdt.VERSION_CONTEXT_STYLE)
+
+        for phrase in ('next friday at 5pm', 'tomorrow', 'August 25th'):
+            expected = own.parse(phrase, start)
+            for cal in cals:
+                self.assertEqual(cal.parse(phrase, start), expected)
+
+    def testLocaleAttributes(self):
+        # locale data is copied onto the instance instead of being looked
+        # up through __getattr__
+        ptc = pdt.Constants('de_DE', usePyICU=False)
+        for name in ptc.locale.locale_keys:
+            self.assertTrue(name in ptc.__dict__, name)
+        self.assertTrue(ptc.units is ptc.locale.units)
+        self.assertEqual(ptc.localeID, 'de_DE')
+
+    def testPrecompile(self):
+        ptc = pdt.Constants(usePyICU=False)
+        self.assertFalse('CRE_UNITS' in ptc.__dict__)
+
+        for localeID in locales:
+            ptc = pdt.Constants(localeID, usePyICU=False, precompile=True)
+            for name in ptc.cre_keys:
+                self.assertTrue(name in ptc.__dict__, (localeID, name))
+
+    def testDaysInMonth(self):
+        # frozen instances work out leap years without keeping any state
+        ptc = pdt.Constants.shared(usePyICU=False)
+        state = dict(ptc.__dict__)
+        self.assertEqual([ptc.daysInMonth(2, year)
+                          for year in (1900, 2000, 2023, 2024, 2400, 2500)],
+                         [28, 29, 28, 29, 29, 28])
+        self.assertEqual(ptc.daysInMonth(12, 3000), 31)
+        self.assertEqual(ptc.daysInMonth(13, 2000), None)
+        self.assertEqual(ptc.__dict__, state)
+
+    def testLocaleDataUnchanged(self):
+        # building one locale must not leak into the shared locale modules
+        keys = set(base.re_values)
+        pdt.Constants('de_DE', usePyICU=False)
+        self.assertEqual(set(base.re_values), keys)
+        self.assertEqual(base.WeekdayOffsets, {})
+        self.assertEqual(base.MonthOffsets, {})
+
+        ptc = pdt.Constants('en_US', usePyICU=False)
+        self.assertFalse('montag' in ptc.WeekdayOffsets)
+        self.assertEqual(ptc.MonthOffsets['august'], 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+Test parsing of ISO 8601 / RFC 3339 and RFC 822 dates
+"""
+from __future__ import unicode_literals
+
+import sys
+import datetime
+import parsedatetime as pdt
+from parsedatetime.context import pdtContext
+from . import utils
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+
+ACU_DATE = pdtContext.ACU_YEAR | pdtContext.ACU_MONTH | pdtContext.ACU_DAY
+ACU_HM = ACU_DATE | pdtContext.ACU_HOUR | pdtContext.ACU_MIN
+ACU_HMS = ACU_HM | pdtContext.ACU_SEC
+
+
+class test(unittest.TestCase):
+
+    @utils.assertEqualWithComparator
+    def assertExpectedResult(self, result, check, **kwargs):
+        return utils.compareResultByTimeTuplesAndFlags(result, check, **kwargs)
+
+    def setUp(self):
+        self.cal = pdt.Calendar(version=pdt.VERSION_CONTEXT_STYLE)
+        self.start = datetime.datetime(2020, 1, 2, 3, 4, 5).timetuple()
+        self.target = datetime.datetime(2024, 5, 1, 13, 45, 0).timetuple()
+
+    def check(self, s, target, accuracy):
+        self.assertExpectedResult(self.cal.parse(s, self.start),
+                                  (target, pdtContext(accuracy)))
+
+    def testISO8601(self):
+        for s in ('2024-05-01T13:45:00Z', '2024-05-01t13:45:00z',
+                  '2024-05-01T13:45:00.123Z', '2024-05-01T13:45:00+02:00',
+                  '2024-05-01 13:45:00-0500', '2024-05-01 13:45:00',
+                  '20240501T134500Z', '20240501T134500'):
+            self.check(s, self.target, ACU_HMS)
+
+        for s in ('2024-05-01T13:45', '2024-05-01 13:45',
+                  '2024-05-01 13:45Z', '2024-05-01 13:45 UTC',
+                  '20240501T1345'):
+            self.check(s, self.target, ACU_HM)
+
+    def testISO8601Date(self):
+        # a date alone keeps the time of day of the source time
+        target = datetime.datetime(2024, 5, 1, 3, 4, 5).timetuple()
+        self.check('2024-05-01', target, ACU_DATE)
+        self.check(' 2024-05-01 ', target, ACU_DATE)
+
+    def testRFC822(self):
+        for s in ('Wed, 01 May 2024 13:45:00 GMT',
+                  'Wed, 1 May 2024 13:45:00 +0000',
+                  '01 May 2024 13:45:00 EST'):
+            self.check(s, self.target, ACU_HMS)
+
+        self.check('1 May 2024 13:45', self.target, ACU_HM)
+        self.check('Wed, 01 May 2024',
+                   datetime.datetime(2024, 5, 1, 3, 4, 5).timetuple(),
+                   ACU_DATE)
+
+    def testOtherLocales(self):
+        # ja_JP and ko_KR run their parseRegex first
+        for localeID in ('de_DE', 'nl_NL', 'fr_FR', 'ru_RU', 'pt_BR', 'es'):
+            cal = pdt.Calendar(pdt.Constants(localeID, usePyICU=False),
+                               version=pdt.VERSION_CONTEXT_STYLE)
+            self.assertEqual(cal.parse('2024-05-01T13:45:00Z',
+                                       self.start)[0][:6],
+                             self.target[:6], localeID)
+
+    def testRFC822Locales(self):
+        # RFC 822 month names are English, other locales read the text as
+        # they did before, "2006" as 20:06, the same as nlp() does
+        cal = pdt.Calendar(pdt.Constants('en_AU', usePyICU=False),
+                           version=pdt.VERSION_CONTEXT_STYLE)
+        self.assertExpectedResult(
+            cal.parse('25 Aug 2006', self.start),
+            (datetime.datetime(2006, 8, 25, 3, 4, 5).timetuple(),
+             pdtContext(ACU_DATE)))
+
+        target = datetime.datetime(2020, 1, 2, 20, 6, 0)
+        for localeID in ('fr_FR', 'ru_RU', 'pt_BR', 'es', 'ja_JP', 'ko_KR'):
+            cal = pdt.Calendar(pdt.Constants(localeID, usePyICU=False),
+                               version=pdt.VERSION_CONTEXT_STYLE)
+            result, ctx = cal.parse('25 Aug 2006', self.start)
+            self.assertEqual(result[:6], target.timetuple()[:6], localeID)
+            self.assertFalse(ctx.hasDate, localeID)
+            self.assertEqual(cal.nlp('25 Aug 2006', self.start)[0][0],
+                             target, localeID)
+
+        for localeID in ('de_DE', 'nl_NL'):
+            cal = pdt.Calendar(pdt.Constants(localeID, usePyICU=False),
+                               version=pdt.VERSION_CONTEXT_STYLE)
+            result, ctx = cal.parse('Wed, 01 May 2024 13:45:00', self.start)
+            self.assertEqual(result[:3], self.start[:3], localeID)
+
+    def testInvalid(self):
+        # invalid values are left to the natural language patterns
+        with self.cal.context():
+            for s in ('2024-13-01', '2024-02-30', '2023-02-29',
+                      '2024-05-01 24:00', '2024-05-01 13:60'):
+                self.assertEqual(self.cal._evalStrict(s, self.start), None)
+            self.assertEqual(
+                self.cal._evalStrict('2024-02-29', self.start)[:3],
+                (2024, 2, 29))
+
+    def testNotStrict(self):
+        with self.cal.context():
+            for s in ('tomorrow', '2024-05-01 01:45 pm', '20240501',
+                      '2024-05-01t13:45:00 tomorrow', 'may 1 2024'):
+                self.assertEqual(self.cal._evalStrict(s, self.start), None)
+
+
+if __name__ == "__main__":
+    unittest.main()
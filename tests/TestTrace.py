@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+Test per Calendar tracing of parse()
+"""
+from __future__ import unicode_literals
+
+import sys
+import logging
+import datetime
+import parsedatetime as pdt
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+
+PHRASES = ['tomorrow', 'next friday at 5pm', '3 days after next friday',
+           'monday', 'this is not a date']
+
+
+class ListHandler(logging.Handler):
+
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class test(unittest.TestCase):
+
+    def setUp(self):
+        self.start = datetime.datetime(2016, 8, 10, 9, 30, 0).timetuple()
+        self.handler = ListHandler()
+        pdt.log.addHandler(self.handler)
+        pdt.log.setLevel(logging.DEBUG)
+
+    def tearDown(self):
+        pdt.log.removeHandler(self.handler)
+        pdt.log.setLevel(logging.NOTSET)
+
+    def testDisabled(self):
+        cal = pdt.Calendar(version=pdt.VERSION_CONTEXT_STYLE)
+        self.assertFalse(cal.trace)
+        self.assertRaises(AttributeError, setattr, cal, 'trace', True)
+        calls = []
+
+        def profile(frame, event, arg):
+            if event == 'call' and \
+                    frame.f_code.co_filename == logging.__file__:
+                calls.append(frame.f_code.co_name)
+
+        sys.setprofile(profile)
+        try:
+            for phrase in PHRASES:
+                cal.parse(phrase, self.start)
+        finally:
+            sys.setprofile(None)
+
+        self.assertEqual(calls, [])
+        self.assertEqual(self.handler.messages, [])
+
+    def testEnabled(self):
+        cal = pdt.Calendar(version=pdt.VERSION_CONTEXT_STYLE, trace=True)
+        plain = pdt.Calendar(version=pdt.VERSION_CONTEXT_STYLE)
+        for phrase in PHRASES:
+            self.assertEqual(cal.parse(phrase, self.start),
+                             plain.parse(phrase, self.start))
+
+        self.assertTrue(cal.trace)
+        messages = self.handler.messages
+        self.assertTrue(messages[0].startswith("> _parse('tomorrow'"))
+        self.assertTrue(any(m.startswith('  < _partialParseDayStr matched')
+                            for m in messages))
+        # the parse() calls made by _evalModifier() are nested
+        self.assertTrue(any(m.startswith("      > _parse('next friday'")
+                            for m in messages))
+
+    def testFiltered(self):
+        pdt.log.setLevel(logging.INFO)
+        cal = pdt.Calendar(version=pdt.VERSION_CONTEXT_STYLE, trace=True)
+        cal.parse('3 days after next friday', self.start)
+        self.assertEqual(self.handler.messages, [])
+
+    def testNlp(self):
+        cal = pdt.Calendar(version=pdt.VERSION_CONTEXT_STYLE, trace=True)
+        cal.nlp('see you tomorrow', self.start)
+        self.assertTrue(self.handler.messages[0].startswith('> nlp('))
+        self.assertTrue(self.handler.messages[-1].startswith('< nlp matched'))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -187,6 +187,17 @@ class test(unittest.TestCase):
         self.assertExpectedResult(
             self.cal.parse('1y', start), (target, 1))
 
+    def testUnitAliases(self):
+        ptc = self.cal.ptc
+        for unit, aliases in ptc.units.items():
+            for alias in aliases:
+                self.assertEqual(ptc.unitAliases[alias], unit)
+        self.assertEqual(ptc.unitAccuracy['min'],
+                         pdt.pdtContext.ACU_MIN)
+        self.assertEqual(ptc.unitAccuracy['wk'],
+                         pdt.pdtContext.ACU_WEEK)
+        self.assertNotIn('fortnight', ptc.unitAliases)
+
 
 if __name__ == "__main__":
     unittest.main()